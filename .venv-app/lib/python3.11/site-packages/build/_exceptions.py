@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:
+    import subprocess
+
+
+class BuildException(Exception):
+    """
+    Exception raised by ``build`` when a build cannot proceed.
+    """
+
+
+class BuildBackendException(Exception):
+    """
+    Exception raised when a backend operation fails.
+    """
+
+    def __init__(
+        self,
+        exception: Exception,
+        description: str | None = None,
+    ) -> None:
+        super().__init__()
+        self.exception: Exception = exception
+        self._description = description
+
+    def __str__(self) -> str:
+        if self._description:
+            return self._description
+        return f'Backend operation failed: {self.exception!r}'
+
+
+class BuildSystemTableValidationError(BuildException):
+    """
+    Exception raised when the ``[build-system]`` table in pyproject.toml is invalid.
+    """
+
+    def __str__(self) -> str:
+        return f'Failed to validate `build-system` in pyproject.toml: {self.args[0]}'
+
+
+class FailedProcessError(Exception):
+    """
+    Exception raised when a setup or preparation operation fails.
+    """
+
+    def __init__(self, exception: subprocess.CalledProcessError, description: str) -> None:
+        super().__init__()
+        self.exception: subprocess.CalledProcessError = exception
+        self._description = description
+
+    def __str__(self) -> str:
+        return self._description
+
+
+class TypoWarning(Warning):
+    """
+    Warning raised when a possible typo is found.
+    """
@@ -0,0 +1,4 @@
+from importlib.metadata import version
+
+
+__version__ = version('bx_py_utils')
@@ -0,0 +1,3 @@
+"""
+    Doc-Write, see: https://github.com/boxine/bx_py_utils/blob/master/bx_py_utils/doc_write/README.md
+"""
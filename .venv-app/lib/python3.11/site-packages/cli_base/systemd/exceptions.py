@@ -0,0 +1,6 @@
+class SystemdNotAvailable(AssertionError):
+    pass
+
+
+class SystemdServiceError(RuntimeError):
+    pass
@@ -0,0 +1,2 @@
+class UserSettingsNotFound(FileNotFoundError):
+    pass
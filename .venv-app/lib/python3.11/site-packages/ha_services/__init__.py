@@ -0,0 +1,7 @@
+"""
+    ha_services
+    Helpers to send periodic information via MQTT to Home Assistant
+"""
+
+__version__ = '0.4.0'
+__author__ = 'Jens Diemer <github@jensdiemer.de>'
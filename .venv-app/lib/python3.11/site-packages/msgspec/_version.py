@@ -0,0 +1,21 @@
+
+# This file was generated by 'versioneer.py' (0.19) from
+# revision-control system data, or from the parent directory name of an
+# unpacked source archive. Distribution tarballs contain a pre-generated copy
+# of this file.
+
+import json
+
+version_json = '''
+{
+ "date": "2024-01-21T21:57:36-0600",
+ "dirty": false,
+ "error": null,
+ "full-revisionid": "510d40160c5199fb562bc6f880e12f31cd697c6a",
+ "version": "0.18.6"
+}
+'''  # END VERSION_JSON
+
+
+def get_versions():
+    return json.loads(version_json)
@@ -0,0 +1,5 @@
+__version__ = "1.6.1"
+
+
+class MQTTException(Exception):
+    pass
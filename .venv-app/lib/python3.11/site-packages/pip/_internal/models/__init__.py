@@ -0,0 +1 @@
+"""A package that contains models that represent entities."""
@@ -0,0 +1 @@
+"""For modules related to installing packages."""
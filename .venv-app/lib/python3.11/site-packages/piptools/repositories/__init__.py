@@ -0,0 +1,6 @@
+from __future__ import annotations
+
+from .local import LocalRequirementsRepository
+from .pypi import PyPIRepository
+
+__all__ = ["LocalRequirementsRepository", "PyPIRepository"]
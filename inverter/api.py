@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import logging
 from collections.abc import Iterable
 from datetime import datetime
@@ -16,74 +17,71 @@ from inverter.data_types import (
     InverterValue,
     ModbusReadResult,
     ModbusResponse,
+    Parameter,
     ValueType,
 )
-from inverter.definitions import get_parameter
+from inverter.definitions import get_derived_specs, get_parameter
+from inverter.derived_values import DerivedValues
 from inverter.exceptions import ValidationError
+from inverter.read_plan import ReadBlock, make_read_plan
 from inverter.validators import InverterValueValidator
+from inverter.write_plan import WritePlan
 
 
 logger = logging.getLogger(__name__)
 
 
-def compute_values(values: dict) -> Iterable[InverterValue]:
-    total_power = None
-    for no in range(1, 10):
-        section = f'PV{no}'
+@dataclasses.dataclass
+class InverterDefinitions:
+    """
+    All compiled information from the definition and validation yaml files.
+    """
 
-        voltage_name = f'{section} Voltage'
-        current_name = f'{section} Current'
-        if voltage_name in values and current_name in values:
-            name = f'{section} Power'
-            voltage: InverterValue = values[voltage_name]
-            current: InverterValue = values[current_name]
-            try:
-                power = voltage.value * current.value
-            except TypeError as err:
-                print(f'[red]Error calculate: {voltage.value=!r} * {current.value=!r}: {err}')
-            else:
-                if total_power is None:
-                    total_power = power
-                else:
-                    total_power += power
-                logging.debug(
-                    'Compute %r from %s %r and %s %r = %s',
-                    name,
-                    voltage_name,
-                    voltage.value,
-                    current_name,
-                    current.value,
-                    total_power,
-                )
-                power = round(power, 2)
-                yield InverterValue(
-                    type=ValueType.COMPUTED,
-                    name=name,
-                    value=power,
-                    device_class='power',
-                    state_class='measurement',
-                    unit='W',
-                    result=None,
-                )
-
-    if total_power is not None:
-        yield InverterValue(
-            type=ValueType.COMPUTED,
-            name='Total Power',
-            value=round(total_power, 2),
-            device_class='power',
-            state_class='measurement',
-            unit='W',
-            result=None,
-        )
+    parameters: list[Parameter]
+    derived_values: DerivedValues
+    value_validator: InverterValueValidator
+    read_plan: list[ReadBlock] = None  # Will be computed from the parameters, if not given
+
+    def __post_init__(self):
+        if self.read_plan is None:
+            self.read_plan = make_read_plan(self.parameters)
+
+    @property
+    def names(self) -> list[str]:
+        return [parameter.name for parameter in self.parameters] + self.derived_values.names
+
+
+def load_definitions(config: Config) -> InverterDefinitions:
+    parameters = get_parameter(config=config)
+    return InverterDefinitions(
+        parameters=parameters,
+        derived_values=DerivedValues(
+            specs=get_derived_specs(config=config),
+            available_names=[parameter.name for parameter in parameters],
+        ),
+        value_validator=InverterValueValidator(config=config),
+    )
 
 
 class Inverter:
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        inv_sock: InverterSock | None = None,
+        definitions: InverterDefinitions | None = None,
+    ):
         self.config = config
-        self.parameters = get_parameter(config=config)
-        self.value_validator = InverterValueValidator(config=config)
-        self.inv_sock = InverterSock(config)
+        if definitions is None:
+            definitions = load_definitions(config)
+        self.parameters = definitions.parameters
+        self.read_plan = definitions.read_plan
+        self.parameter2block = {}  # id(parameter) -> read block
+        for block in self.read_plan:
+            for parameter in block.parameters:
+                self.parameter2block[id(parameter)] = block
+        self.derived_values = definitions.derived_values
+        self.value_validator = definitions.value_validator
+        self.inv_sock = inv_sock or InverterSock(config)
 
     def __enter__(self):
         self.inv_sock.__enter__()
@@ -93,20 +91,23 @@ class Inverter:
         self.inv_sock.connect()
 
     def __iter__(self) -> Iterable[InverterValue]:
+        """
+        Yield the values in the order of the definition. The registers are read with the (batched) read plan:
+        A block is read, if the first of its parameters is needed.
+        """
+        results = {}  # id(parameter) -> result of the read blocks
+
         values = {}
         for parameter in self.parameters:
             name = parameter.name
 
-            result: ModbusReadResult = self.inv_sock.read_paremeter(parameter=parameter)
-            value = InverterValue(
-                type=ValueType.READ_OUT,
-                name=name,
-                value=result.parsed_value,
-                device_class=parameter.device_class,
-                state_class=parameter.state_class,
-                unit=parameter.unit,
-                result=result,
-            )
+            if id(parameter) not in results:
+                block = self.parameter2block[id(parameter)]
+                block_results = self.inv_sock.read_block(block=block)
+                for block_parameter, block_result in zip(block.parameters, block_results):
+                    results[id(block_parameter)] = block_result
+            result: ModbusReadResult = results.pop(id(parameter))
+            value = InverterValue(type=ValueType.READ_OUT, value=result.parsed_value, spec=parameter, result=result)
             if self.config.verbosity > 1:
                 pprint(value, indent_guides=False)
 
@@ -120,8 +121,7 @@ class Inverter:
             values[name] = value
             yield value
 
-        if values := compute_values(values):
-            yield from values
+        yield from self.derived_values(values)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.inv_sock.__exit__(exc_type, exc_val, exc_tb)
@@ -129,9 +129,27 @@ class Inverter:
             return False
 
 
-def set_current_time(inv_sock: InverterSock, address=0x16, verbose=True):
+def get_time_write_plan(now: datetime, address=0x16) -> WritePlan:
     """
-    Set current date time in the inverter device.
+    >>> plan = get_time_write_plan(datetime(2024, 12, 31, 23, 59, 58))
+    >>> plan.registers
+    {22: 6156, 23: 7959, 24: 15162}
+    >>> plan.frames
+    [WriteFrame(start_register=22, values=[6156, 7959, 15162])]
+    """
+    return WritePlan(
+        registers={
+            address: 256 * (now.year % 100) + now.month,
+            address + 1: 256 * now.day + now.hour,
+            address + 2: 256 * now.minute + now.second,
+        },
+        skip_verify=frozenset({address + 2}),  # The inverter clock is running: Seconds may differ on read back
+    )
+
+
+def set_current_time(inv_sock: InverterSock, address=0x16, verbose=True, dry_run=False) -> WritePlan:
+    """
+    Set current date time in the inverter device and verify it by reading back.
 
     Default start address is 0x16, so that this will be filled:
         0x16 - year + month
@@ -142,25 +160,31 @@ def set_current_time(inv_sock: InverterSock, address=0x16, verbose=True):
     if verbose:
         print(f'Send current time: {now}')
 
-    values = [
-        256 * (now.year % 100) + now.month,
-        256 * now.day + now.hour,
-        256 * now.minute + now.second,
-    ]
-    data = inv_sock.write(address=address, values=values)
+    plan = get_time_write_plan(now, address=address)
+    plan.apply(inv_sock, dry_run=dry_run)
 
-    if verbose:
-        print(f'Response: {data!r}')
+    if verbose and not dry_run:
+        print('[green]Time written and verified.')
+    return plan
+
+
+INVERTER_VERSION_INFOS = (
+    InverterRegisterVersionInfo(name='Control Board Firmware', register=0x000D),
+    InverterRegisterVersionInfo(name='Communication Board Firmware', register=0x000E),
+    InverterRegisterVersionInfo(name='Communication Protocol', register=0x0012),
+)
 
 
 def fetch_inverter_versions(
-    *, inv_sock: InverterSock, infos: list[InverterRegisterVersionInfo]
+    *, inv_sock: InverterSock, infos: Iterable[InverterRegisterVersionInfo], verbose=True
 ) -> list[InverterRegisterVersionResult]:
     results = []
     for info in infos:
-        print(f'Fetch "{info.name}"', end='...')
+        if verbose:
+            print(f'Fetch "{info.name}"', end='...')
         response: ModbusResponse = inv_sock.read(start_register=info.register, length=1)
-        print(f'Result (in hex): [cyan]{response.data_hex}')
+        if verbose:
+            print(f'Result (in hex): [cyan]{response.data_hex}')
         version = Version('.'.join(number for number in response.data_hex))
         results.append(InverterRegisterVersionResult(info=info, data_hex=response.data_hex, version=version))
     return results
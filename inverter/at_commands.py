@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from rich import print  # noqa
+
+from inverter.connection import InverterSock
+from inverter.data_types import Config, InverterInfo
+from inverter.exceptions import ReadInverterError
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_AT_COMMANDS = (
+    'KEY',  # Set/Get Device Password
+    'VER',
+    'BVER',  # bootloader version
+    'HWVER',  # hardware version
+    'WEBVER',  # web version
+    'YZVER',  # Firmware version
+    'PING',
+    'YZWAKEYCTL',
+    'YZLOG',
+    'YZAPP',
+    # 'YZAPSTAT', # (doesn't work!)
+    'YZEXPFUN',
+    'MID',
+    # 'CFGRD',  # current system config (doesn't work!)
+    # 'SMEM',  # system memory stat (doesn't work!)
+    'TIME',
+    'ADDRESS',  # Set/Get Device Address
+    'KEY',
+    'NDBGS',  # Set/Get Debug Status
+    'WIFI',  # Set/Get WIFI status: Power up: "WIFI=UP" Power down: "WIFI=DOWN"
+    'WMODE',  # Set/Get the WIFI Operation Mode (AP or STA)
+    'WEBU',  # Set/Get the Login Parameters of WEB page
+    'WAP',  # Set/Get the AP parameters
+    'WSSSID',  # Set/Get the AP's SSID of WIFI STA Mode
+    'WSKEY',  # Set/Get the Security Parameters of WIFI STA Mode
+    'WAKEY',  # Set/Get the Security Parameters of WIFI AP Mode
+    'TXPWR',  # Set/Get wifi rf tx power'
+    'WANN',  # Set/Get The WAN setting if in STA mode.
+    'LANN',  # Set/Get The LAN setting if in ADHOC mode.
+    'UPURL',  # Set/Get the path of remote upgrade
+    'WAPMXSTA',  # Set/Get the Max Number Of Sta Connected to Ap
+    'WSCAN',  # Get The AP site Survey (only for STA Mode).
+    'NTPTM',  # NTP date time? e.g.: "1970-1-1  0:3:9  Thur"
+    'NTPSER',  # set/query NTP server, e.g.: "NTPSER=192.168.1.1"
+    'NTPRF',  # NTP request interval in min (?)
+    'NTPEN',  # Enable/Disable NTP Server
+    'WSDNS',  # Set/Get the DNS Server address
+    'DEVICENUM',  # Set/Get Device Link Num
+    'DEVSELCTL',  # Set/Get Web Device List Info
+)
+
+# Answers of these commands will only change with a firmware update, so they can be cached:
+STATIC_AT_COMMANDS = frozenset(('VER', 'BVER', 'HWVER', 'WEBVER', 'YZVER', 'MID'))
+
+AT_COMMAND_CACHE_FILE_NAME = 'at_command_cache.json'
+AT_COMMAND_CACHE_TTL = 24 * 60 * 60  # in seconds
+
+
+@dataclasses.dataclass
+class AtCommandResult:
+    command: str
+    result: str
+    cached: bool = False
+
+
+@dataclasses.dataclass
+class LoggerAtCommandResults:
+    host: str
+    inverter_info: InverterInfo | None
+    results: list[AtCommandResult]
+    error: str | None = None
+
+    def as_dict(self) -> dict:
+        return dict(
+            host=self.host,
+            serial=self.inverter_info.serial if self.inverter_info else None,
+            mac=self.inverter_info.mac if self.inverter_info else None,
+            results={result.command: result.result for result in self.results},
+            error=self.error,
+        )
+
+
+class AtCommandCache:
+    """
+    Store the answers of static AT commands per serial number on disk.
+    """
+
+    def __init__(self, *, cache_path: Path, ttl: int = AT_COMMAND_CACHE_TTL):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.changed = False
+        try:
+            self.data = json.loads(cache_path.read_text(encoding='UTF-8'))
+        except FileNotFoundError:
+            self.data = {}
+        except (OSError, ValueError) as err:
+            logger.warning('Ignore AT command cache %s: %s', cache_path, err)
+            self.data = {}
+
+    def get(self, *, serial: int, command: str) -> str | None:
+        with self.lock:
+            entry = self.data.get(str(serial), {}).get(command)
+        if entry and time.time() - entry['timestamp'] < self.ttl:
+            return entry['result']
+        return None
+
+    def set(self, *, serial: int, command: str, result: str) -> None:
+        with self.lock:
+            self.data.setdefault(str(serial), {})[command] = dict(result=result, timestamp=time.time())
+            self.changed = True
+
+    def save(self) -> None:
+        with self.lock:
+            if not self.changed:
+                return
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix('.tmp')
+            temp_path.write_text(json.dumps(self.data, indent=4), encoding='UTF-8')
+            temp_path.replace(self.cache_path)
+            self.changed = False
+        logger.info('AT command cache saved to %s', self.cache_path)
+
+
+def run_at_commands(
+    *, inv_sock: InverterSock, commands: tuple[str, ...], cache: AtCommandCache | None = None
+) -> list[AtCommandResult]:
+    serial = inv_sock.inverter_info.serial
+    results = []
+    for command in commands:
+        if cache is not None and command in STATIC_AT_COMMANDS:
+            if (result := cache.get(serial=serial, command=command)) is not None:
+                results.append(AtCommandResult(command=command, result=result, cached=True))
+                continue
+
+        result: str = inv_sock.cleaned_at_command(command)
+        results.append(AtCommandResult(command=command, result=result))
+
+        if cache is not None and command in STATIC_AT_COMMANDS:
+            cache.set(serial=serial, command=command, result=result)
+    return results
+
+
+def fetch_at_commands(
+    *, config: Config, commands: tuple[str, ...], cache: AtCommandCache | None = None
+) -> LoggerAtCommandResults:
+    inv_sock = InverterSock(config)
+    try:
+        with inv_sock:
+            inv_sock.connect()
+            results = run_at_commands(inv_sock=inv_sock, commands=commands, cache=cache)
+    except ReadInverterError as err:
+        return LoggerAtCommandResults(
+            host=config.host, inverter_info=inv_sock.inverter_info, results=[], error=str(err)
+        )
+
+    return LoggerAtCommandResults(host=config.host, inverter_info=inv_sock.inverter_info, results=results)
+
+
+def bulk_at_commands(
+    *,
+    configs: list[Config],
+    commands: tuple[str, ...],
+    cache: AtCommandCache | None = None,
+    max_workers: int = 8,
+) -> list[LoggerAtCommandResults]:
+    """
+    Send the AT commands to many logger sticks in parallel. Every stick gets the commands one by one.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='AtCommands') as executor:
+        futures = [
+            executor.submit(fetch_at_commands, config=config, commands=commands, cache=cache) for config in configs
+        ]
+        results = [future.result() for future in futures]
+
+    if cache is not None:
+        cache.save()
+
+    return results
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import dataclasses
+import gc
+import logging
+import time
+import tracemalloc
+
+from ha_services.mqtt4homeassistant.data_classes import MqttSettings
+from rich import print  # noqa
+
+from inverter import trace
+from inverter.api import Inverter, load_definitions
+from inverter.connection import make_modbus_result, modbus_crc, parse_modbus_response, parse_response
+from inverter.data_types import Config, InverterValue, ModbusReadResult, ModbusResponse, Parameter
+from inverter.read_plan import ReadBlock
+
+
+logger = logging.getLogger(__name__)
+
+
+BENCHMARK_INVERTER_NAME = 'deye_sg04lp3'
+
+
+BENCHMARK_REGISTER_VALUE = 1100  # e.g.: temperatures (offset 1000, scale 0.1) are valid
+
+
+class FakeInverterSock:
+    """
+    Answers every read with a fixed register value, without any network communication.
+    """
+
+    def __init__(self, register_value: int = BENCHMARK_REGISTER_VALUE):
+        self.register_value = register_value
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type:
+            return False
+
+    def read_paremeter(self, *, parameter: Parameter) -> ModbusReadResult:
+        data = self.register_value.to_bytes(2, 'big') * parameter.length
+        response = ModbusResponse(slave_id=1, modbus_function=3, data=data)
+        return make_modbus_result(response=response, parameter=parameter)
+
+    def read_block(self, *, block: ReadBlock) -> list[ModbusReadResult]:
+        return [self.read_paremeter(parameter=parameter) for parameter in block.parameters]
+
+
+def get_benchmark_config(inverter_name: str) -> Config:
+    return Config(
+        compact=False,
+        verbosity=0,
+        host='127.0.0.1',
+        port=48899,
+        mqtt_settings=MqttSettings(),
+        inverter_name=inverter_name,
+    )
+
+
+@dataclasses.dataclass
+class MemoryBenchmarkResult:
+    inverter_name: str
+    cycles: int
+    values: int  # Number of values in one cycle
+    cycle_bytes: int  # Average allocated bytes that are kept by the values of one cycle
+    peak_bytes: int  # Max. allocated bytes while one cycle is running
+
+    @property
+    def bytes_per_value(self) -> float:
+        return self.cycle_bytes / self.values if self.values else 0
+
+
+def run_cycle(inverter: Inverter) -> list[InverterValue]:
+    return list(inverter)
+
+
+def benchmark_memory(*, inverter_name: str = BENCHMARK_INVERTER_NAME, cycles: int = 10) -> MemoryBenchmarkResult:
+    """
+    Measure with tracemalloc the memory of the values of one read cycle.
+    The definitions are loaded before, so only the per-cycle allocations are measured.
+    """
+    config = get_benchmark_config(inverter_name)
+    inverter = Inverter(config=config, inv_sock=FakeInverterSock(), definitions=load_definitions(config))
+    run_cycle(inverter)  # Warm up all caches
+
+    cycle_bytes = []
+    peak_bytes = 0
+    values = []
+    tracemalloc.start()
+    try:
+        for _ in range(cycles):
+            gc.collect()
+            tracemalloc.clear_traces()
+            start_bytes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+
+            values = run_cycle(inverter)
+
+            current_bytes, peak = tracemalloc.get_traced_memory()
+            cycle_bytes.append(current_bytes - start_bytes)
+            peak_bytes = max(peak_bytes, peak - start_bytes)
+            del values[:]  # Free the values, before the next cycle starts
+    finally:
+        tracemalloc.stop()
+
+    result = MemoryBenchmarkResult(
+        inverter_name=inverter_name,
+        cycles=cycles,
+        values=len(run_cycle(inverter)),
+        cycle_bytes=round(sum(cycle_bytes) / len(cycle_bytes)),
+        peak_bytes=peak_bytes,
+    )
+    logger.info('Memory benchmark: %s', result)
+    return result
+
+
+def make_raw_response(*, length: int, register_value: int = BENCHMARK_REGISTER_VALUE) -> bytes:
+    """
+    Build the answer of the logger stick to a read request of `length` registers.
+
+    >>> make_raw_response(length=1)
+    b'+ok=010302044CBB71\\r\\n\\r\\n'
+    """
+    frame = bytes([1, 3, length * 2]) + register_value.to_bytes(2, 'big') * length
+    frame += modbus_crc(frame).to_bytes(2, 'little')
+    return b'+ok=' + frame.hex().upper().encode() + b'\r\n\r\n'
+
+
+def get_benchmark_parameters(inverter_name: str = BENCHMARK_INVERTER_NAME) -> list[Parameter]:
+    return load_definitions(get_benchmark_config(inverter_name)).parameters
+
+
+@dataclasses.dataclass
+class ParseBenchmarkResult:
+    inverter_name: str
+    trace: bool
+    values: int  # Number of parsed values
+    duration: float  # Seconds
+
+    @property
+    def values_per_second(self) -> float:
+        return self.values / self.duration if self.duration else 0
+
+
+def benchmark_parse(
+    *, inverter_name: str = BENCHMARK_INVERTER_NAME, rounds: int = 1000, enable_trace: bool = False
+) -> ParseBenchmarkResult:
+    """
+    Measure the throughput of the parse path: Raw logger answer -> Modbus response -> parsed value
+    """
+    responses = [
+        (parameter, make_raw_response(length=parameter.length))
+        for parameter in get_benchmark_parameters(inverter_name)
+    ]
+
+    old_trace = trace.enabled
+    trace.set_trace(enable=enable_trace)
+    try:
+        start_time = time.perf_counter()
+        for _ in range(rounds):
+            for parameter, raw_response in responses:
+                response = parse_modbus_response(parse_response(raw_response).data)
+                make_modbus_result(response=response, parameter=parameter)
+        duration = time.perf_counter() - start_time
+    finally:
+        trace.set_trace(enable=old_trace)
+
+    result = ParseBenchmarkResult(
+        inverter_name=inverter_name,
+        trace=enable_trace,
+        values=len(responses) * rounds,
+        duration=duration,
+    )
+    logger.info('Parse benchmark: %s', result)
+    return result
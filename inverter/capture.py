@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import struct
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+
+logger = logging.getLogger(__name__)
+
+
+CAPTURE_MAGIC = b'INVCAP1\n'
+RECORD_HEADER = struct.Struct('<dHI')  # timestamp, command length, data length
+
+
+@dataclasses.dataclass
+class CaptureRecord:
+    timestamp: float
+    command: bytes
+    data: bytes
+
+
+class CaptureWriter:
+    """
+    Append every raw reply of the logger stick with timestamp and the sent command to a binary log file.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = path.open('ab')
+        if self.file.tell() == 0:
+            self.file.write(CAPTURE_MAGIC)
+
+    def __enter__(self) -> CaptureWriter:
+        return self
+
+    def write(self, *, command: bytes, data: bytes, timestamp: float | None = None) -> None:
+        if timestamp is None:
+            timestamp = time.time()
+        with self.lock:
+            self.file.write(RECORD_HEADER.pack(timestamp, len(command), len(data)) + command + data)
+            self.file.flush()
+
+    def close(self) -> None:
+        with self.lock:
+            self.file.close()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_type:
+            return False
+
+
+def read_capture(path: Path) -> Iterable[CaptureRecord]:
+    """
+    Read all records from a capture file. A truncated last record (e.g.: after a power loss) will be ignored.
+    """
+    with path.open('rb') as f:
+        if f.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f'{path} is not a capture file')
+
+        while header := f.read(RECORD_HEADER.size):
+            if len(header) < RECORD_HEADER.size:
+                logger.warning('Ignore truncated record header at the end of %s', path)
+                return
+            timestamp, command_length, data_length = RECORD_HEADER.unpack(header)
+            payload = f.read(command_length + data_length)
+            if len(payload) < command_length + data_length:
+                logger.warning('Ignore truncated record at the end of %s', path)
+                return
+            yield CaptureRecord(timestamp=timestamp, command=payload[:command_length], data=payload[command_length:])
@@ -3,15 +3,18 @@
 """
 import atexit
 import datetime
+import json
 import locale
 import logging
+import sqlite3
 import sys
 import time
 from pathlib import Path
 
+import rich
 import rich_click
 import rich_click as click
-from cli_base.cli_tools.verbosity import OPTION_KWARGS_VERBOSE, setup_logging
+from cli_base.cli_tools.verbosity import OPTION_KWARGS_VERBOSE
 from cli_base.systemd.api import ServiceControl
 from cli_base.toml_settings.api import TomlSettings
 from cli_base.toml_settings.exceptions import UserSettingsNotFound
@@ -24,20 +27,63 @@ from rich_click import RichGroup
 
 import inverter
 from inverter import constants
-from inverter.api import Inverter, fetch_inverter_versions, set_current_time
+from inverter.api import INVERTER_VERSION_INFOS, Inverter, fetch_inverter_versions, set_current_time
+from inverter.at_commands import (
+    AT_COMMAND_CACHE_FILE_NAME,
+    AT_COMMAND_CACHE_TTL,
+    DEFAULT_AT_COMMANDS,
+    STATIC_AT_COMMANDS,
+    AtCommandCache,
+    bulk_at_commands,
+)
+from inverter.capture import CaptureWriter
 from inverter.connection import InverterSock
 from inverter.constants import SETTINGS_DIR_NAME, SETTINGS_FILE_NAME
-from inverter.data_types import InverterRegisterVersionInfo
+from inverter.daily_reset import parse_time_window
+from inverter.data_types import Config
+from inverter.definition_compiler import LINT_ERROR, compile_definition, write_compiled_definition
 from inverter.definitions import get_definition_names
-from inverter.exceptions import ReadInverterError
-from inverter.publish_loop import publish_forever
+from inverter.discovery import (
+    BROADCAST_ADDRESS,
+    DISCOVERY_CACHE_FILE_NAME,
+    DISCOVERY_TIMEOUT,
+    DiscoveryCache,
+    discover_loggers,
+)
+from inverter.exceptions import ReadInverterError, ValidationError
+from inverter.fleet import expand_hosts, fleet_inventory
+from inverter.metrics import MetricsSnapshot, start_metrics_server
+from inverter.multi_site import SITE_CYCLE_TIME, SITE_DEADLINE, SITE_MAX_WORKERS, publish_sites_forever
+from inverter.publish_loop import InverterMqttPublisher, publish_forever
+from inverter.recorder import (
+    RECORD_FLUSH_INTERVAL,
+    RECORD_FORMAT_AUTO,
+    RECORD_FORMATS,
+    RECORD_INTERVAL,
+    ValueRecorder,
+    record_forever,
+)
+from inverter.register_scan import MAX_SCAN_SPAN, RegisterScanner, diff_snapshots, read_snapshot
+from inverter.register_stats import REGISTER_STATS_FILE_NAME, RegisterStatistics
+from inverter.replay import replay_capture
+from inverter.storage import RAW_RETENTION_DAYS, SQLiteStorage, SQLiteWriter
+from inverter.trace import setup_logging
 from inverter.user_settings import SystemdServiceInfo, UserSettings, make_config, migrate_old_settings
 from inverter.utilities.cli import (
     convert_address_option,
+    is_stdout,
+    print_daily_energy,
+    print_discovered_loggers,
+    print_fleet_inventory,
     print_inverter_values,
     print_inverter_versions,
     print_register,
+    print_register_scan_diff,
+    print_register_stats,
+    print_write_plan,
 )
+from inverter.value_output import OUTPUT_FORMAT_TABLE, OUTPUT_FORMATS, get_value_writer
+from inverter.write_plan import WritePlan
 
 
 logger = logging.getLogger(__name__)
@@ -103,7 +149,8 @@ toml_settings = TomlSettings(
 migrate_old_settings(toml_settings)  # TODO: Remove in the Future
 
 try:
-    user_settings: UserSettings = toml_settings.get_user_settings(debug=True)
+    # Display the used file only in a terminal: Don't mix it into piped output:
+    user_settings: UserSettings = toml_settings.get_user_settings(debug=sys.stdout.isatty())
 except UserSettingsNotFound:
     # Use default one
     user_settings = UserSettings()
@@ -116,6 +163,11 @@ option_kwargs_ip = dict(
     default=user_settings.inverter.ip or None,  # Don't accept empty string as IP: We need a address ;)
     show_default=True,
 )
+option_kwargs_ips = dict(
+    option_kwargs_ip,
+    multiple=True,
+    default=[user_settings.inverter.ip] if user_settings.inverter.ip else None,
+)
 option_kwargs_port = dict(
     required=True,
     type=int,
@@ -130,13 +182,40 @@ option_kwargs_inverter_name = dict(
     help='Prefix of yaml config files in inverter/definitions/',
     show_default=True,
 )
+option_kwargs_record_format = dict(
+    type=click.Choice(RECORD_FORMATS),
+    default=RECORD_FORMAT_AUTO,
+    show_default=True,
+    help='File format of the recorded values ("auto" will use Parquet if pyarrow is installed, otherwise CSV)',
+)
+option_kwargs_capture = dict(
+    type=click.Path(file_okay=True, dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help='Append all raw responses of the inverter to this capture file, e.g.: for the "replay" command',
+)
+
+
+def convert_time_window_option(ctx, param, value: str) -> tuple[datetime.time, datetime.time]:
+    try:
+        return parse_time_window(value)
+    except ValueError as err:
+        raise click.BadParameter(str(err))
+
+
 option_kwargs_compact = dict(
     required=False,
     default=False,
-    help='Only show the values concerning power generation',
+    help='Only show the values concerning power generation (Same as: --profile compact)',
     is_flag=True,
     show_default=False,
 )
+option_kwargs_profile = dict(
+    default=None,
+    help=(
+        'Read profile from the definition yaml, e.g.: "minimal", "compact", "power", "full" or "diagnostics"'
+        ' (Default: "compact" with --compact, otherwise "full")'
+    ),
+)
 
 
 @click.command()
@@ -253,12 +332,41 @@ cli.add_command(systemd_stop)
 @click.option('--inverter', **option_kwargs_inverter_name)
 @click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
 @click.option('-c', '--compact', **option_kwargs_compact)
-def print_values(ip, port, inverter, verbosity: int, compact: bool):
+@click.option('--profile', **option_kwargs_profile)
+@click.option('--capture', **option_kwargs_capture)
+@click.option(
+    '--format',
+    'output_format',
+    type=click.Choice(OUTPUT_FORMATS, case_sensitive=False),
+    default=OUTPUT_FORMAT_TABLE,
+    show_default=True,
+    help='Output format: The "jsonl", "json" and "csv" records are written to stdout, all messages to stderr',
+)
+@click.option(
+    '--watch',
+    type=click.FloatRange(min=0),
+    default=0,
+    show_default=True,
+    help='Read the values every N seconds, over the same connection (0 = read only once)',
+)
+def print_values(
+    ip, port, inverter, verbosity: int, compact: bool, profile: str, capture: Path, output_format: str, watch: float
+):
     """
     Print all known register values from Inverter, e.g.:
 
     .../inverter-connect$ ./cli.py print-values
+
+    Stream the values as JSON lines, every 10 seconds:
+
+    .../inverter-connect$ ./cli.py print-values --format jsonl --watch 10
     """
+    value_writer = None
+    if output_format != OUTPUT_FORMAT_TABLE:
+        # Keep stdout clean for the records:
+        rich.reconfigure(stderr=True)
+        value_writer = get_value_writer(output_format, file=sys.stdout)
+
     setup_logging(verbosity=verbosity)
 
     print()
@@ -269,25 +377,53 @@ def print_values(ip, port, inverter, verbosity: int, compact: bool):
         ip=ip,
         port=port,
         compact=compact,
+        profile=profile,
         inverter=inverter,
     )
 
-    with Inverter(config=config) as inverter:
+    capture_writer = CaptureWriter(capture) if capture else None
+    with Inverter(config=config, inv_sock=InverterSock(config, capture=capture_writer)) as inverter:
         try:
             inverter.connect()
         except ReadInverterError as err:
             print(f'[red]{err}')
             sys.exit(1)
 
-        print('Fetch', end='...')
-        values = []
-        for value in inverter:
-            print(f'[yellow]{value.name}[/yellow],', end='')
-            values.append(value)
-
-    if verbosity > 1:
-        pprint(values)
-    print_inverter_values(values)
+        try:
+            while True:
+                start_time = time.monotonic()
+                try:
+                    if value_writer:
+                        value_writer.start_cycle()
+                        try:
+                            for value in inverter:
+                                value_writer.write(value)
+                        finally:
+                            value_writer.end_cycle()
+                    else:
+                        print('Fetch', end='...')
+                        values = []
+                        for value in inverter:
+                            print(f'[yellow]{value.name}[/yellow],', end='')
+                            values.append(value)
+
+                        if verbosity > 1:
+                            pprint(values)
+                        print_inverter_values(values)
+                except (ReadInverterError, ValidationError) as err:
+                    if not watch:
+                        raise
+                    print(f'[red]{err}')  # e.g.: A value out of range at dusk: Try again in the next cycle
+
+                if not watch:
+                    break
+                time.sleep(max(watch - (time.monotonic() - start_time), 0))
+        except KeyboardInterrupt:
+            pass
+
+    if capture_writer:
+        capture_writer.close()
+        print(f'\nAll responses are captured into: {capture}')
 
 
 cli.add_command(print_values)
@@ -295,10 +431,31 @@ cli.add_command(print_values)
 
 @click.command()
 @click.argument('commands', nargs=-1)
-@click.option('--ip', **option_kwargs_ip)
+@click.option('--ip', **option_kwargs_ips)
 @click.option('--port', **option_kwargs_port)
+@click.option(
+    '--max-workers',
+    type=click.IntRange(1, 64),
+    default=8,
+    show_default=True,
+    help='Max. number of logger sticks that will be requested in parallel',
+)
+@click.option(
+    '--cache-ttl',
+    type=click.IntRange(0),
+    default=AT_COMMAND_CACHE_TTL,
+    show_default=True,
+    help=f'Cache the answers of {", ".join(sorted(STATIC_AT_COMMANDS))} for given seconds (0 disables the cache)',
+)
+@click.option(
+    '--json',
+    'json_file',
+    type=click.File('w'),
+    default=None,
+    help='Write the results as JSON into the given file ("-" for stdout)',
+)
 @click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
-def print_at_commands(ip, port, commands, verbosity: int):
+def print_at_commands(ip, port, commands, max_workers: int, cache_ttl: int, json_file, verbosity: int):
     """
     Print one or more AT command values from Inverter.
 
@@ -319,96 +476,70 @@ def print_at_commands(ip, port, commands, verbosity: int):
 
     .../inverter-connect$ ./cli.py print-at-commands NTPTM
 
+    Request many logger sticks in parallel, e.g.:
+
+    .../inverter-connect$ ./cli.py print-at-commands --ip 192.168.1.10 --ip 192.168.1.11 VER MID
+
     (Note: The prefix "AT+" will be added to every command)
     """
+    if is_stdout(json_file):
+        # Keep stdout clean for the JSON: Print all messages and tables to stderr
+        rich.reconfigure(stderr=True)
+
     setup_logging(verbosity=verbosity)
 
     if not commands:
-        commands = (
-            'KEY',  # Set/Get Device Password
-            'VER',
-            'BVER',  # bootloader version
-            'HWVER',  # hardware version
-            'WEBVER',  # web version
-            'YZVER',  # Firmware version
-            'PING',
-            'YZWAKEYCTL',
-            'YZLOG',
-            'YZAPP',
-            # 'YZAPSTAT', # (doesn't work!)
-            'YZEXPFUN',
-            'MID',
-            # 'CFGRD',  # current system config (doesn't work!)
-            # 'SMEM',  # system memory stat (doesn't work!)
-            'TIME',
-            'ADDRESS',  # Set/Get Device Address
-            'KEY',
-            'NDBGS',  # Set/Get Debug Status
-            'WIFI',  # Set/Get WIFI status: Power up: "WIFI=UP" Power down: "WIFI=DOWN"
-            'WMODE',  # Set/Get the WIFI Operation Mode (AP or STA)
-            'WEBU',  # Set/Get the Login Parameters of WEB page
-            'WAP',  # Set/Get the AP parameters
-            'WSSSID',  # Set/Get the AP's SSID of WIFI STA Mode
-            'WSKEY',  # Set/Get the Security Parameters of WIFI STA Mode
-            'WAKEY',  # Set/Get the Security Parameters of WIFI AP Mode
-            'TXPWR',  # Set/Get wifi rf tx power'
-            'WANN',  # Set/Get The WAN setting if in STA mode.
-            'LANN',  # Set/Get The LAN setting if in ADHOC mode.
-            'UPURL',  # Set/Get the path of remote upgrade
-            'WAPMXSTA',  # Set/Get the Max Number Of Sta Connected to Ap
-            'WSCAN',  # Get The AP site Survey (only for STA Mode).
-            'NTPTM',  # NTP date time? e.g.: "1970-1-1  0:3:9  Thur"
-            'NTPSER',  # set/query NTP server, e.g.: "NTPSER=192.168.1.1"
-            'NTPRF',  # NTP request interval in min (?)
-            'NTPEN',  # Enable/Disable NTP Server
-            'WSDNS',  # Set/Get the DNS Server address
-            'DEVICENUM',  # Set/Get Device Link Num
-            'DEVSELCTL',  # Set/Get Web Device List Info
+        commands = DEFAULT_AT_COMMANDS
+
+    configs = [
+        make_config(
+            user_settings=user_settings,
+            verbosity=verbosity,
+            ip=single_ip,
+            port=port,
+            inverter=None,
         )
+        for single_ip in ip
+    ]
 
-    config = make_config(
-        user_settings=user_settings,
-        verbosity=verbosity,
-        ip=ip,
-        port=port,
-        inverter=None,
-    )
+    cache = None
+    if cache_ttl:
+        cache = AtCommandCache(cache_path=toml_settings.file_path.parent / AT_COMMAND_CACHE_FILE_NAME, ttl=cache_ttl)
 
-    with InverterSock(config) as inv_sock:
-        try:
-            inv_sock.connect()
-        except ReadInverterError as err:
-            print(f'[red]{err}')
-            sys.exit(1)
-
-        print('Fetch', end='...')
-        results = []
-        for command in commands:
-            print(f'[yellow]{command}', end='')
-            result: str = inv_sock.cleaned_at_command(command)
-            results.append(dict(command=command, result=result))
-            print(',', end='')
+    print(f'Fetch {len(commands)} AT commands from {len(configs)} logger', end='...')
+    all_results = bulk_at_commands(configs=configs, commands=commands, cache=cache, max_workers=max_workers)
 
     if verbosity > 1:
-        pprint(results)
+        pprint(all_results)
+
+    if json_file:
+        json.dump([results.as_dict() for results in all_results], json_file, indent=4)
+        json_file.write('\n')
 
     console = get_console()
-    console.print('\n')
-    console.rule()
-
-    table = Table(title='AT-command results')
-    table.add_column('Counter', justify='right')
-    table.add_column('Command', justify='right')
-    table.add_column('[green]Result', justify='left', style='green')
-
-    for offset, result in enumerate(results):
-        table.add_row(
-            str(offset + 1),  # Counter
-            f'[grey]AT+[/grey][bold][yellow]{result["command"]}',
-            result['result'],
-        )
+    for results in all_results:
+        console.print('\n')
+        console.rule()
+        if results.error:
+            print(f'[red]{results.host}: {results.error}')
+            continue
+
+        table = Table(title=f'AT-command results from {results.host} (serial: {results.inverter_info.serial})')
+        table.add_column('Counter', justify='right')
+        table.add_column('Command', justify='right')
+        table.add_column('[green]Result', justify='left', style='green')
+
+        for offset, result in enumerate(results.results):
+            table.add_row(
+                str(offset + 1),  # Counter
+                f'[grey]AT+[/grey][bold][yellow]{result.command}',
+                f'{result.result} [grey](cached)' if result.cached else result.result,
+            )
+
+        console.print(table)
 
-    console.print(table)
+    if any(results.error for results in all_results):
+        sys.exit(1)
 
 
 cli.add_command(print_at_commands)
@@ -418,10 +549,11 @@ cli.add_command(print_at_commands)
 @click.option('--ip', **option_kwargs_ip)
 @click.option('--port', **option_kwargs_port)
 @click.option('--register', default="0x16", help='Start address', show_default=True)
+@click.option('--dry-run', **OPTION_ARGS_DEFAULT_FALSE, help='Only display the write frames, without sending them')
 @click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
-def set_time(ip, port, register, verbosity: int):
+def set_time(ip, port, register, dry_run: bool, verbosity: int):
     """
-    Set current date time in the inverter device.
+    Set current date time in the inverter device and verify it by reading back.
 
     Default start address is 0x16, so that this will be filled:
         0x16 - year + month
@@ -447,11 +579,14 @@ def set_time(ip, port, register, verbosity: int):
             print(f'[red]{err}')
             sys.exit(1)
 
-        set_current_time(inv_sock=inv_sock, address=address, verbose=True)
-
-        print('\nRead register...')
-        time.sleep(1)
-        print_register(inv_sock, start_register=address, length=3)
+        try:
+            plan = set_current_time(inv_sock=inv_sock, address=address, verbose=True, dry_run=dry_run)
+        except ReadInverterError as err:
+            print(f'[red]{err}')
+            sys.exit(1)
+        if dry_run:
+            print_write_plan(plan, title='Write Plan (dry run)')
+            return
 
         print('\nCheck time by request "AT+NTPTM"', end='...')
         time.sleep(1)
@@ -462,6 +597,71 @@ def set_time(ip, port, register, verbosity: int):
 cli.add_command(set_time)
 
 
+def parse_register_values(register_values: tuple[str, ...]) -> dict[int, int]:
+    """
+    >>> parse_register_values(('0x16=0x1706', '23=12'))
+    {22: 5894, 23: 12}
+    """
+    registers = {}
+    for register_value in register_values:
+        register, separator, value = register_value.partition('=')
+        if not separator:
+            raise click.BadParameter(f'{register_value!r} is not in REGISTER=VALUE format')
+        registers[int(register, 0)] = int(value, 0)
+    return registers
+
+
+@click.command()
+@click.option('--ip', **option_kwargs_ip)
+@click.option('--port', **option_kwargs_port)
+@click.argument('register_values', metavar='REGISTER=VALUE...', nargs=-1, required=True)
+@click.option('--dry-run', **OPTION_ARGS_DEFAULT_FALSE, help='Only display the write frames, without sending them')
+@click.option('--verify/--no-verify', **OPTION_ARGS_DEFAULT_TRUE, help='Read back the written registers')
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def write_registers(ip, port, register_values, dry_run: bool, verify: bool, verbosity: int):
+    """
+    Write register(s) of the inverter and verify them by reading back, e.g.:
+
+    .../inverter-connect$ ./cli.py write-registers 0x28=100 0x29=1 --dry-run
+
+    Contiguous registers are written with one Modbus frame.
+    """
+    setup_logging(verbosity=verbosity)
+
+    try:
+        plan = WritePlan(registers=parse_register_values(register_values))
+    except ValueError as err:
+        print(f'[red]{err}')
+        sys.exit(1)
+
+    print_write_plan(plan, title='Write Plan (dry run)' if dry_run else 'Write Plan')
+    if dry_run:
+        return
+
+    config = make_config(
+        user_settings=user_settings,
+        verbosity=verbosity,
+        ip=ip,
+        port=port,
+        inverter=None,
+    )
+    with InverterSock(config) as inv_sock:
+        try:
+            inv_sock.connect()
+            plan.apply(inv_sock, verify=verify)
+        except ReadInverterError as err:
+            print(f'[red]{err}')
+            sys.exit(1)
+
+    if verify:
+        print(f'[green]{len(plan.registers)} register(s) written and verified.')
+    else:
+        print(f'{len(plan.registers)} register(s) written.')
+
+
+cli.add_command(write_registers)
+
+
 @click.command()
 @click.option('--ip', **option_kwargs_ip)
 @click.option('--port', **option_kwargs_port)
@@ -509,6 +709,120 @@ def read_register(ip, port, register, length, verbosity: int):
 cli.add_command(read_register)
 
 
+@click.command()
+@click.option('--ip', **option_kwargs_ip)
+@click.option('--port', **option_kwargs_port)
+@click.argument('start')
+@click.argument('end')
+@click.option(
+    '--snapshot',
+    type=click.Path(dir_okay=False, writable=True, path_type=Path),
+    default='register_scan.csv',
+    show_default=True,
+    help='CSV file to store the results. An existing file will be used to resume the scan.',
+)
+@click.option(
+    '--max-span',
+    type=click.IntRange(1, MAX_SCAN_SPAN),
+    default=MAX_SCAN_SPAN,
+    show_default=True,
+    help='Max. registers read with one request',
+)
+@click.option(
+    '--concurrency',
+    type=click.IntRange(1, 8),
+    default=1,
+    show_default=True,
+    help='Number of parallel connections to the inverter',
+)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def scan_registers(ip, port, start, end, snapshot: Path, max_span: int, concurrency: int, verbosity: int):
+    """
+    Scan all registers in the given range (incl. END) and store the values into a CSV file, e.g.:
+
+    .../inverter-connect$ ./cli.py scan-registers 0 0x300 --snapshot morning.csv
+
+    Spans that can't be read will be split, until single "no data" registers are found.
+    Compare two scans with "diff-register-scans".
+    """
+    setup_logging(verbosity=verbosity)
+
+    start = convert_address_option(raw_address=start, debug=bool(verbosity))
+    end = convert_address_option(raw_address=end, debug=bool(verbosity))
+
+    config = make_config(
+        user_settings=user_settings,
+        verbosity=verbosity,
+        ip=ip,
+        port=port,
+        inverter=None,
+    )
+    scanner = RegisterScanner(config=config, max_span=max_span, concurrency=concurrency)
+    results = scanner.scan(start=start, end=end, snapshot_path=snapshot)
+
+    ok_count = sum(1 for result in results.values() if result.value is not None)
+    print(f'[green]{ok_count}[/green] registers with data, {len(results) - ok_count} without, stored in: {snapshot}')
+
+
+cli.add_command(scan_registers)
+
+
+@click.command()
+@click.argument('old', **ARGUMENT_EXISTING_FILE)
+@click.argument('new', **ARGUMENT_EXISTING_FILE)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def diff_register_scans(old: Path, new: Path, verbosity: int):
+    """
+    Print all registers that are different in the two snapshots from "scan-registers", e.g.:
+
+    .../inverter-connect$ ./cli.py diff-register-scans morning.csv evening.csv
+    """
+    setup_logging(verbosity=verbosity)
+
+    diff = diff_snapshots(read_snapshot(old), read_snapshot(new))
+    print_register_scan_diff(diff, title=f'{len(diff)} changed registers from {old.name} to {new.name}')
+
+
+cli.add_command(diff_register_scans)
+
+
+@click.command()
+@click.option(
+    '--reset',
+    **OPTION_ARGS_DEFAULT_FALSE,
+    help='Delete all statistics and lift the quarantine of all registers',
+)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def register_stats(reset: bool, verbosity: int):
+    """
+    Print the read statistics of all registers, collected by "publish-loop", e.g.:
+
+    .../inverter-connect$ ./cli.py register-stats
+
+    Registers with persistent failures (e.g.: "no data") are in quarantine:
+    They are not read until the next re-probe. Every failed re-probe doubles the quarantine time.
+    """
+    setup_logging(verbosity=verbosity)
+
+    stats_path = toml_settings.file_path.parent / REGISTER_STATS_FILE_NAME
+    if reset:
+        stats_path.unlink(missing_ok=True)
+        print(f'Register statistics {stats_path} deleted.')
+        return
+
+    if not stats_path.exists():
+        print(f'[yellow]No register statistics found in {stats_path} (Start "publish-loop" to collect them)')
+        return
+
+    statistics = RegisterStatistics(stats_path=stats_path)
+    print_register_stats(statistics.get_all(), title=f'Register Statistics from {stats_path}')
+    if quarantined := statistics.get_quarantined():
+        print(f'[yellow]{len(quarantined)} register(s) in quarantine.')
+
+
+cli.add_command(register_stats)
+
+
 @click.command()
 @click.option('--ip', **option_kwargs_ip)
 @click.option('--port', **option_kwargs_port)
@@ -534,12 +848,7 @@ def inverter_version(ip, port, verbosity: int):
             print(f'[red]{err}')
             sys.exit(1)
 
-        infos = [
-            InverterRegisterVersionInfo(name='Control Board Firmware', register=0x000D),
-            InverterRegisterVersionInfo(name='Communication Board Firmware', register=0x000E),
-            InverterRegisterVersionInfo(name='Communication Protocol', register=0x0012),
-        ]
-        results = fetch_inverter_versions(inv_sock=inv_sock, infos=infos)
+        results = fetch_inverter_versions(inv_sock=inv_sock, infos=INVERTER_VERSION_INFOS)
 
     print_inverter_versions(results)
 
@@ -547,6 +856,117 @@ def inverter_version(ip, port, verbosity: int):
 cli.add_command(inverter_version)
 
 
+@click.command()
+@click.argument('hosts', nargs=-1, required=True)
+@click.option('--port', **option_kwargs_port)
+@click.option(
+    '--max-workers',
+    type=click.IntRange(1, 256),
+    default=32,
+    show_default=True,
+    help='Max. number of logger sticks that will be requested in parallel',
+)
+@click.option(
+    '--timeout',
+    type=click.IntRange(1),
+    default=2,
+    show_default=True,
+    help='Socket timeout in seconds',
+)
+@click.option(
+    '--json',
+    'json_file',
+    type=click.File('w'),
+    default=None,
+    help='Write the results as JSON into the given file ("-" for stdout)',
+)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def fleet_inventory_command(hosts, port, max_workers: int, timeout: int, json_file, verbosity: int):
+    """
+    Print serial, MAC and all versions of many inverters, e.g.:
+
+    .../inverter-connect$ ./cli.py fleet-inventory 192.168.1.10 192.168.1.11
+
+    .../inverter-connect$ ./cli.py fleet-inventory 192.168.1.10,192.168.1.11 192.168.2.0/24
+    """
+    if is_stdout(json_file):
+        # Keep stdout clean for the JSON: Print all messages and the inventory table to stderr
+        rich.reconfigure(stderr=True)
+
+    setup_logging(verbosity=verbosity)
+
+    configs = []
+    for host in expand_hosts(hosts):
+        config = make_config(
+            user_settings=user_settings,
+            verbosity=verbosity,
+            ip=host,
+            port=port,
+            inverter=None,
+        )
+        config.socket_timeout = timeout
+        configs.append(config)
+
+    print(f'Request {len(configs)} logger sticks', end='...')
+    results = fleet_inventory(configs=configs, max_workers=max_workers)
+
+    if json_file:
+        json.dump([result.as_dict() for result in results], json_file, indent=4)
+        json_file.write('\n')
+
+    print_fleet_inventory(results)
+
+
+cli.add_command(fleet_inventory_command, name='fleet-inventory')
+
+
+@click.command()
+@click.option(
+    '--target',
+    multiple=True,
+    default=[BROADCAST_ADDRESS],
+    show_default=True,
+    help='Broadcast (or unicast) address to send the handshake to. Can be given multiple times.',
+)
+@click.option('--port', **option_kwargs_port)
+@click.option(
+    '--timeout',
+    type=click.FloatRange(0.1),
+    default=DISCOVERY_TIMEOUT,
+    show_default=True,
+    help='Wait for answers of logger sticks for given seconds',
+)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def discover(target, port, timeout: float, verbosity: int):
+    """
+    Search logger sticks in the local network via UDP broadcast, e.g.:
+
+    .../inverter-connect$ ./cli.py discover
+
+    .../inverter-connect$ ./cli.py discover --target 192.168.1.255 --target 192.168.2.255
+
+    The found logger sticks are stored by serial number. The "publish-loop" uses them
+    to find the logger stick again, if the IP address has changed.
+    """
+    setup_logging(verbosity=verbosity)
+
+    print(f'Discover logger sticks via {", ".join(target)} (wait {timeout} sec.)', end='...')
+    inverter_infos = discover_loggers(port=port, targets=target, timeout=timeout)
+
+    cache = DiscoveryCache(cache_path=toml_settings.file_path.parent / DISCOVERY_CACHE_FILE_NAME)
+    last_ips = {inverter_info.serial: cache.get_ip(serial=inverter_info.serial) for inverter_info in inverter_infos}
+    if inverter_infos:
+        cache.update(inverter_infos)
+        cache.save()
+
+    print_discovered_loggers(inverter_infos, last_ips=last_ips)
+    if not inverter_infos:
+        sys.exit(1)
+
+
+cli.add_command(discover)
+
+
 ######################################################################################################
 # MQTT
 
@@ -575,11 +995,76 @@ cli.add_command(test_mqtt_connection)
 @click.option('--port', **option_kwargs_port)
 @click.option('--inverter', **option_kwargs_inverter_name)
 @click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
-def publish_loop(ip, port, inverter, verbosity: int):
+@click.option(
+    '--stream/--all-or-nothing',
+    default=True,
+    show_default=True,
+    help=(
+        'Publish every value as soon as it is read from the inverter'
+        ' or send all values at once, but only if all values are valid.'
+    ),
+)
+@click.option(
+    '--metrics-port',
+    type=click.IntRange(1, 65535),
+    default=None,
+    help='Serve the current values as Prometheus metrics on this port, e.g.: 9101 (Disabled if not given)',
+)
+@click.option(
+    '--metrics-host',
+    default='0.0.0.0',
+    show_default=True,
+    help='Bind address of the Prometheus metrics HTTP server',
+)
+@click.option(
+    '--record-dir',
+    type=click.Path(file_okay=False, dir_okay=True, writable=True, path_type=Path),
+    default=None,
+    help='Record the values of every cycle into daily rotated files in this directory (Disabled if not given)',
+)
+@click.option('--record-format', **option_kwargs_record_format)
+@click.option(
+    '--database',
+    type=click.Path(file_okay=True, dir_okay=False, writable=True, path_type=Path),
+    default=None,
+    help='Store the values into this SQLite database, e.g.: ~/inverter.sqlite3 (Disabled if not given)',
+)
+@click.option(
+    '--retention-days',
+    type=click.IntRange(1),
+    default=RAW_RETENTION_DAYS,
+    show_default=True,
+    help='Keep the raw values in the SQLite database for this number of days (The rollups are kept longer)',
+)
+@click.option('--capture', **option_kwargs_capture)
+@click.option(
+    '--reset-window',
+    default='00:00-12:00',
+    show_default=True,
+    callback=convert_time_window_option,
+    help='Quiet time window "HH:MM-HH:MM" in which the "Daily Production" counter will be reset',
+)
+@click.option('--profile', **option_kwargs_profile)
+def publish_loop(
+    ip,
+    port,
+    inverter,
+    verbosity: int,
+    stream: bool,
+    metrics_port,
+    metrics_host: str,
+    record_dir: Path,
+    record_format: str,
+    database: Path,
+    retention_days: int,
+    capture: Path,
+    reset_window: tuple,
+    profile: str,
+):
     """
     Publish current data via MQTT for Home Assistant (endless loop)
 
-    The "Daily Production" count will be cleared in the night,
+    The "Daily Production" count will be cleared once a day in the "--reset-window",
     by set the current date time via AT-command.
     """
 
@@ -592,23 +1077,398 @@ def publish_loop(ip, port, inverter, verbosity: int):
         ip=ip,
         port=port,
         inverter=inverter,
+        profile=profile,
     )
+    config.daily_reset_window = reset_window
+
+    metrics = None
+    if metrics_port:
+        metrics = MetricsSnapshot()
+        start_metrics_server(snapshot=metrics, host=metrics_host, port=metrics_port)
+
+    recorders = []
+    if record_dir:
+        recorder = ValueRecorder(path=record_dir, file_prefix=inverter, record_format=record_format)
+        print(f'Record values as {recorder.record_format} into: {record_dir}')
+        recorders.append(recorder)
+    if database:
+        writer = SQLiteWriter(db_path=database, raw_retention_days=retention_days)
+        try:
+            writer.start()
+        except (sqlite3.Error, OSError) as err:
+            print(f'[red]Can not open the SQLite database {database}: {err}')
+            sys.exit(1)
+        print(f'Store values into SQLite database: {database}')
+        recorders.append(writer)
+
+    capture_writer = None
+    if capture:
+        capture_writer = CaptureWriter(capture)
+        print(f'Capture all responses into: {capture}')
+
     try:
-        publish_forever(config=config, verbosity=verbosity)
+        publish_forever(
+            config=config,
+            verbosity=verbosity,
+            streaming=stream,
+            metrics=metrics,
+            recorders=recorders,
+            capture=capture_writer,
+        )
     except KeyboardInterrupt:
         print('Bye, bye')
+    finally:
+        for recorder in recorders:
+            recorder.close()
+        if capture_writer:
+            capture_writer.close()
 
 
 cli.add_command(publish_loop)
 
 
+@click.command()
+@click.argument('hosts', nargs=-1, required=True)
+@click.option('--port', **option_kwargs_port)
+@click.option('--inverter', **option_kwargs_inverter_name)
+@click.option(
+    '--max-workers',
+    type=click.IntRange(1, 256),
+    default=SITE_MAX_WORKERS,
+    show_default=True,
+    help='Max. number of inverters that will be read in parallel',
+)
+@click.option(
+    '--deadline',
+    type=click.FloatRange(1),
+    default=SITE_DEADLINE,
+    show_default=True,
+    help='Max. seconds to read all values of one inverter',
+)
+@click.option(
+    '--cycle-time',
+    type=click.FloatRange(1),
+    default=SITE_CYCLE_TIME,
+    show_default=True,
+    help='Seconds between two read cycles: Unfinished reads will be cancelled after this time',
+)
+@click.option(
+    '--parse-processes',
+    type=click.IntRange(0, 64),
+    default=0,
+    show_default=True,
+    help='Parse the replies in this number of worker processes (0: parse in the reader threads)',
+)
+@click.option(
+    '--site-device/--no-site-device',
+    **OPTION_ARGS_DEFAULT_FALSE,
+    help='Publish a virtual "site" device with the sums/min/max values of all inverters',
+)
+@click.option('--profile', **option_kwargs_profile)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def publish_sites(
+    hosts,
+    port,
+    inverter,
+    max_workers: int,
+    deadline: float,
+    cycle_time: float,
+    parse_processes: int,
+    site_device: bool,
+    profile: str,
+    verbosity: int,
+):
+    """
+    Publish the data of many inverters via one MQTT connection (endless loop), e.g.:
+
+    .../inverter-connect$ ./cli.py publish-sites 192.168.1.10,192.168.1.11 192.168.2.0/28
+
+    All inverters are read in parallel. A inverter that doesn't answer in time will be skipped in this cycle.
+    """
+    setup_logging(verbosity=verbosity)
+
+    configs = []
+    for host in expand_hosts(hosts):
+        config = make_config(
+            user_settings=user_settings,
+            config_path=toml_settings.file_path.parent,  # e.g.: ~/.config/inverter-connect/
+            verbosity=verbosity,
+            ip=host,
+            port=port,
+            inverter=inverter,
+            profile=profile,
+        )
+        configs.append(config)
+
+    print(f'Publish {len(configs)} inverters every {cycle_time} sec.')
+    try:
+        publish_sites_forever(
+            configs=configs,
+            verbosity=verbosity,
+            max_workers=max_workers,
+            site_deadline=deadline,
+            cycle_time=cycle_time,
+            parse_processes=parse_processes,
+            site_device=site_device,
+        )
+    except KeyboardInterrupt:
+        print('Bye, bye')
+
+
+cli.add_command(publish_sites)
+
+
+@click.command()
+@click.argument('directory', **ARGUMENT_NOT_EXISTING_DIR)
+@click.option('--ip', **option_kwargs_ip)
+@click.option('--port', **option_kwargs_port)
+@click.option('--inverter', **option_kwargs_inverter_name)
+@click.option('--format', 'record_format', **option_kwargs_record_format)
+@click.option(
+    '--interval',
+    type=click.FloatRange(0),
+    default=RECORD_INTERVAL,
+    show_default=True,
+    help='Seconds to wait between two cycles',
+)
+@click.option(
+    '--flush-interval',
+    type=click.FloatRange(0),
+    default=RECORD_FLUSH_INTERVAL,
+    show_default=True,
+    help='Write the buffered values to disk at least every given seconds',
+)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def record(
+    directory: Path,
+    ip,
+    port,
+    inverter,
+    record_format: str,
+    interval: float,
+    flush_interval: float,
+    verbosity: int,
+):
+    """
+    Record all values into daily rotated files (without publishing them via MQTT), e.g.:
+
+    .../inverter-connect$ ./cli.py record ~/inverter-records/
+
+    Every cycle is one row, every value one column.
+    """
+    setup_logging(verbosity=verbosity)
+
+    config = make_config(
+        user_settings=user_settings,
+        verbosity=verbosity,
+        ip=ip,
+        port=port,
+        inverter=inverter,
+    )
+    with ValueRecorder(
+        path=directory,
+        file_prefix=inverter,
+        record_format=record_format,
+        flush_interval=flush_interval,
+    ) as recorder:
+        print(f'Record values as {recorder.record_format} into: {directory}')
+        try:
+            record_forever(config=config, recorder=recorder, interval=interval)
+        except KeyboardInterrupt:
+            print('Bye, bye')
+
+
+cli.add_command(record)
+
+
+@click.command()
+@click.argument('database', **ARGUMENT_EXISTING_FILE)
+@click.option(
+    '--days',
+    type=click.IntRange(1),
+    default=14,
+    show_default=True,
+    help='Number of days to display',
+)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def query(database: Path, days: int, verbosity: int):
+    """
+    Print the energy per day from a SQLite database, created by "publish-loop --database", e.g.:
+
+    .../inverter-connect$ ./cli.py query ~/inverter.sqlite3 --days 31
+    """
+    setup_logging(verbosity=verbosity)
+
+    storage = SQLiteStorage(db_path=database)
+    try:
+        daily_energy = storage.get_daily_energy(days=days)
+    finally:
+        storage.close()
+
+    print_daily_energy(daily_energy, title=f'Energy per day (last {days} days)')
+
+
+cli.add_command(query)
+
+
+@click.command()
+@click.argument('capture', **ARGUMENT_EXISTING_FILE)
+@click.option('--inverter', **option_kwargs_inverter_name)
+@click.option('-c', '--compact', **option_kwargs_compact)
+@click.option('--profile', **option_kwargs_profile)
+@click.option(
+    '--realtime/--full-speed',
+    default=False,
+    show_default=True,
+    help='Replay with the timing of the capture or as fast as possible',
+)
+@click.option(
+    '--mqtt/--no-mqtt',
+    default=False,
+    show_default=True,
+    help='Publish the replayed values via MQTT for Home Assistant',
+)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def replay(capture: Path, inverter, compact: bool, profile: str, realtime: bool, mqtt: bool, verbosity: int):
+    """
+    Push the responses from a capture file through parsers, validators and computed values, e.g.:
+
+    .../inverter-connect$ ./cli.py publish-loop --capture ~/inverter.capture
+
+    .../inverter-connect$ ./cli.py replay ~/inverter.capture
+
+    No connection to the inverter is needed.
+    """
+    setup_logging(verbosity=verbosity)
+
+    config = Config(
+        compact=compact,
+        profile=profile,
+        verbosity=verbosity,
+        host=str(capture),
+        port=0,
+        mqtt_settings=user_settings.mqtt,
+        inverter_name=inverter,
+    )
+
+    publisher = None
+    if mqtt:
+        publisher = InverterMqttPublisher(settings=user_settings.mqtt, verbosity=verbosity)
+
+    on_cycle = None
+    if verbosity:
+        on_cycle = print_inverter_values
+
+    print(f'Replay {capture}', end='...')
+    stats = replay_capture(config=config, path=capture, realtime=realtime, publisher=publisher, on_cycle=on_cycle)
+    print(
+        f'\n{stats.cycles} cycles with {stats.values} values and {stats.errors} errors'
+        f' replayed in {stats.duration:.2f} sec.'
+    )
+    if stats.duration:
+        print(f'({stats.values / stats.duration:.0f} values/sec.)')
+
+
+cli.add_command(replay)
+
+
+@click.command()
+@click.argument('definitions', metavar='[NAME_OR_PATH]...', nargs=-1)
+@click.option(
+    '--write/--no-write',
+    default=False,
+    show_default=True,
+    help='Write the compiled definition next to the yaml file, if there are no errors',
+)
+@click.option('-v', '--verbosity', **OPTION_KWARGS_VERBOSE)
+def compile_definition_command(definitions, write: bool, verbosity: int):
+    """
+    Validate definition yaml files and display the compiled read plans and decoders, e.g.:
+
+    .../inverter-connect$ ./cli.py compile-definition deye_4mppt
+
+    .../inverter-connect$ ./cli.py compile-definition ~/my_inverter.yaml --write
+
+    All shipped definitions are checked, if no name or path is given.
+    An up-to-date compiled definition is loaded instead of the yaml file.
+    """
+    setup_logging(verbosity=verbosity)
+
+    if not definitions:
+        definitions = get_definition_names()
+
+    console = get_console()
+    has_errors = False
+    for definition in definitions:
+        definition_file_path = Path(definition).expanduser()
+        if definition_file_path.suffix != '.yaml':
+            definition_file_path = constants.DEFINITIONS_PATH / f'{definition}.yaml'
+
+        console.rule(str(definition_file_path))
+        if not definition_file_path.is_file():
+            print(f'[red]File not found: {definition_file_path}')
+            has_errors = True
+            continue
+
+        compiled, issues = compile_definition(definition_file_path)
+        for issue in issues:
+            color = 'red' if issue.level == LINT_ERROR else 'yellow'
+            print(f'[{color}]{issue.level}: {issue.message}')
+
+        if compiled is None:
+            has_errors = True
+            continue
+
+        if verbosity:
+            for profile_name, blocks in compiled.read_plans.items():
+                table = Table(title=f'Read plan of profile {profile_name!r}')
+                table.add_column('Start', justify='right')
+                table.add_column('Length', justify='right')
+                table.add_column('Parameters', justify='left')
+                for block in blocks:
+                    table.add_row(hex(block.start_register), str(block.length), ', '.join(block.names))
+                console.print(table)
+
+            table = Table(title='Decoders')
+            table.add_column('Name', justify='left')
+            table.add_column('Registers', justify='right')
+            table.add_column('Parser', justify='left')
+            table.add_column('Scale', justify='right')
+            table.add_column('Offset', justify='right')
+            for decoder in compiled.decoders:
+                table.add_row(
+                    decoder.name,
+                    f'{hex(decoder.start_register)} ({decoder.length})',
+                    decoder.parser,
+                    str(decoder.scale),
+                    '' if decoder.offset is None else str(decoder.offset),
+                )
+            console.print(table)
+        else:
+            print(
+                f'[green]OK:[/green] {len(compiled.decoders)} parameters,'
+                f' read plans: {", ".join(f"{name}={len(blocks)}" for name, blocks in compiled.read_plans.items())}'
+            )
+
+        if write:
+            compiled_path = write_compiled_definition(definition_file_path=definition_file_path, compiled=compiled)
+            print(f'Compiled definition written to: {compiled_path}')
+
+    if has_errors:
+        sys.exit(1)
+
+
+cli.add_command(compile_definition_command, name='compile-definition')
+
+
 def exit_func():
     console = get_console()
     console.rule(datetime.datetime.now().strftime('%c'))
 
 
 def main():
-    print(f'[bold][green]{inverter.__name__}[/green] v[cyan]{inverter.__version__}')
+    # Use stderr, so that stdout contains only the records of e.g.: "print-values --format jsonl"
+    print(f'[bold][green]{inverter.__name__}[/green] v[cyan]{inverter.__version__}', file=sys.stderr)
     locale.setlocale(locale.LC_ALL, '')
 
     console = get_console()
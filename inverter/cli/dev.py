@@ -21,6 +21,7 @@ from tomlkit import TOMLDocument
 
 import inverter
 from inverter import constants
+from inverter.benchmark import BENCHMARK_INVERTER_NAME, benchmark_memory, benchmark_parse
 from inverter.constants import PACKAGE_ROOT, SETTINGS_DIR_NAME, SETTINGS_FILE_NAME
 from inverter.user_settings import UserSettings
 
@@ -300,6 +301,44 @@ def create_default_settings(force):
 
 cli.add_command(create_default_settings)
 
+
+@click.command()
+@click.option('--inverter-name', default=BENCHMARK_INVERTER_NAME, show_default=True)
+@click.option('--cycles', default=10, show_default=True, help='Number of measured read cycles')
+def benchmark_memory_usage(inverter_name: str, cycles: int):
+    """
+    Measure the allocated memory of one read cycle (Without a inverter connection)
+    """
+    result = benchmark_memory(inverter_name=inverter_name, cycles=cycles)
+    print(
+        f'[bold]{result.inverter_name}[/bold]: {result.values} values per cycle'
+        f' (average of {result.cycles} cycles):'
+    )
+    print(f'Per cycle: [cyan]{result.cycle_bytes}[/cyan] Bytes ({result.bytes_per_value:.0f} Bytes per value)')
+    print(f'Peak.....: [cyan]{result.peak_bytes}[/cyan] Bytes')
+
+
+cli.add_command(benchmark_memory_usage)
+
+
+@click.command()
+@click.option('--inverter-name', default=BENCHMARK_INVERTER_NAME, show_default=True)
+@click.option('--rounds', default=1000, show_default=True, help='Parse all registers of the definition n times')
+def benchmark_parse_speed(inverter_name: str, rounds: int):
+    """
+    Measure the parse throughput without and with tracing (Without a inverter connection)
+    """
+    for enable_trace in (False, True):
+        result = benchmark_parse(inverter_name=inverter_name, rounds=rounds, enable_trace=enable_trace)
+        print(
+            f'[bold]{result.inverter_name}[/bold] trace={result.trace!r}:'
+            f' {result.values} values in {result.duration:.2f} sec.'
+            f' = [cyan]{result.values_per_second:.0f}[/cyan] values/sec.'
+        )
+
+
+cli.add_command(benchmark_parse_speed)
+
 ######################################################################################################
 
 
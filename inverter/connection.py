@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import logging
 import socket
+import struct
+import time
 
 import backoff
 from rich import print  # noqa
 
+from inverter import trace
+from inverter.capture import CaptureWriter
 from inverter.constants import AT_READ_FUNC_NUMBER, AT_WRITE_FUNC_NUMBER, ERROR_STR_NO_DATA
 from inverter.data_types import Config, InverterInfo, ModbusReadResult, ModbusResponse, Parameter, RawModBusResponse
 from inverter.exceptions import (
@@ -16,6 +20,8 @@ from inverter.exceptions import (
     ReadInverterError,
     ReadTimeout,
 )
+from inverter.read_plan import ReadBlock
+from inverter.register_stats import RegisterStatistics
 
 
 logger = logging.getLogger(__name__)
@@ -31,20 +37,18 @@ BACKOFF_DEFAULTS = dict(
 
 def make_modbus_result(*, response: ModbusResponse, parameter: Parameter) -> ModbusReadResult:
     parser_func = parameter.parser
-    data_hex = response.data_hex
-    logger.debug('Call %s with %r', parser_func.__class__.__name__, data_hex)
     try:
         parsed_value = parser_func(
-            data_hex=data_hex,
+            data=response.data,
             scale=parameter.scale,
             offset=parameter.offset,
             lookup=parameter.lookup,
         )
-    except (ValueError, AssertionError) as err:
+    except (ValueError, AssertionError, struct.error) as err:
         raise ParseModbusValueError(f'Parser error with {response=} {parameter=}: {err}')
-    logger.debug(f'{parsed_value=}')
     result = ModbusReadResult(parameter=parameter, response=response, parsed_value=parsed_value)
-    logger.debug('%s', result)
+    if trace.enabled:
+        logger.debug('Call %s with %r: %r', parser_func.__name__, response.data, parsed_value)
     return result
 
 
@@ -125,7 +129,8 @@ def parse_response(data: bytes) -> RawModBusResponse:
     >>> parse_response(b'-1\\n\\n+ok=214028\\n\\r+ok\\r\\n\\r\\n')
     RawModBusResponse(prefix='-1\\n\\n+ok=', data='214028')
     """
-    logger.debug(f'parse_response({data=})')
+    if trace.enabled:
+        logger.debug('parse_response(data=%r)', data)
     try:
         data = data.decode('ASCII')
     except UnicodeDecodeError as err:
@@ -138,7 +143,6 @@ def parse_response(data: bytes) -> RawModBusResponse:
         data = data.replace('\n\r', '\n')  # WTF
         data = data.strip()
 
-        logger.debug(f'{data=}')
         if data == '+ok':
             result = RawModBusResponse(prefix=data, data='')
         elif '+ok=' in data:
@@ -149,12 +153,14 @@ def parse_response(data: bytes) -> RawModBusResponse:
         else:
             logger.warning(f'Unexpected data: {data=}')
             result = RawModBusResponse(prefix='', data=data)
-    logger.debug('%s', result)
+    if trace.enabled:
+        logger.debug('%s', result)
     return result
 
 
 def parse_modbus_response(data: str) -> ModbusResponse:
-    logger.debug(f'parse_modbus_response({data=})')
+    if trace.enabled:
+        logger.debug('parse_modbus_response(data=%r)', data)
     if data == ERROR_STR_NO_DATA:
         raise ModbusNoData
 
@@ -164,8 +170,6 @@ def parse_modbus_response(data: str) -> ModbusResponse:
         logger.warning(f'Value error with {data=}: {err}')
         raise ModbusNoHexData(data=data)
 
-    logger.debug(f'{data_bytes=}')
-
     calculated_crc = modbus_crc(data_bytes[:-2])
     calculated_crc = calculated_crc.to_bytes(2, 'little')
     got_crc = data_bytes[-2:]
@@ -179,15 +183,37 @@ def parse_modbus_response(data: str) -> ModbusResponse:
     result = ModbusResponse(
         slave_id=data_bytes[0],
         modbus_function=data_bytes[1],
-        data_hex=data.hex(),
+        data=data,
     )
-    logger.debug('%s', result)
+    if trace.enabled:
+        logger.debug('%s', result)
     return result
 
 
+def parse_inverter_info(data: bytes) -> InverterInfo:
+    """
+    Parse the answer of the logger stick to the init command.
+
+    >>> parse_inverter_info(b'192.168.1.10,AABBCCDDEEFF,1234567890')
+    InverterInfo(ip='192.168.1.10', mac='AABBCCDDEEFF', serial=1234567890)
+    """
+    data = data.decode()
+    data = data.split(',')
+    return InverterInfo(ip=data[0], mac=data[1], serial=int(data[2]))
+
+
 class InverterSock:
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        capture: CaptureWriter | None = None,
+        register_stats: RegisterStatistics | None = None,
+    ):
         self.config = config
+        self.capture = capture  # Store all raw replies, e.g.: for the "replay" command
+        if register_stats is None:
+            register_stats = RegisterStatistics()
+        self.register_stats = register_stats  # Counters, latency and quarantine state per register
 
         self.sock = None
         self.dock = None
@@ -199,16 +225,22 @@ class InverterSock:
     def init_inventer(self) -> None:
         data = self.recv_command(command=self.config.init_cmd)
         self.send(command=b'+ok')
-        data = data.decode()
-        data = data.split(',')
-        self.inverter_info = InverterInfo(ip=data[0], mac=data[1], serial=int(data[2]))
+        self.inverter_info = parse_inverter_info(data)
 
         print(self.inverter_info)
         print()
 
     @backoff.on_exception(backoff.expo, ReadTimeout, **BACKOFF_DEFAULTS)
     def connect(self) -> None:
+        self.connect_once()
+
+    def connect_once(self) -> None:
+        """
+        Send the init command handshake only once, without retries. e.g.: To check if the logger stick is awake.
+        """
         logger.info(f'Connect to {self.config.host}:{self.config.port}...')
+        if self.sock is not None:
+            self.sock.close()
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
         # self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.sock.settimeout(self.config.socket_timeout)
@@ -238,17 +270,18 @@ class InverterSock:
             for _ in range(max_recv):
                 chunk = self.sock.recv(buffer_size)
                 data += chunk
-                if recv_until is None:
-                    return data
-                elif chunk.endswith(recv_until):
-                    return data
+                if recv_until is None or chunk.endswith(recv_until):
+                    break
         except (TimeoutError, socket.timeout) as err:
             raise ReadTimeout(f'Get no response from {self.config.host}: {err}')
-        else:
-            if self.config.verbosity > 1:
-                print(f'{data}', flush=True)
 
-            return data
+        if self.config.verbosity > 1:
+            print(f'{data}', flush=True)
+
+        if self.capture is not None:
+            self.capture.write(command=command, data=data)
+
+        return data
 
     @backoff.on_exception(backoff.expo, ReadTimeout, **BACKOFF_DEFAULTS)
     def at_command(self, command: str, buffer_size=1024):
@@ -259,13 +292,11 @@ class InverterSock:
         return self.recv_command(command=command, buffer_size=buffer_size, recv_until=b'\r\n\r\n')
 
     def cleaned_at_command(self, command: str, buffer_size=1024) -> str:
-        logger.debug(f'cleaned_at_command({command=})')
-
         data = self.at_command(command, buffer_size=buffer_size)
-        logger.debug(f'{data=}')
+        if trace.enabled:
+            logger.debug('cleaned_at_command(command=%r): %r', command, data)
 
         raw_modbus_response: RawModBusResponse = parse_response(data=data)
-        logger.debug(f'{raw_modbus_response=}')
         if data == 'no data':
             raise ModbusNoData
 
@@ -281,6 +312,12 @@ class InverterSock:
 
     @backoff.on_exception(backoff.expo, ModbusNoData, **BACKOFF_DEFAULTS)
     def read(self, *, start_register: int, length: int) -> ModbusResponse:
+        return self.read_once(start_register=start_register, length=length)
+
+    def read_once(self, *, start_register: int, length: int) -> ModbusResponse:
+        """
+        Read register(s) without retry on "no data" responses.
+        """
         if self.config.verbosity > 1:
             print(f'Read {length} value(s) from start register: {hex(start_register)}')
 
@@ -292,11 +329,24 @@ class InverterSock:
         if self.config.verbosity > 1:
             print(f'AT command: {command}')
 
-        data: str = self.cleaned_at_command(command=command)
+        error = None
+        start_time = time.monotonic()
         try:
-            response: ModbusResponse = parse_modbus_response(data=data)
-        except ParseModbusValueError as err:
-            raise ParseModbusValueError(f'parse error: {data=}: {err}')
+            data: str = self.cleaned_at_command(command=command)
+            try:
+                response: ModbusResponse = parse_modbus_response(data=data)
+            except ParseModbusValueError as err:
+                raise ParseModbusValueError(f'parse error: {data=}: {err}')
+        except ReadInverterError as err:
+            error = err
+            raise
+        finally:
+            self.register_stats.add_request(
+                start_register=start_register,
+                length=length,
+                latency=time.monotonic() - start_time,
+                error=error,
+            )
 
         return response
 
@@ -304,18 +354,100 @@ class InverterSock:
         if self.config.verbosity > 1:
             print(parameter)
 
+        register = dict(start_register=parameter.start_register, length=parameter.length)
+        if self.register_stats.is_quarantined(**register):
+            logger.info('Skip quarantined register %s (%s)', hex(parameter.start_register), parameter.name)
+            return ModbusReadResult(parameter=parameter, parsed_value=ERROR_STR_NO_DATA)
+
+        if self.register_stats.is_probing(**register):
+            read_func = self.read_once  # Re-probe a quarantined register without retries
+        else:
+            read_func = self.read
+
         try:
-            response: ModbusResponse = self.read(
-                start_register=parameter.start_register,
-                length=parameter.length,
-            )
+            response: ModbusResponse = read_func(**register)
         except ModbusNoData:
             # Modbus register value is: b'no data'
-            result = ModbusReadResult(parameter=parameter, parsed_value='no data')
+            self.register_stats.read_done(**register, success=False)
+            result = ModbusReadResult(parameter=parameter, parsed_value=ERROR_STR_NO_DATA)
+        except CrcError:
+            self.register_stats.read_done(**register, success=False)
+            raise
         else:
+            self.register_stats.read_done(**register, success=True)
             result: ModbusReadResult = make_modbus_result(response=response, parameter=parameter)
         return result
 
+    def read_block(self, *, block: ReadBlock) -> list[ModbusReadResult]:
+        """
+        Read all parameters of the block with one request. The results are in the same order as the parameters.
+        If the block can't be read, all parameters are read one by one.
+        """
+        if len(block.parameters) == 1:
+            return [self.read_paremeter(parameter=block.parameters[0])]
+
+        register = dict(start_register=block.start_register, length=block.length)
+        if self.register_stats.is_quarantined(**register):
+            logger.info('Read quarantined block %s one by one', hex(block.start_register))
+            return [self.read_paremeter(parameter=parameter) for parameter in block.parameters]
+
+        if self.register_stats.is_probing(**register):
+            read_func = self.read_once
+        else:
+            read_func = self.read
+
+        try:
+            response: ModbusResponse = read_func(**register)
+        except ModbusNoData:
+            self.register_stats.read_done(**register, success=False)
+            logger.info('No data for block %s: Read the parameters one by one', hex(block.start_register))
+            return [self.read_paremeter(parameter=parameter) for parameter in block.parameters]
+        except CrcError:
+            self.register_stats.read_done(**register, success=False)
+            raise
+
+        self.register_stats.read_done(**register, success=True)
+        results = []
+        for parameter in block.parameters:
+            parameter_response = block.get_response(response=response, parameter=parameter)
+            results.append(make_modbus_result(response=parameter_response, parameter=parameter))
+        return results
+
+    @backoff.on_exception(backoff.expo, ModbusNoData, **BACKOFF_DEFAULTS)
+    def read_raw(self, *, start_register: int, length: int) -> bytes:
+        """
+        Read register(s) like read(), but returns the raw reply: It will be parsed later, e.g.: in a worker process.
+        """
+        command = parameter2modbus_at_command(
+            start_register=start_register,
+            length=length,
+            modbus_function=AT_READ_FUNC_NUMBER,
+        )
+        reply = self.at_command(command)
+        if parse_response(data=reply).data == ERROR_STR_NO_DATA:
+            raise ModbusNoData
+        return reply
+
+    def read_block_raw(self, *, block: ReadBlock) -> bytes | list[bytes | None]:
+        """
+        Raw variant of read_block(): Returns the reply of the whole block.
+        If the block can't be read, all parameters are read one by one:
+        Returns one reply per parameter then (None for a parameter with "no data").
+        """
+        if len(block.parameters) > 1:
+            try:
+                return self.read_raw(start_register=block.start_register, length=block.length)
+            except ModbusNoData:
+                logger.info('No data for block %s: Read the parameters one by one', hex(block.start_register))
+
+        replies = []
+        for parameter in block.parameters:
+            try:
+                replies.append(self.read_raw(start_register=parameter.start_register, length=parameter.length))
+            except ModbusNoData:
+                replies.append(None)
+        return replies
+
     def write(self, *, address: int, values: list[int, ...]):
         if self.config.verbosity > 1:
             print(f'Write {" ".join(hex(value) for value in values)} to {hex(address)}')
@@ -17,6 +17,8 @@ DEFINITIONS_PATH = PACKAGE_ROOT / 'inverter' / 'definitions'
 
 
 ERROR_STR_NO_DATA = 'no data'
+FULL_PROFILE = 'full'  # Read all parameters of the definition
+COMPACT_PROFILE = 'compact'  # Used by "--compact": Only the values concerning power generation
 AT_READ_FUNC_NUMBER = 0x03
 AT_WRITE_FUNC_NUMBER = 0x10
 TYPE_MAP = {
@@ -1,16 +1,48 @@
 from __future__ import annotations
 
 import logging
-from datetime import date
+from datetime import date, datetime, time
 from pathlib import Path
 
-from inverter.api import Inverter, set_current_time
+from rich import print  # noqa
+
+from inverter.api import set_current_time
+from inverter.connection import InverterSock
 from inverter.data_types import Config, InverterValue
+from inverter.exceptions import ReadInverterError
 
 
 logger = logging.getLogger(__name__)
 
 
+def parse_time_window(window: str) -> tuple[time, time]:
+    """
+    >>> parse_time_window('00:00-12:00')
+    (datetime.time(0, 0), datetime.time(12, 0))
+    >>> parse_time_window('22:30-06:00')
+    (datetime.time(22, 30), datetime.time(6, 0))
+    """
+    start, separator, end = window.partition('-')
+    if not separator:
+        raise ValueError(f'Time window {window!r} is not in "HH:MM-HH:MM" format')
+    return time.fromisoformat(start.strip()), time.fromisoformat(end.strip())
+
+
+def in_time_window(now: time, window: tuple[time, time]) -> bool:
+    """
+    >>> in_time_window(time(3, 0), (time(0, 0), time(12, 0)))
+    True
+    >>> in_time_window(time(12, 0), (time(0, 0), time(12, 0)))
+    False
+    >>> in_time_window(time(23, 0), (time(22, 0), time(6, 0))), in_time_window(time(7, 0), (time(22, 0), time(6, 0)))
+    (True, False)
+    """
+    start, end = window
+    if start <= end:
+        return start <= now < end
+    return now >= start or now < end  # Window over midnight
+
+
 class DailyProductionResetState:
     """
     Persistent state for "Daily reset"
@@ -34,7 +66,10 @@ class DailyProductionResetState:
         today = date.today()
         if self.last_reset is None or today > self.last_reset:
             logger.info('Store today date %s to state file', today)
-            self.state_file_path.write_text(today.isoformat())
+            # Write-then-rename, so that a power loss never leaves a broken state file:
+            temp_path = self.state_file_path.with_suffix('.tmp')
+            temp_path.write_text(today.isoformat())
+            temp_path.replace(self.state_file_path)
             self.last_reset = today
         else:
             logger.info('Reset already done today: Skip touch the disk')
@@ -66,35 +101,38 @@ class DailyProductionReset:
     """
     Deye SUN600 will not automatically reset the "Daily Production" counter.
     To reset this counter it's needed to set the current time
+
+    Called once after every cycle with the values of this cycle,
+    but a reset will only be sent in the configured quiet time window.
     """
 
-    def __init__(self, reset_state: DailyProductionResetState, inverter: Inverter, config: Config):
+    def __init__(self, reset_state: DailyProductionResetState, config: Config):
         self.reset_state = reset_state
-        self.inverter = inverter
         self.config = config
 
-    def __enter__(self):
-        return self
-
-    def __call__(self, value: InverterValue):
-        assert self.inverter is not None
-
+    def __call__(self, *, inv_sock: InverterSock, values: dict[str, InverterValue], now: datetime | None = None):
         if self.reset_state.reset_done_today:
             logger.debug('Not needed: %s', self.reset_state)
             return
 
-        if value.name != self.config.daily_production_name:
-            logger.debug('Ignore %r (It is not %r)', value.name, self.config.daily_production_name)
+        if now is None:
+            now = datetime.now()
+        if not in_time_window(now.time(), self.config.daily_reset_window):
+            logger.debug('Not in reset window %s: %s', self.config.daily_reset_window, now)
+            return
+
+        try:
+            value = values[self.config.daily_production_name]
+        except KeyError:
+            logger.debug('No %r in this cycle', self.config.daily_production_name)
             return
 
         if value.value != 0:
             logger.info('set current time to reset counter %s', self.reset_state)
-            set_current_time(inv_sock=self.inverter.inv_sock)
+            try:
+                set_current_time(inv_sock=inv_sock, verbose=False)
+            except ReadInverterError as err:
+                print(f'[red]Set current time failed: {err}')
         else:
             self.reset_state.reset_done()
             logger.info('Successfully reset counter. %s', self.reset_state)
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        self.inverter = None
-        if exc_type:
-            return False
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
+import datetime
 import logging
 from enum import Enum
 from pathlib import Path
@@ -11,7 +12,7 @@ from ha_services.mqtt4homeassistant.data_classes import MqttSettings
 from packaging.version import Version
 from rich import print
 
-from inverter.constants import DEFINITIONS_PATH, TYPE_MAP
+from inverter.constants import COMPACT_PROFILE, DEFINITIONS_PATH, FULL_PROFILE, TYPE_MAP
 
 
 logger = logging.getLogger(__name__)
@@ -22,15 +23,43 @@ class ValueType(Enum):
     COMPUTED = 'computed'
 
 
-@dataclasses.dataclass
-class InverterValue:
-    type: ValueType
+class ValueMeta(msgspec.Struct, frozen=True, gc=False):
+    """
+    Static metadata of a value that is not defined by a Parameter or DerivedValueSpec.
+    """
+
     name: str
-    value: float | str
     device_class: str  # e.g.: "voltage" / "current" / "energy" etc.
     state_class: str | None  # e.g.: "measurement" / "total" / "total_increasing" etc.
     unit: str  # e.g.: "V" / "A" / "kWh" etc.
-    result: ModbusReadResult | None
+
+
+class InverterValue(msgspec.Struct):
+    """
+    One value of a read cycle. The static metadata (name, classes and unit) are not copied into every value:
+    They are referenced from the Parameter (read out) or DerivedValueSpec (computed) of the definition.
+    """
+
+    type: ValueType
+    value: float | str
+    spec: Parameter | DerivedValueSpec | ValueMeta
+    result: ModbusReadResult | None = None
+
+    @property
+    def name(self) -> str:
+        return self.spec.name
+
+    @property
+    def device_class(self) -> str:
+        return self.spec.device_class
+
+    @property
+    def state_class(self) -> str | None:
+        return self.spec.state_class
+
+    @property
+    def unit(self) -> str:
+        return self.spec.unit
 
 
 @dataclasses.dataclass
@@ -40,24 +69,25 @@ class InverterInfo:
     serial: int
 
 
-@dataclasses.dataclass
-class RawModBusResponse:
+class RawModBusResponse(msgspec.Struct, gc=False):
     prefix: str
     data: str
 
 
-@dataclasses.dataclass
-class ModbusResponse:
+class ModbusResponse(msgspec.Struct, gc=False):
     slave_id: int
     modbus_function: int
-    data_hex: str
+    data: bytes  # The register values, without byte count and CRC
 
+    @property
+    def data_hex(self) -> str:
+        return self.data.hex()
 
-@dataclasses.dataclass
-class ModbusReadResult:
+
+class ModbusReadResult(msgspec.Struct):
     parameter: Parameter
     parsed_value: float | str
-    response: ModbusResponse = None
+    response: ModbusResponse | None = None
 
 
 @dataclasses.dataclass
@@ -70,11 +100,16 @@ class Config:
 
     inverter_name: str | None
 
+    profile: str | None = None  # Name of the read profile from the definition yaml. Default depends on "compact"
+
     socket_timeout: int = 5
 
     init_cmd: bytes = b'WIFIKIT-214028-READ'
 
     daily_production_name: str = 'Daily Production'  # Must be the same as in yaml config!
+    daily_reset_window: tuple[datetime.time, datetime.time] = (datetime.time(0, 0), datetime.time(12, 0))
+    latitude: float | None = None  # Location of the PV modules: Used to estimate the sunrise in night mode
+    longitude: float | None = None
     config_path: Path = None  # e.g.: ~/.config/inverter-connect/
 
     # Will be set by post init:
@@ -82,6 +117,9 @@ class Config:
     validation_file_path: Path = None
 
     def __post_init__(self):
+        if self.profile is None:
+            self.profile = COMPACT_PROFILE if self.compact else FULL_PROFILE
+
         if self.inverter_name:
             self.definition_file_path = DEFINITIONS_PATH / f'{self.inverter_name}.yaml'
             if not self.definition_file_path.is_file():
@@ -139,6 +177,30 @@ class Validators(msgspec.Struct):
     validators: list[ValueSpecs]
 
 
+class DerivedValueSpec(msgspec.Struct):
+    """
+    A value that will be computed from other values. Defined in the "computed" section of the definition yaml.
+    The expression references other values by name in curly brackets, e.g.: "{PV1 Voltage} * {PV1 Current}"
+    """
+
+    name: str  # e.g.: "PV1 Power" / "Total Power" etc.
+    expression: str
+    device_class: str = msgspec.field(name='class', default='')  # e.g.: "power" / "energy" etc.
+    state_class: str | None = 'measurement'
+    unit: str = msgspec.field(name='uom', default='')  # e.g.: "W" / "kWh" etc.
+    ndigits: int = 2  # Round the result to given precision in decimal digits
+
+
+class ReadProfile(msgspec.Struct):
+    """
+    A named selection of parameters. Defined in the "profiles" section of the definition yaml.
+    A parameter will be read, if its group or its name is listed.
+    """
+
+    groups: list[str] = msgspec.field(default_factory=list)  # e.g.: ["solar", "Battery"]
+    names: list[str] = msgspec.field(default_factory=list)  # e.g.: ["Running Status"]
+
+
 @dataclasses.dataclass
 class InverterRegisterVersionInfo:
     name: str
@@ -0,0 +1,235 @@
+"""
+    Validate a definition yaml file and compile it into a read plan and decoder tables.
+
+    The compiled file contains the validated yaml content and is loaded instead of the yaml file,
+    as long as the yaml file is not changed.
+"""
+from __future__ import annotations
+
+import dataclasses
+import logging
+from pathlib import Path
+
+import msgspec
+import yaml
+
+from inverter.constants import AT_READ_FUNC_NUMBER
+from inverter.data_types import DerivedValueSpec, ReadProfile
+from inverter.definitions import data2parameters, data2profiles, get_compiled_path, get_source_hash
+from inverter.derived_values import compile_expression
+from inverter.exceptions import DefinitionError
+from inverter.read_plan import make_read_plan
+from inverter.utilities.modbus_converter import get_parser
+
+
+logger = logging.getLogger(__name__)
+
+
+LINT_ERROR = 'error'
+LINT_WARNING = 'warning'
+
+
+class LookupEntry(msgspec.Struct, forbid_unknown_fields=True):
+    key: int
+    value: str
+
+
+class ParameterItem(msgspec.Struct, forbid_unknown_fields=True):
+    name: str
+    device_class: str = msgspec.field(name='class')
+    state_class: str
+    uom: str
+    scale: float
+    rule: int
+    registers: list[int]
+    icon: str = ''
+    isstr: bool = False
+    offset: int | None = None
+    lookup: list[LookupEntry] | None = None
+    validation: dict | None = None
+
+
+class ParameterGroup(msgspec.Struct, forbid_unknown_fields=True):
+    group: str
+    items: list[ParameterItem]
+
+
+class RequestRange(msgspec.Struct, forbid_unknown_fields=True):
+    start: int
+    end: int
+    mb_functioncode: int
+
+
+class DefinitionSchema(msgspec.Struct, forbid_unknown_fields=True):
+    """
+    The structure of a definition yaml file.
+    """
+
+    parameters: list[ParameterGroup]
+    requests: list[RequestRange] = msgspec.field(default_factory=list)
+    profiles: dict[str, ReadProfile] = msgspec.field(default_factory=dict)
+    computed: list[DerivedValueSpec] = msgspec.field(default_factory=list)
+
+
+@dataclasses.dataclass
+class LintIssue:
+    level: str  # LINT_ERROR or LINT_WARNING
+    message: str
+
+
+class CompiledBlock(msgspec.Struct):
+    start_register: int
+    length: int
+    names: list[str]
+
+
+class Decoder(msgspec.Struct):
+    name: str
+    start_register: int
+    length: int
+    parser: str  # Name of the parser in modbus_converter.PARSERS
+    scale: float
+    offset: int | None
+    lookup: dict[int, str] | None
+
+
+class CompiledDefinition(msgspec.Struct):
+    source_hash: str
+    definition: dict
+    read_plans: dict[str, list[CompiledBlock]]  # profile name -> read plan
+    decoders: list[Decoder]
+
+
+def lint_definition(data: dict) -> list[LintIssue]:
+    """
+    Check the structure with the schema and the content, e.g.: Overlapping registers, unknown rules etc.
+    """
+    try:
+        definition = msgspec.convert(data, type=DefinitionSchema)
+    except msgspec.ValidationError as err:
+        return [LintIssue(level=LINT_ERROR, message=f'Invalid structure: {err}')]
+
+    issues = []
+
+    def error(message):
+        issues.append(LintIssue(level=LINT_ERROR, message=message))
+
+    def warning(message):
+        issues.append(LintIssue(level=LINT_WARNING, message=message))
+
+    read_ranges = [
+        (request.start, request.end)
+        for request in definition.requests
+        if request.mb_functioncode == AT_READ_FUNC_NUMBER
+    ]
+
+    names = set()
+    groups = set()
+    register2name = {}
+    for group in definition.parameters:
+        groups.add(group.group)
+        for item in group.items:
+            name = item.name
+            if name in names:
+                error(f'Duplicate name: {name!r}')
+            names.add(name)
+
+            registers = item.registers
+            if not registers:
+                error(f'{name!r}: No registers')
+                continue
+            if registers != list(range(registers[0], registers[0] + len(registers))):
+                error(f'{name!r}: Registers are not contiguous: {", ".join(hex(register) for register in registers)}')
+
+            try:
+                get_parser(rule=item.rule, registers=len(registers))
+            except KeyError:
+                error(f'{name!r}: No parser for rule {item.rule!r} with {len(registers)} registers')
+
+            for register in registers:
+                if register in register2name:
+                    warning(f'{name!r}: Register {hex(register)} is also used by {register2name[register]!r}')
+                else:
+                    register2name[register] = name
+
+                if read_ranges and not any(start <= register <= end for start, end in read_ranges):
+                    warning(f'{name!r}: Register {hex(register)} is not in the "requests" ranges')
+
+    for profile_name, profile in definition.profiles.items():
+        for group in profile.groups:
+            if group not in groups:
+                error(f'Profile {profile_name!r}: Unknown group {group!r}')
+        for name in profile.names:
+            if name not in names:
+                error(f'Profile {profile_name!r}: Unknown name {name!r}')
+
+    for spec in definition.computed:
+        if spec.name in names:
+            error(f'Computed {spec.name!r}: Name is already used')
+        try:
+            input_names, _ = compile_expression(spec.expression)
+        except DefinitionError as err:
+            error(f'Computed {spec.name!r}: {err}')
+            continue
+        for input_name in input_names:
+            if input_name not in names:
+                error(f'Computed {spec.name!r}: Unknown input {input_name!r}')
+        names.add(spec.name)
+
+    return issues
+
+
+def compile_definition(definition_file_path: Path) -> tuple[CompiledDefinition | None, list[LintIssue]]:
+    """
+    Returns the compiled definition, or None if the definition has errors.
+    """
+    content = definition_file_path.read_bytes()
+    try:
+        data = yaml.safe_load(content)
+    except yaml.YAMLError as err:
+        return None, [LintIssue(level=LINT_ERROR, message=f'Invalid YAML: {err}')]
+
+    issues = lint_definition(data)
+    if any(issue.level == LINT_ERROR for issue in issues):
+        return None, issues
+
+    read_plans = {}
+    for profile_name, profile in data2profiles(data).items():
+        parameters = data2parameters(data['parameters'], profile=profile)
+        read_plans[profile_name] = [
+            CompiledBlock(
+                start_register=block.start_register,
+                length=block.length,
+                names=[parameter.name for parameter in block.parameters],
+            )
+            for block in make_read_plan(parameters)
+        ]
+
+    full_profile = ReadProfile(groups=[group_data['group'] for group_data in data['parameters']])
+    decoders = [
+        Decoder(
+            name=parameter.name,
+            start_register=parameter.start_register,
+            length=parameter.length,
+            parser=parameter.parser.__name__,
+            scale=parameter.scale,
+            offset=parameter.offset,
+            lookup=parameter.lookup,
+        )
+        for parameter in data2parameters(data['parameters'], profile=full_profile)
+    ]
+
+    compiled = CompiledDefinition(
+        source_hash=get_source_hash(content),
+        definition=data,
+        read_plans=read_plans,
+        decoders=decoders,
+    )
+    return compiled, issues
+
+
+def write_compiled_definition(*, definition_file_path: Path, compiled: CompiledDefinition) -> Path:
+    compiled_path = get_compiled_path(definition_file_path)
+    compiled_path.write_bytes(msgspec.json.format(msgspec.json.encode(compiled), indent=2))
+    logger.info('Compiled definition written to: %s', compiled_path)
+    return compiled_path
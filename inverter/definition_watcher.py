@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import logging
+
+import msgspec
+import yaml
+from rich import print  # noqa
+
+from inverter.api import InverterDefinitions, load_definitions
+from inverter.data_types import Config
+
+
+logger = logging.getLogger(__name__)
+
+
+class DefinitionWatcher:
+    """
+    Reload the definition and validation yaml files, if they are changed (cheap mtime polling).
+
+    Call get_definitions() between two cycles: The compiled definitions are swapped as a whole.
+    If the changed files are invalid, the last working definitions will be used.
+    """
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.paths = (config.definition_file_path, config.validation_file_path)
+        self.mtimes = self.get_mtimes()
+        self.definitions: InverterDefinitions = load_definitions(config)
+
+    def get_mtimes(self) -> tuple[int, ...]:
+        return tuple(path.stat().st_mtime_ns for path in self.paths)
+
+    def get_definitions(self) -> InverterDefinitions:
+        try:
+            mtimes = self.get_mtimes()
+        except OSError as err:
+            logger.warning('Can not check the definition files: %s', err)
+            return self.definitions
+
+        if mtimes != self.mtimes:
+            self.mtimes = mtimes
+            try:
+                definitions = load_definitions(self.config)
+            except (OSError, yaml.YAMLError, msgspec.MsgspecError, KeyError, TypeError, ValueError) as err:
+                print(f'[red]Reload definitions failed: {err} (The last definitions will be used)')
+            else:
+                print(f'[green]Definitions reloaded from: {", ".join(str(path) for path in self.paths)}')
+                self.definitions = definitions
+
+        return self.definitions
@@ -1,36 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 from collections.abc import Iterable
+from pathlib import Path
 
+import msgspec
 import yaml
 from bx_py_utils.dict_utils import pluck
 from bx_py_utils.path import assert_is_file
 
-from inverter.constants import DEFINITIONS_PATH
-from inverter.data_types import Config, Parameter
-from inverter.utilities.modbus_converter import (
-    debug_converter,
-    parse_number,
-    parse_string,
-    parse_swapped_number,
-    parse_version_string,
-)
+from inverter.constants import DEFINITIONS_PATH, FULL_PROFILE
+from inverter.data_types import Config, DerivedValueSpec, Parameter, ReadProfile
+from inverter.utilities.modbus_converter import debug_converter, get_parser
 
 
 logger = logging.getLogger(__name__)
 
 
-RULE2CONVERTER = {
-    1: parse_number,
-    2: parse_number,
-    3: parse_swapped_number,
-    5: parse_string,
-    7: parse_version_string,
-    # TODO: 8: parse_datetime,
-}
-
-
 def get_definition_names() -> list[str]:
     names = []
     for item in DEFINITIONS_PATH.glob('*.yaml'):
@@ -41,14 +28,86 @@ def get_definition_names() -> list[str]:
     return names
 
 
-def get_definition(*, config: Config):
-    definition_file_path = config.definition_file_path
+COMPILED_SUFFIX = '.compiled.json'  # Precompiled definition, created by the "compile-definition" command
+
+
+class CompiledDefinitionData(msgspec.Struct):
+    source_hash: str  # SHA256 of the yaml file content: The compiled file is ignored, if the yaml file is changed
+    definition: dict  # The validated content of the yaml file
+
+
+def get_compiled_path(definition_file_path: Path) -> Path:
+    """
+    >>> get_compiled_path(Path('/foo/deye_2mppt.yaml'))
+    PosixPath('/foo/deye_2mppt.compiled.json')
+    """
+    return definition_file_path.with_suffix(COMPILED_SUFFIX)
+
+
+def get_source_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_definition_file(definition_file_path: Path) -> dict:
+    """
+    Load the definition yaml file, or the precompiled file, if it's up-to-date.
+    """
     assert_is_file(definition_file_path)
-    content = definition_file_path.read_text(encoding='UTF-8')
-    data = yaml.safe_load(content)
+    content = definition_file_path.read_bytes()
+
+    compiled_path = get_compiled_path(definition_file_path)
+    if compiled_path.is_file():
+        try:
+            compiled = msgspec.json.decode(compiled_path.read_bytes(), type=CompiledDefinitionData)
+        except msgspec.MsgspecError as err:
+            logger.warning('Ignore invalid compiled definition %s: %s', compiled_path, err)
+        else:
+            if compiled.source_hash == get_source_hash(content):
+                return compiled.definition
+            logger.info('Ignore outdated compiled definition: %s', compiled_path)
+
+    return yaml.safe_load(content)
+
+
+def get_definition_data(*, config: Config) -> dict:
+    return load_definition_file(config.definition_file_path)
+
+
+def get_definition(*, config: Config):
+    data = get_definition_data(config=config)
     return data['parameters']
 
 
+def get_derived_specs(*, config: Config) -> list[DerivedValueSpec]:
+    data = get_definition_data(config=config)
+    return msgspec.convert(data.get('computed', []), type=list[DerivedValueSpec])
+
+
+def get_profiles(*, config: Config) -> dict[str, ReadProfile]:
+    """
+    Returns all read profiles of the definition. The "full" profile (all parameters) always exists.
+    """
+    return data2profiles(get_definition_data(config=config))
+
+
+def data2profiles(data: dict) -> dict[str, ReadProfile]:
+    profiles = msgspec.convert(data.get('profiles', {}), type=dict[str, ReadProfile])
+    if FULL_PROFILE not in profiles:
+        profiles[FULL_PROFILE] = ReadProfile(groups=[group_data['group'] for group_data in data['parameters']])
+    return profiles
+
+
+def get_profile(*, config: Config) -> ReadProfile:
+    profiles = get_profiles(config=config)
+    try:
+        return profiles[config.profile]
+    except KeyError:
+        raise KeyError(
+            f'Unknown read profile {config.profile!r} for {config.inverter_name!r}'
+            f' (Possible profiles: {", ".join(sorted(profiles))})'
+        ) from None
+
+
 def convert_lookup(raw_lookup: list):
     """
     >>> convert_lookup([{'key': 2, 'value': 'Normal'},{'key': 3, 'value': 'Warning'}])
@@ -58,14 +117,20 @@ def convert_lookup(raw_lookup: list):
 
 
 def get_parameter(*, config: Config) -> Iterable[Parameter]:
-    data = get_definition(config=config)
+    """
+    Returns all parameters of the read profile, in the order of the definition.
+    """
+    return data2parameters(get_definition(config=config), profile=get_profile(config=config))
+
+
+def data2parameters(data: list[dict], *, profile: ReadProfile) -> list[Parameter]:
     parameters = []
     for group_data in data:
         group_name = group_data['group']
-        if config.compact and group_name not in 'solar':
-            # compact profile only shows data from yaml.config group solar
-            continue
         for item in group_data['items']:
+            if group_name not in profile.groups and item['name'] not in profile.names:
+                continue
+
             # example = {
             #     'name': 'PV1 Voltage',
             #     'class': 'voltage',
@@ -84,9 +149,9 @@ def get_parameter(*, config: Config) -> Iterable[Parameter]:
                 lookup = convert_lookup(lookup)
 
             try:
-                converter_func = RULE2CONVERTER[rule]
+                converter_func = get_parser(rule=rule, registers=len(registers))
             except KeyError:
-                logger.error('No rule converter for: %r', rule)
+                logger.error('No rule converter for: %r with %i registers', rule, len(registers))
                 converter_func = debug_converter
 
             parameter = Parameter(
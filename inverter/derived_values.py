@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import ast
+import logging
+import re
+from collections.abc import Iterable
+from typing import Callable
+
+from rich import print  # noqa
+
+from inverter.data_types import DerivedValueSpec, InverterValue, ValueType
+from inverter.exceptions import DefinitionError
+
+
+logger = logging.getLogger(__name__)
+
+
+NAME_REFERENCE_RE = re.compile(r'\{([^{}]+)\}')
+
+
+def div(dividend, divisor, default=0):
+    """
+    Division that returns the default value instead of raising ZeroDivisionError, e.g. at night ;)
+
+    >>> div(10, 4)
+    2.5
+    >>> div(10, 0)
+    0
+    """
+    if not divisor:
+        return default
+    return dividend / divisor
+
+
+EXPRESSION_FUNCTIONS = {
+    'abs': abs,
+    'min': min,
+    'max': max,
+    'round': round,
+    'div': div,
+}
+ALLOWED_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.Add,
+    ast.Sub,
+    ast.Mult,
+    ast.Div,
+    ast.FloorDiv,
+    ast.Mod,
+    ast.Pow,
+    ast.USub,
+    ast.UAdd,
+    ast.Constant,
+    ast.Name,
+    ast.Load,
+    ast.Call,
+)
+
+
+def get_input_names(expression: str) -> list[str]:
+    """
+    >>> get_input_names('{PV1 Voltage} * {PV1 Current}')
+    ['PV1 Voltage', 'PV1 Current']
+    >>> get_input_names('{PV1 Power} + {PV2 Power} + {PV1 Power}')
+    ['PV1 Power', 'PV2 Power']
+    """
+    names = []
+    for name in NAME_REFERENCE_RE.findall(expression):
+        if name not in names:
+            names.append(name)
+    return names
+
+
+def compile_expression(expression: str) -> tuple[list[str], Callable]:
+    """
+    Compile the expression into a function that accepts the input values as positional arguments.
+
+    >>> input_names, func = compile_expression('round({PV1 Voltage} * {PV1 Current}, 1)')
+    >>> input_names
+    ['PV1 Voltage', 'PV1 Current']
+    >>> func(30.5, 1.1)
+    33.6
+    >>> compile_expression('__import__("os")')
+    Traceback (most recent call last):
+        ...
+    inverter.exceptions.DefinitionError: Function '__import__' not allowed in: '__import__("os")'
+    """
+    input_names = get_input_names(expression)
+    arg_names = [f'v{no}' for no in range(len(input_names))]
+    name2arg = dict(zip(input_names, arg_names))
+    source = NAME_REFERENCE_RE.sub(lambda match: name2arg[match.group(1)], expression)
+
+    try:
+        tree = ast.parse(source, mode='eval')
+    except SyntaxError as err:
+        raise DefinitionError(f'Invalid expression {expression!r}: {err}')
+
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise DefinitionError(f'{node.__class__.__name__} not allowed in: {expression!r}')
+        if isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in EXPRESSION_FUNCTIONS:
+                raise DefinitionError(f'Function {ast.unparse(node.func)!r} not allowed in: {expression!r}')
+        elif isinstance(node, ast.Name):
+            if node.id not in arg_names and node.id not in EXPRESSION_FUNCTIONS:
+                raise DefinitionError(f'Unknown name {node.id!r} in: {expression!r}')
+
+    code = compile(f'lambda {", ".join(arg_names)}: {source}', filename=f'<{expression}>', mode='eval')
+    func = eval(code, {'__builtins__': {}, **EXPRESSION_FUNCTIONS})
+    return input_names, func
+
+
+class DerivedValue:
+    def __init__(self, spec: DerivedValueSpec):
+        self.spec = spec
+        self.input_names, self.func = compile_expression(spec.expression)
+
+        self.last = (None, None)  # inputs + value: One tuple, because the definitions are shared between threads
+
+    def compute(self, inputs: tuple):
+        last_inputs, last_value = self.last
+        if inputs == last_inputs:
+            return last_value
+
+        value = self.func(*inputs)
+        if isinstance(value, float):
+            value = round(value, self.spec.ndigits)
+        self.last = (inputs, value)
+        return value
+
+    def __repr__(self):
+        return f'<DerivedValue {self.spec.name!r} = {self.spec.expression!r}>'
+
+
+class DerivedValues:
+    """
+    Compute the values from the "computed" section of the definition yaml.
+
+    The expressions are compiled once and sorted by their dependencies.
+    Only values whose inputs are changed since the last cycle will be recomputed.
+    """
+
+    def __init__(self, *, specs: list[DerivedValueSpec], available_names: Iterable[str]):
+        available_names = set(available_names)
+
+        derived_values = {}
+        for spec in specs:
+            if spec.name in available_names:
+                logger.warning('Skip computed %r: There is a read out value with the same name', spec.name)
+                continue
+            if spec.name in derived_values:
+                raise DefinitionError(f'Computed value {spec.name!r} is defined more than once')
+            derived_values[spec.name] = DerivedValue(spec)
+
+        self.derived_values = self._sort(derived_values=derived_values, available_names=available_names)
+
+    @staticmethod
+    def _sort(*, derived_values: dict, available_names: set) -> list[DerivedValue]:
+        """
+        Sort by dependencies and skip all values with missing inputs
+        """
+        result = []
+        known_names = set(available_names)
+        pending = list(derived_values.values())
+        while pending:
+            still_pending = []
+            for derived_value in pending:
+                if all(name in known_names for name in derived_value.input_names):
+                    result.append(derived_value)
+                    known_names.add(derived_value.spec.name)
+                else:
+                    still_pending.append(derived_value)
+
+            if len(still_pending) == len(pending):
+                for derived_value in still_pending:
+                    missing = [name for name in derived_value.input_names if name not in known_names]
+                    if any(name in derived_values for name in missing):
+                        raise DefinitionError(f'Circular or unresolvable dependency: {derived_value} needs {missing}')
+                    logger.info('Skip computed %r: Missing %s', derived_value.spec.name, missing)
+                break
+            pending = still_pending
+        return result
+
+    @property
+    def names(self) -> list[str]:
+        return [derived_value.spec.name for derived_value in self.derived_values]
+
+    def __call__(self, values: dict[str, InverterValue]) -> Iterable[InverterValue]:
+        computed = {}
+        for derived_value in self.derived_values:
+            try:
+                inputs = tuple(
+                    computed[name] if name in computed else values[name].value for name in derived_value.input_names
+                )
+            except KeyError:
+                # A input value is missing in this cycle
+                continue
+
+            try:
+                value = derived_value.compute(inputs)
+            except (TypeError, ValueError, ArithmeticError) as err:
+                print(f'[red]Error calculate {derived_value}: {inputs=!r}: {err}')
+                continue
+
+            computed[derived_value.spec.name] = value
+            yield InverterValue(type=ValueType.COMPUTED, value=value, spec=derived_value.spec)
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import logging
+import socket
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from rich import print  # noqa
+
+from inverter.connection import parse_inverter_info
+from inverter.data_types import Config, InverterInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+BROADCAST_ADDRESS = '255.255.255.255'
+DISCOVERY_TIMEOUT = 3  # in seconds: How long to wait for answers of logger sticks
+DISCOVERY_CACHE_FILE_NAME = 'discovered_loggers.json'
+
+
+def discover_loggers(
+    *,
+    port: int,
+    init_cmd: bytes = b'WIFIKIT-214028-READ',
+    targets: Iterable[str] = (BROADCAST_ADDRESS,),
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> list[InverterInfo]:
+    """
+    Send the init command handshake to all targets (broadcast or unicast addresses)
+    and collect all answers of logger sticks until the timeout is reached.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+    try:
+        for target in targets:
+            logger.info('Send discovery to %s:%i', target, port)
+            try:
+                sock.sendto(init_cmd, (target, port))
+            except OSError as err:
+                print(f'[red]Discovery to {target}:{port} failed: {err}')
+
+        serial2info = {}
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            sock.settimeout(remaining)
+            try:
+                data, address = sock.recvfrom(1024)
+            except (TimeoutError, socket.timeout):
+                break
+            try:
+                inverter_info = parse_inverter_info(data)
+            except (IndexError, ValueError) as err:
+                logger.warning('Ignore unexpected discovery answer %r from %s: %s', data, address, err)
+                continue
+
+            logger.info('Logger stick found: %s', inverter_info)
+            serial2info[inverter_info.serial] = inverter_info
+    finally:
+        sock.close()
+
+    return sorted(serial2info.values(), key=lambda info: info.serial)
+
+
+class DiscoveryCache:
+    """
+    Store the last known IP address of all discovered logger sticks by serial number on disk.
+    """
+
+    def __init__(self, *, cache_path: Path):
+        self.cache_path = cache_path
+        self.lock = threading.Lock()
+        try:
+            self.data = json.loads(cache_path.read_text(encoding='UTF-8'))
+        except FileNotFoundError:
+            self.data = {}
+        except (OSError, ValueError) as err:
+            logger.warning('Ignore discovery cache %s: %s', cache_path, err)
+            self.data = {}
+
+    def get_ip(self, *, serial: int) -> str | None:
+        with self.lock:
+            entry = self.data.get(str(serial))
+        if entry:
+            return entry['ip']
+        return None
+
+    def get_serial(self, *, ip: str) -> int | None:
+        with self.lock:
+            for serial, entry in self.data.items():
+                if entry['ip'] == ip:
+                    return int(serial)
+        return None
+
+    def update(self, inverter_infos: Iterable[InverterInfo]) -> None:
+        with self.lock:
+            for inverter_info in inverter_infos:
+                self.data[str(inverter_info.serial)] = dict(
+                    ip=inverter_info.ip,
+                    mac=inverter_info.mac,
+                    last_seen=time.time(),
+                )
+
+    def save(self) -> None:
+        with self.lock:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix('.tmp')
+            temp_path.write_text(json.dumps(self.data, indent=4), encoding='UTF-8')
+            temp_path.replace(self.cache_path)
+        logger.info('Discovery cache saved to %s', self.cache_path)
+
+
+def rediscover_host(
+    *,
+    config: Config,
+    serial: int | None,
+    cache: DiscoveryCache | None = None,
+    targets: Iterable[str] = (BROADCAST_ADDRESS,),
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> bool:
+    """
+    Search the logger stick with the given serial number and change `config.host`,
+    if the logger stick has a new IP address (e.g.: DHCP assigned a new one).
+    Returns True if `config.host` was changed.
+    """
+    if serial is None and cache is not None:
+        serial = cache.get_serial(ip=config.host)
+    if serial is None:
+        print(f'[yellow]Serial number of {config.host} is unknown: Can not search for a new IP address.')
+        return False
+
+    print(f'Search logger stick with serial {serial}', end='...')
+    inverter_infos = discover_loggers(port=config.port, init_cmd=config.init_cmd, targets=targets, timeout=timeout)
+    if cache is not None and inverter_infos:
+        cache.update(inverter_infos)
+        cache.save()
+
+    for inverter_info in inverter_infos:
+        if inverter_info.serial == serial:
+            if inverter_info.ip == config.host:
+                print(f'found with same IP {config.host}')
+                return False
+
+            print(f'[yellow]IP changed from {config.host} to {inverter_info.ip}')
+            config.host = inverter_info.ip
+            return True
+
+    print(f'[red]not found (checked {len(inverter_infos)} logger sticks)')
+    return False
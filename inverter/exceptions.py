@@ -27,9 +27,31 @@ class ReadTimeout(ReadInverterError):
     pass
 
 
+class WriteVerificationError(ReadInverterError):
+    """
+    The read back register values are not the written values.
+    """
+
+    def __init__(self, mismatches: dict):
+        self.mismatches = mismatches  # register -> (expected value, read back value)
+        infos = [
+            f'{hex(register)}={actual!r} (expected: {expected!r})'
+            for register, (expected, actual) in mismatches.items()
+        ]
+        super().__init__(f'Write not applied: {", ".join(infos)}')
+
+
 class ValidationError(AssertionError):
     """
     A readed inverter value is not valid.
     """
 
     pass
+
+
+class DefinitionError(ValueError):
+    """
+    The inverter definition yaml contains invalid data.
+    """
+
+    pass
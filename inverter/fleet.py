@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import dataclasses
+import ipaddress
+import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from rich import print  # noqa
+
+from inverter.api import INVERTER_VERSION_INFOS, fetch_inverter_versions
+from inverter.connection import InverterSock
+from inverter.data_types import Config, InverterInfo, InverterRegisterVersionResult
+from inverter.exceptions import ReadInverterError
+
+
+logger = logging.getLogger(__name__)
+
+
+def expand_hosts(values: Iterable[str]) -> list[str]:
+    """
+    Expand comma separated lists and networks in CIDR notation into single hosts.
+
+    >>> expand_hosts(['192.168.1.10,192.168.1.11', 'inverter.local'])
+    ['192.168.1.10', '192.168.1.11', 'inverter.local']
+    >>> expand_hosts(['10.0.0.0/30', '10.0.0.2'])
+    ['10.0.0.1', '10.0.0.2']
+    """
+    hosts = []
+    for value in values:
+        for item in value.split(','):
+            item = item.strip()
+            if not item:
+                continue
+            if '/' in item:
+                network = ipaddress.ip_network(item, strict=False)
+                items = [str(host) for host in network.hosts()]
+            else:
+                items = [item]
+
+            for host in items:
+                if host not in hosts:
+                    hosts.append(host)
+    return hosts
+
+
+@dataclasses.dataclass
+class FleetInventoryResult:
+    host: str
+    inverter_info: InverterInfo | None
+    versions: list[InverterRegisterVersionResult]
+    error: str | None = None
+
+    def as_dict(self) -> dict:
+        return dict(
+            host=self.host,
+            ip=self.inverter_info.ip if self.inverter_info else None,
+            mac=self.inverter_info.mac if self.inverter_info else None,
+            serial=self.inverter_info.serial if self.inverter_info else None,
+            versions={result.info.name: str(result.version) for result in self.versions},
+            error=self.error,
+        )
+
+
+def fetch_inventory(config: Config) -> FleetInventoryResult:
+    inv_sock = InverterSock(config)
+    try:
+        with inv_sock:
+            inv_sock.connect_once()  # No retries: A sweep over a network should skip dead addresses fast
+            versions = fetch_inverter_versions(inv_sock=inv_sock, infos=INVERTER_VERSION_INFOS, verbose=False)
+    except ReadInverterError as err:
+        return FleetInventoryResult(
+            host=config.host, inverter_info=inv_sock.inverter_info, versions=[], error=str(err)
+        )
+
+    return FleetInventoryResult(host=config.host, inverter_info=inv_sock.inverter_info, versions=versions)
+
+
+def fleet_inventory(*, configs: list[Config], max_workers: int = 16) -> list[FleetInventoryResult]:
+    """
+    Handshake with all logger sticks and fetch the inverter versions in parallel.
+    Returns the results in the same order as the given configs.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='FleetInventory') as executor:
+        future2index = {executor.submit(fetch_inventory, config): index for index, config in enumerate(configs)}
+        results = [None] * len(configs)
+        for future in as_completed(future2index):
+            result: FleetInventoryResult = future.result()
+            if result.error:
+                print(f'[yellow]{result.host}', end=',')
+            else:
+                print(f'[green]{result.host}', end=',')
+            results[future2index[future]] = result
+    print()
+    return results
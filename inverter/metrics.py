@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from rich import print  # noqa
+
+from inverter.constants import ERROR_STR_NO_DATA
+from inverter.data_types import InverterInfo, InverterValue
+
+
+logger = logging.getLogger(__name__)
+
+
+METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+METRIC_PREFIX = 'inverter'
+
+
+def metric_name(name: str) -> str:
+    """
+    Convert a value name into a Prometheus metric name.
+
+    >>> metric_name('PV1 Voltage')
+    'inverter_pv1_voltage'
+    >>> metric_name('Total AC Output Power (Active)')
+    'inverter_total_ac_output_power_active'
+    """
+    slug = re.sub(r'[^a-z0-9]+', '_', name.lower()).strip('_')
+    return f'{METRIC_PREFIX}_{slug}'
+
+
+def format_labels(labels: dict) -> str:
+    """
+    >>> format_labels({'unit': 'W', 'name': 'Say "Hello"'})
+    '{unit="W",name="Say \\\\"Hello\\\\""}'
+    >>> format_labels({})
+    ''
+    """
+    if not labels:
+        return ''
+    items = []
+    for key, value in labels.items():
+        value = str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+        items.append(f'{key}="{value}"')
+    return '{' + ','.join(items) + '}'
+
+
+class MetricsSnapshot:
+    """
+    Holds the last known inverter values and the health of the publish loop in memory.
+
+    The text exposition is rendered only if something has changed,
+    so a scrape never triggers inverter I/O and frequent scrapes are cheap.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.start_time = time.monotonic()
+        self.values: dict[str, InverterValue] = {}
+        self.inverter_info: InverterInfo | None = None
+        self.health: dict[str, tuple[str, str, float]] = {}  # name -> (type, help, value)
+        self.rendered: bytes | None = None
+
+    def set_value(self, value: InverterValue) -> None:
+        with self.lock:
+            if value.value == ERROR_STR_NO_DATA:
+                self.values.pop(value.name, None)
+            else:
+                self.values[value.name] = value
+            self.rendered = None
+
+    def set_inverter_info(self, inverter_info: InverterInfo) -> None:
+        with self.lock:
+            self.inverter_info = inverter_info
+            self.rendered = None
+
+    def set_gauge(self, name: str, value: float, help: str) -> None:
+        with self.lock:
+            self.health[name] = ('gauge', help, value)
+            self.rendered = None
+
+    def inc_counter(self, name: str, help: str, amount: float = 1) -> None:
+        with self.lock:
+            _, _, value = self.health.get(name, (None, None, 0))
+            self.health[name] = ('counter', help, value + amount)
+            self.rendered = None
+
+    def cycle_done(self, *, duration: float, success: bool) -> None:
+        self.inc_counter(f'{METRIC_PREFIX}_loop_cycles_total', help='Number of publish loop cycles')
+        if success:
+            self.set_gauge(
+                f'{METRIC_PREFIX}_loop_last_success_timestamp_seconds',
+                value=time.time(),
+                help='Unix time of the last successful publish loop cycle',
+            )
+        else:
+            self.inc_counter(f'{METRIC_PREFIX}_loop_errors_total', help='Number of failed publish loop cycles')
+        self.set_gauge(
+            f'{METRIC_PREFIX}_loop_last_cycle_duration_seconds',
+            value=duration,
+            help='Duration of the last publish loop cycle',
+        )
+        self.set_gauge(
+            f'{METRIC_PREFIX}_loop_running_seconds',
+            value=time.monotonic() - self.start_time,
+            help='Running time of the publish loop',
+        )
+
+    def _render(self) -> bytes:
+        lines = []
+        if self.inverter_info:
+            name = f'{METRIC_PREFIX}_logger_info'
+            labels = dict(ip=self.inverter_info.ip, mac=self.inverter_info.mac, serial=self.inverter_info.serial)
+            lines.append(f'# HELP {name} Information about the logger stick')
+            lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name}{format_labels(labels)} 1')
+
+        for value in self.values.values():
+            labels = dict(
+                group=value.result.parameter.group if value.result else value.type.value,
+                device_class=value.device_class,
+                unit=value.unit,
+            )
+            name = metric_name(value.name)
+            if isinstance(value.value, (int, float)):
+                sample = float(value.value)
+            else:
+                # e.g.: "Standby" / Version: Use the Prometheus "info" pattern:
+                name = f'{name}_info'
+                labels['value'] = value.value
+                sample = 1
+            lines.append(f'# HELP {name} {value.name}')
+            lines.append(f'# TYPE {name} gauge')
+            lines.append(f'{name}{format_labels(labels)} {sample}')
+
+        for name, (metric_type, help, sample) in self.health.items():
+            lines.append(f'# HELP {name} {help}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            lines.append(f'{name} {float(sample)}')
+
+        lines.append('')
+        return '\n'.join(lines).encode('utf-8')
+
+    def render(self) -> bytes:
+        with self.lock:
+            if self.rendered is None:
+                self.rendered = self._render()
+            return self.rendered
+
+
+class MetricsRequestHandler(BaseHTTPRequestHandler):
+    server: MetricsServer
+
+    def do_GET(self):
+        if self.path.partition('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+
+        body = self.server.snapshot.render()
+        self.send_response(200)
+        self.send_header('Content-Type', METRICS_CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug('%s - %s', self.address_string(), format % args)
+
+
+class MetricsServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, server_address: tuple[str, int], snapshot: MetricsSnapshot):
+        super().__init__(server_address, MetricsRequestHandler)
+        self.snapshot = snapshot
+
+
+def start_metrics_server(*, snapshot: MetricsSnapshot, host: str, port: int) -> MetricsServer:
+    """
+    Serve the metrics snapshot via HTTP in a background thread.
+    """
+    server = MetricsServer((host, port), snapshot)
+    thread = threading.Thread(target=server.serve_forever, name='MetricsServer', daemon=True)
+    thread.start()
+    print(f'Serve Prometheus metrics on: http://{host or "0.0.0.0"}:{server.server_port}/metrics')
+    return server
@@ -0,0 +1,108 @@
+"""
+    Publish the MQTT messages of many devices in batches via one connection.
+
+    All messages of a cycle are queued and send together with QoS 0 at the end of the cycle:
+    There is no acknowledge round-trip per message and paho can write them back-to-back to the socket.
+    A state topic that is published more than once in a cycle is send only once, with the last payload.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import time
+
+from ha_services.mqtt4homeassistant.data_classes import MqttSettings
+from rich import print  # noqa
+from rich.pretty import pprint
+
+from inverter.publish_loop import InverterMqttPublisher
+
+
+logger = logging.getLogger(__name__)
+
+
+MQTT_BATCH_QOS = 0
+MQTT_MAX_PENDING = 1000  # Send the queued messages earlier, if there are more of them
+MQTT_FLUSH_TIMEOUT = 10  # Max. seconds to wait until all messages of a batch are written to the socket
+
+
+@dataclasses.dataclass
+class PublishStats:
+    batches: int = 0
+    messages: int = 0  # Send messages in all batches
+    skipped: int = 0  # Messages replaced by a newer message for the same topic, before they are send
+    errors: int = 0  # Messages that are not send, e.g.: Not connected to the broker
+    queue_depth: int = 0  # Messages in the last batch
+    max_queue_depth: int = 0
+    latency: float = 0  # Seconds to send the last batch
+    max_latency: float = 0
+
+    def __str__(self):
+        return (
+            f'{self.queue_depth} MQTT messages in {self.latency:.3f} sec.'
+            f' (max. {self.max_queue_depth} in {self.max_latency:.3f} sec.)'
+        )
+
+
+class BatchMqttPublisher(InverterMqttPublisher):
+    """
+    Queue all messages and send them with `flush()`, e.g.: once per read cycle for all inverters.
+    """
+
+    def __init__(self, settings: MqttSettings, verbosity: int = 0, max_pending: int = MQTT_MAX_PENDING):
+        super().__init__(settings=settings, verbosity=verbosity)
+        self.max_pending = max_pending
+        self.pending = {}  # topic -> (payload, retain)
+        self.stats = PublishStats()
+
+    def publish(self, *, topic: str, payload: dict) -> None:
+        if self.verbosity > 1:
+            print(f'[yellow]Queue MQTT topic: [blue]{topic}')
+            pprint(payload)
+        self.send(topic=topic, payload=json.dumps(payload))
+
+    def send(self, *, topic: str, payload: str, retain: bool = False) -> None:
+        # Re-insert to keep the order: e.g. the availability after the state of a device
+        if self.pending.pop(topic, None) is not None:
+            self.stats.skipped += 1
+        self.pending[topic] = (payload, retain)
+
+        if len(self.pending) >= self.max_pending:
+            self.flush()
+
+    def flush(self, timeout: float = MQTT_FLUSH_TIMEOUT) -> PublishStats:
+        """
+        Send all queued messages and wait until they are written to the socket.
+        """
+        if not self.pending:
+            self.stats.queue_depth = 0
+            self.stats.latency = 0
+            return self.stats
+
+        start_time = time.monotonic()
+        pending, self.pending = self.pending, {}
+        infos = [
+            self.mqttc.publish(topic=topic, payload=payload, qos=MQTT_BATCH_QOS, retain=retain)
+            for topic, (payload, retain) in pending.items()
+        ]
+        deadline = start_time + timeout
+        errors = 0
+        for info in infos:
+            try:
+                info.wait_for_publish(timeout=max(deadline - time.monotonic(), 0))
+            except (ValueError, RuntimeError) as err:
+                logger.warning('MQTT publish error: %s', err)
+                errors += 1
+
+        stats = self.stats
+        stats.batches += 1
+        stats.messages += len(infos) - errors
+        stats.errors += errors
+        stats.queue_depth = len(infos)
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        stats.latency = time.monotonic() - start_time
+        stats.max_latency = max(stats.max_latency, stats.latency)
+
+        logger.info('Flushed %s', stats)
+        return stats
@@ -0,0 +1,388 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from cli_base.cli_tools.rich_utils import human_error
+from rich import print  # noqa
+
+from inverter.api import Inverter, InverterDefinitions, load_definitions
+from inverter.connection import InverterSock
+from inverter.data_types import Config, InverterInfo, InverterValue
+from inverter.exceptions import ReadInverterError
+from inverter.mqtt_batch import BatchMqttPublisher
+from inverter.parse_pool import (
+    PARSE_BATCH_SIZE,
+    ParsedSite,
+    RawSiteReplies,
+    get_definitions_key,
+    parse_batch,
+    parsed2values,
+)
+from inverter.publish_loop import (
+    InverterMqttPublisher,
+    get_loop_running_time_value,
+    inverter_value2ha_value,
+    publish_values,
+)
+from inverter.site_aggregate import publish_site_values
+
+
+logger = logging.getLogger(__name__)
+
+
+SITE_MAX_WORKERS = 16  # Max. number of inverters that will be read in parallel
+SITE_DEADLINE = 30  # Max. seconds to read all values of one inverter
+SITE_CYCLE_TIME = 60  # Seconds between the start of two cycles: Running reads are cancelled after this time
+
+
+@dataclasses.dataclass
+class SiteResult:
+    host: str
+    inverter_info: InverterInfo | None = None
+    values: list[InverterValue] = dataclasses.field(default_factory=list)
+    error: str | None = None
+    timed_out: bool = False  # Deadline exceeded: The values are incomplete
+    duration: float = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.error is None and not self.timed_out
+
+
+class SiteReader:
+    """
+    Read all values of one inverter in a worker thread.
+
+    The blocking socket can't be interrupted: The deadline and the cancel event are checked after
+    every read value, so a running read stops at the latest after one socket timeout (plus retries).
+    """
+
+    def __init__(self, *, config: Config, definitions: InverterDefinitions):
+        self.config = config
+        self.definitions = definitions
+        self.cancel_event = threading.Event()
+        self.future: Future | None = None
+
+    @property
+    def busy(self) -> bool:
+        return self.future is not None and not self.future.done()
+
+    def cancel(self) -> None:
+        self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()  # Only possible, if the read is not started yet
+
+    def read(self, deadline: float) -> SiteResult:
+        start_time = time.monotonic()
+        result = SiteResult(host=self.config.host)
+        inv_sock = InverterSock(self.config)
+        try:
+            with Inverter(config=self.config, inv_sock=inv_sock, definitions=self.definitions) as inverter:
+                inverter.connect()
+                result.inverter_info = inv_sock.inverter_info
+                for value in inverter:
+                    result.values.append(value)
+                    if self.cancel_event.is_set() or time.monotonic() > deadline:
+                        logger.warning('%s: Deadline exceeded after %i values', self.config.host, len(result.values))
+                        result.timed_out = True
+                        break
+        except ReadInverterError as err:
+            result.error = str(err)
+        except Exception as err:
+            logger.exception('Unexpected error from %s: %s', self.config.host, err)
+            result.error = str(err)
+        result.duration = time.monotonic() - start_time
+        return result
+
+    def read_raw(self, deadline: float) -> RawSiteReplies:
+        """
+        Only send the read commands and collect the raw replies: They will be parsed in a worker process.
+        """
+        start_time = time.monotonic()
+        result = RawSiteReplies(config=self.config)
+        inv_sock = InverterSock(self.config)
+        try:
+            with inv_sock:
+                inv_sock.connect()
+                result.inverter_info = inv_sock.inverter_info
+                for block in self.definitions.read_plan:
+                    result.replies.append(inv_sock.read_block_raw(block=block))
+                    if self.cancel_event.is_set() or time.monotonic() > deadline:
+                        logger.warning('%s: Deadline exceeded after %i replies', self.config.host, len(result.replies))
+                        result.timed_out = True
+                        break
+        except ReadInverterError as err:
+            result.error = str(err)
+        except Exception as err:
+            logger.exception('Unexpected error from %s: %s', self.config.host, err)
+            result.error = str(err)
+        result.duration = time.monotonic() - start_time
+        return result
+
+
+class MultiSitePoller:
+    """
+    Read many inverters in parallel with a thread pool, using the blocking InverterSock/Inverter classes.
+
+    With `parse_processes` the threads only collect the raw replies and the parsing is done
+    in batches by a process pool, e.g.: for hundreds of logger sticks.
+    """
+
+    def __init__(
+        self,
+        *,
+        configs: Iterable[Config],
+        max_workers: int = SITE_MAX_WORKERS,
+        site_deadline: float = SITE_DEADLINE,
+        cycle_time: float = SITE_CYCLE_TIME,
+        parse_processes: int = 0,
+        parse_batch_size: int = PARSE_BATCH_SIZE,
+    ):
+        self.site_deadline = site_deadline
+        self.cycle_time = cycle_time
+        self.parse_batch_size = parse_batch_size
+
+        self.definitions = {}  # All sites with the same inverter type and profile share the definitions
+        self.readers = []
+        for config in configs:
+            key = get_definitions_key(config)
+            if key not in self.definitions:
+                self.definitions[key] = load_definitions(config)
+            self.readers.append(SiteReader(config=config, definitions=self.definitions[key]))
+
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='SiteReader')
+
+        self.parse_processes = parse_processes
+        self.parse_executor = None
+        if parse_processes:
+            self.parse_executor = self.create_parse_executor()
+
+    def create_parse_executor(self) -> ProcessPoolExecutor:
+        # Don't fork the process with the running reader threads:
+        mp_context = multiprocessing.get_context('spawn')
+        return ProcessPoolExecutor(max_workers=self.parse_processes, mp_context=mp_context)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_type:
+            return False
+
+    def close(self) -> None:
+        for reader in self.readers:
+            reader.cancel()
+        self.executor.shutdown(wait=False)
+        if self.parse_executor is not None:
+            self.parse_executor.shutdown(wait=True)
+
+    def poll(self) -> Iterator[SiteResult]:
+        """
+        Read one cycle of all sites and yield the results as soon as they are done.
+        At the end of the cycle time, all unfinished reads are cancelled.
+        """
+        start_time = time.monotonic()
+        cycle_deadline = start_time + self.cycle_time
+        site_deadline = min(start_time + self.site_deadline, cycle_deadline)
+
+        future2reader = {}
+        for reader in self.readers:
+            if reader.busy:
+                # A straggler of the last cycle: Don't use the same logger stick twice at the same time
+                yield SiteResult(host=reader.config.host, error='Last read is still running', timed_out=True)
+                continue
+            reader.cancel_event.clear()
+            read_func = reader.read if self.parse_executor is None else reader.read_raw
+            reader.future = self.executor.submit(read_func, site_deadline)
+            future2reader[reader.future] = reader
+
+        results = self.wait_for_reads(future2reader=future2reader, start_time=start_time, deadline=cycle_deadline)
+        if self.parse_executor is None:
+            yield from results
+        else:
+            yield from self.parse(results)
+
+    def wait_for_reads(self, *, future2reader: dict, start_time: float, deadline: float) -> Iterator:
+        try:
+            for future in as_completed(future2reader, timeout=max(deadline - time.monotonic(), 0)):
+                if not future.cancelled():
+                    yield future.result()
+        except FuturesTimeoutError:
+            for future, reader in future2reader.items():
+                if not future.done():
+                    logger.warning('%s: Cancel read at the cycle deadline', reader.config.host)
+                    reader.cancel()
+                    yield SiteResult(
+                        host=reader.config.host,
+                        error='Cycle deadline exceeded',
+                        timed_out=True,
+                        duration=time.monotonic() - start_time,
+                    )
+
+    def parse(self, results: Iterable[RawSiteReplies | SiteResult]) -> Iterator[SiteResult]:
+        """
+        Send the raw replies in batches to the process pool and yield the results as soon as they are parsed.
+        """
+        batch = []
+        future2batch = {}
+        for raw in results:
+            if isinstance(raw, SiteResult):
+                yield raw  # e.g.: Cycle deadline exceeded
+                continue
+
+            batch.append(raw)
+            if len(batch) >= self.parse_batch_size:
+                future2batch[self.submit_batch(batch)] = batch
+                batch = []
+
+            for future in [future for future in future2batch if future.done()]:
+                yield from self.batch2results(future=future, batch=future2batch.pop(future))
+
+        if batch:
+            future2batch[self.submit_batch(batch)] = batch
+        for future in as_completed(future2batch):
+            yield from self.batch2results(future=future, batch=future2batch[future])
+
+    def submit_batch(self, batch: list[RawSiteReplies]) -> Future:
+        try:
+            return self.parse_executor.submit(parse_batch, batch)
+        except BrokenProcessPool:
+            # e.g.: A worker process was killed: Start a new pool for this and the next cycles
+            logger.warning('Restart the broken parse process pool')
+            self.parse_executor.shutdown(wait=False)
+            self.parse_executor = self.create_parse_executor()
+            return self.parse_executor.submit(parse_batch, batch)
+
+    def batch2results(self, *, future: Future, batch: list[RawSiteReplies]) -> Iterator[SiteResult]:
+        """
+        Yield the parsed results of one batch, or a failed result for every site of the batch.
+        """
+        try:
+            parsed_sites = future.result()
+        except Exception as err:  # e.g.: BrokenProcessPool or an unexpected error in the parser
+            logger.exception('Parse %i sites failed: %s', len(batch), err)
+            for raw in batch:
+                yield SiteResult(
+                    host=raw.config.host,
+                    inverter_info=raw.inverter_info,
+                    error=f'Parse error: {err}',
+                    duration=raw.duration,
+                )
+        else:
+            yield from self.parsed2results(parsed_sites)
+
+    def parsed2results(self, parsed_sites: list[ParsedSite]) -> Iterator[SiteResult]:
+        for parsed in parsed_sites:
+            yield SiteResult(
+                host=parsed.host,
+                inverter_info=parsed.inverter_info,
+                values=parsed2values(parsed=parsed, definitions=self.definitions[parsed.definitions_key]),
+                error=parsed.error,
+                timed_out=parsed.timed_out,
+                duration=parsed.duration,
+            )
+
+
+def publish_site_result(
+    *,
+    publisher: InverterMqttPublisher,
+    result: SiteResult,
+    start_time: float,
+    availability_topics: dict[str, str] | None = None,
+) -> bool:
+    """
+    Publish the values of one site, but only if all values are complete and valid.
+
+    `availability_topics` (host -> availability topic) stores the topic of every published site:
+    A site that fails later is set "offline", so that Home Assistant doesn't show the stale values as current.
+    """
+    if availability_topics is None:
+        availability_topics = {}
+
+    if result.complete:
+        try:
+            values = [inverter_value2ha_value(value) for value in result.values]
+        except ReadInverterError as err:
+            print(f'[red]{result.host}: {err}')
+        else:
+            values.append(get_loop_running_time_value(start_time))
+            publish_values(publisher=publisher, inverter_info=result.inverter_info, values=values)
+            availability_topics[result.host] = publisher.availability_topic
+            return True
+    else:
+        print(f'[red]{result.host}: {result.error or "Deadline exceeded"}')
+
+    topic = availability_topics.get(result.host)
+    if topic is not None:
+        publisher.set_availability(online=False, topic=topic)
+    return False
+
+
+def publish_sites_forever(
+    *,
+    configs: list[Config],
+    verbosity: int,
+    max_workers: int = SITE_MAX_WORKERS,
+    site_deadline: float = SITE_DEADLINE,
+    cycle_time: float = SITE_CYCLE_TIME,
+    parse_processes: int = 0,
+    site_device: bool = False,
+):
+    """
+    Read all sites in parallel and publish the merged results via one MQTT connection.
+    The messages of all sites are send in one batch at the end of every cycle.
+
+    With `site_device` the values of all inverters are aggregated into a virtual "site" device,
+    but only if all inverters are read successfully in this cycle.
+    """
+    start_time = time.monotonic()
+
+    mqtt_settings = configs[0].mqtt_settings
+    try:
+        publisher = BatchMqttPublisher(settings=mqtt_settings, verbosity=verbosity)
+    except Exception as err:
+        human_error(message=f'given {mqtt_settings!r} is wrong?!?', exception=err)
+
+    with MultiSitePoller(
+        configs=configs,
+        max_workers=max_workers,
+        site_deadline=site_deadline,
+        cycle_time=cycle_time,
+        parse_processes=parse_processes,
+    ) as poller:
+        availability_topics = {}  # host -> availability topic of all published sites
+        while True:
+            cycle_start = time.monotonic()
+            published = []
+            for result in poller.poll():
+                if publish_site_result(
+                    publisher=publisher,
+                    result=result,
+                    start_time=start_time,
+                    availability_topics=availability_topics,
+                ):
+                    published.append(result.values)
+            if site_device:
+                if len(published) == len(configs):
+                    publish_site_values(publisher=publisher, sites=published)
+                else:
+                    print('[yellow]Skip the site device: Not all sites are read in this cycle')
+            stats = publisher.flush()
+
+            duration = time.monotonic() - cycle_start
+            print(f'{len(published)}/{len(configs)} sites published in {duration:.1f} sec.: {stats}')
+
+            wait_time = cycle_time - duration
+            if wait_time > 0:
+                logger.info('Wait %i sec.', wait_time)
+                time.sleep(wait_time)
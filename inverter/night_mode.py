@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import math
+import re
+from collections.abc import Iterable
+
+from rich import print  # noqa
+
+from inverter.data_types import InverterValue
+
+
+logger = logging.getLogger(__name__)
+
+
+SLEEP_AFTER_FAILURES = 3  # Handshake failures in a row (after a cycle without production) until sleep
+SLEEP_PROBE_INTERVAL = 5 * 60  # Seconds between two handshakes while the inverter sleeps
+SUNRISE_MARGIN = 15 * 60  # Start probing this number of seconds before the estimated sunrise
+PRODUCTION_TIMEOUT = 15 * 60  # Seconds without an answer, until the last seen production doesn't prevent sleep
+
+# Only the generated power shows production, e.g.: Not the load, grid or battery power:
+PRODUCTION_POWER_RE = re.compile(r'PV\d* Power|.*AC Output Power.*')
+
+J2000 = 2451545.0  # Julian date of 2000-01-01 12:00 UTC
+J2000_DATETIME = datetime.datetime(2000, 1, 1, 12, tzinfo=datetime.timezone.utc)
+
+
+def julian2datetime(julian_date: float) -> datetime.datetime:
+    """
+    >>> julian2datetime(2451545.5)
+    datetime.datetime(2000, 1, 2, 0, 0, tzinfo=datetime.timezone.utc)
+    """
+    return J2000_DATETIME + datetime.timedelta(days=julian_date - J2000)
+
+
+def get_sun_times(
+    day: datetime.date, *, latitude: float, longitude: float
+) -> tuple[datetime.datetime, datetime.datetime] | None:
+    """
+    Estimate sunrise and sunset in UTC with the sunrise equation (Accuracy: a few minutes).
+    Returns None for polar day or night.
+
+    >>> sunrise, sunset = get_sun_times(datetime.date(2024, 6, 21), latitude=52.52, longitude=13.40)
+    >>> sunrise.strftime('%H:%M'), sunset.strftime('%H:%M')  # Berlin: 04:43 / 21:33 CEST
+    ('02:43', '19:33')
+    >>> get_sun_times(datetime.date(2024, 12, 21), latitude=78.22, longitude=15.65)  # Svalbard polar night
+    """
+    day_number = day.toordinal() + 1721425 - J2000  # Days since J2000 at noon of the given day
+    mean_solar_time = day_number - longitude / 360
+    anomaly = math.radians((357.5291 + 0.98560028 * mean_solar_time) % 360)
+    center = 1.9148 * math.sin(anomaly) + 0.0200 * math.sin(2 * anomaly) + 0.0003 * math.sin(3 * anomaly)
+    ecliptic_longitude = math.radians((math.degrees(anomaly) + center + 180 + 102.9372) % 360)
+    transit = J2000 + mean_solar_time + 0.0053 * math.sin(anomaly) - 0.0069 * math.sin(2 * ecliptic_longitude)
+
+    sin_declination = math.sin(ecliptic_longitude) * math.sin(math.radians(23.4397))
+    cos_declination = math.cos(math.asin(sin_declination))
+    latitude = math.radians(latitude)
+    cos_hour_angle = (math.sin(math.radians(-0.833)) - math.sin(latitude) * sin_declination) / (
+        math.cos(latitude) * cos_declination
+    )
+    if not -1 <= cos_hour_angle <= 1:
+        return None
+    hour_angle = math.degrees(math.acos(cos_hour_angle))
+    return julian2datetime(transit - hour_angle / 360), julian2datetime(transit + hour_angle / 360)
+
+
+def get_night_end(now: datetime.datetime, *, latitude: float, longitude: float) -> datetime.datetime | None:
+    """
+    Returns the next sunrise, if it's night. Returns None at daytime or if the sun never rises/sets.
+
+    >>> utc = datetime.timezone.utc
+    >>> night_end = get_night_end(datetime.datetime(2024, 6, 21, 23, 0, tzinfo=utc), latitude=52.52, longitude=13.40)
+    >>> night_end.strftime('%Y-%m-%d %H:%M')
+    '2024-06-22 02:43'
+    >>> get_night_end(datetime.datetime(2024, 6, 21, 12, 0, tzinfo=utc), latitude=52.52, longitude=13.40)
+    """
+    events = []
+    for offset in (-1, 0, 1, 2):
+        sun_times = get_sun_times(
+            now.date() + datetime.timedelta(days=offset),
+            latitude=latitude,
+            longitude=longitude,
+        )
+        if sun_times is None:
+            return None
+        sunrise, sunset = sun_times
+        events += [(sunrise, True), (sunset, False)]
+
+    # It's night, if the next event is a sunrise:
+    for event_time, is_sunrise in sorted(events):
+        if event_time > now:
+            return event_time if is_sunrise else None
+    return None
+
+
+def is_production_power(value: InverterValue) -> bool:
+    """
+    >>> from inverter.data_types import ValueMeta, ValueType
+    >>> def get_value(name):
+    ...     spec = ValueMeta(name=name, device_class='power', state_class='measurement', unit='W')
+    ...     return InverterValue(type=ValueType.READ_OUT, value=1, spec=spec)
+    >>> [is_production_power(get_value(name)) for name in ('PV1 Power', 'PV Power', 'Total AC Output Power (Active)')]
+    [True, True, True]
+    >>> [is_production_power(get_value(name)) for name in ('Total Load Power', 'Battery Power', 'Total Grid Power')]
+    [False, False, False]
+    """
+    return value.device_class == 'power' and PRODUCTION_POWER_RE.fullmatch(value.name) is not None
+
+
+def is_producing(values: Iterable[InverterValue]) -> bool | None:
+    """
+    Returns if one of the PV/AC output power values is not zero, None if the values contains no such values.
+    """
+    power_values = [
+        value.value
+        for value in values
+        if is_production_power(value)
+        and isinstance(value.value, (int, float))
+        and not isinstance(value.value, bool)
+    ]
+    if not power_values:
+        return None
+    return any(power_value > 0 for power_value in power_values)
+
+
+class NightMode:
+    """
+    Micro inverters power down the logger stick at dusk.
+
+    After some handshake failures in a row (and without production before them) the inverter is asleep:
+    Probe only with a slow interval or wait until the estimated sunrise, if the location is known.
+    A production in the last cycle prevents the sleep only for a limited time,
+    because the last cycle at dusk may still show some Watt.
+    """
+
+    def __init__(
+        self,
+        *,
+        latitude: float | None = None,
+        longitude: float | None = None,
+        sleep_after_failures: int = SLEEP_AFTER_FAILURES,
+        probe_interval: float = SLEEP_PROBE_INTERVAL,
+        production_timeout: float = PRODUCTION_TIMEOUT,
+    ):
+        self.latitude = latitude
+        self.longitude = longitude
+        self.sleep_after_failures = sleep_after_failures
+        self.probe_interval = probe_interval
+        self.production_timeout = production_timeout
+
+        self.asleep = False
+        self.failures = 0
+        self.producing = False  # Unknown on start: Allow sleep, e.g.: if started in the night
+        self.production_time = None  # Time of the last cycle with production
+
+    def add_cycle(self, values: Iterable[InverterValue], now: datetime.datetime | None = None) -> None:
+        producing = is_producing(values)
+        if producing is not None:
+            self.producing = producing
+            if producing:
+                self.production_time = now or datetime.datetime.now(tz=datetime.timezone.utc)
+
+    def handshake_done(self) -> bool:
+        """
+        Returns True, if the inverter woke up.
+        """
+        self.failures = 0
+        if self.asleep:
+            self.asleep = False
+            print('[green]Inverter woke up: Resume polling.')
+            return True
+        return False
+
+    def handshake_failed(self, now: datetime.datetime | None = None) -> bool:
+        """
+        Returns True, if the inverter is asleep, so that the failure is expected.
+        """
+        if now is None:
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+        self.failures += 1
+        if self.asleep:
+            logger.info('Inverter still asleep (%i failed handshakes)', self.failures)
+            return True
+
+        if self.producing and (now - self.production_time).total_seconds() > self.production_timeout:
+            logger.info('No answer %i sec. after the last production: Ignore it', self.production_timeout)
+            self.producing = False
+
+        if self.producing or self.failures < self.sleep_after_failures:
+            return False
+
+        self.asleep = True
+        sleep_time = self.get_sleep_time(now)
+        print(
+            f'[yellow]No answer after {self.failures} handshakes without production: Inverter is asleep.'
+            f' Next probe in {sleep_time / 60:.0f} min.'
+        )
+        return True
+
+    def get_sleep_time(self, now: datetime.datetime | None = None) -> float:
+        if now is None:
+            now = datetime.datetime.now(tz=datetime.timezone.utc)
+        if self.latitude is not None and self.longitude is not None:
+            night_end = get_night_end(now, latitude=self.latitude, longitude=self.longitude)
+            if night_end is not None:
+                wait_time = (night_end - now).total_seconds() - SUNRISE_MARGIN
+                if wait_time > self.probe_interval:
+                    return wait_time
+        return self.probe_interval
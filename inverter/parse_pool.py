@@ -0,0 +1,148 @@
+"""
+    Parse the raw replies of many inverters in worker processes.
+
+    The I/O threads only send the AT commands and collect the raw replies. Parsing, validation and
+    the computed values run in a process pool, so that they are not limited by the GIL.
+    Only picklable, compact data is send between the processes: The definitions (with the parser functions)
+    are loaded in every worker process and the results contain just the value names and values.
+"""
+from __future__ import annotations
+
+import dataclasses
+import logging
+
+from inverter.api import InverterDefinitions, load_definitions
+from inverter.connection import make_modbus_result, parse_modbus_response, parse_response
+from inverter.constants import ERROR_STR_NO_DATA
+from inverter.data_types import Config, InverterInfo, InverterValue, ModbusResponse, ValueType
+from inverter.exceptions import ModbusNoData, ReadInverterError, ValidationError
+
+
+logger = logging.getLogger(__name__)
+
+
+PARSE_BATCH_SIZE = 8  # Number of sites that will be parsed in one worker process call
+
+
+@dataclasses.dataclass
+class RawSiteReplies:
+    """
+    The raw replies of one read cycle of one inverter. Same order as the blocks of the read plan.
+    """
+
+    config: Config
+    inverter_info: InverterInfo | None = None
+    replies: list[bytes | list[bytes | None]] = dataclasses.field(default_factory=list)  # See read_block_raw()
+    error: str | None = None
+    timed_out: bool = False
+    duration: float = 0
+
+
+@dataclasses.dataclass
+class ParsedSite:
+    host: str
+    definitions_key: tuple[str, str]  # See get_definitions_key()
+    inverter_info: InverterInfo | None
+    values: list[tuple[str, object]]  # value name + parsed/computed value
+    error: str | None = None
+    timed_out: bool = False
+    duration: float = 0
+
+
+_definitions = {}  # Cache of the loaded definitions in the worker process
+
+
+def get_definitions_key(config: Config) -> tuple[str, str]:
+    """
+    All sites with the same inverter type and read profile can share the definitions.
+    """
+    return (config.inverter_name, config.profile)
+
+
+def get_definitions(config: Config) -> InverterDefinitions:
+    key = get_definitions_key(config)
+    if key not in _definitions:
+        _definitions[key] = load_definitions(config)
+    return _definitions[key]
+
+
+def parse_reply(reply: bytes | None) -> ModbusResponse | None:
+    """
+    Returns None for a "no data" reply.
+    """
+    if reply is None:
+        return None
+    try:
+        return parse_modbus_response(parse_response(reply).data)
+    except ModbusNoData:
+        return None
+
+
+def parse_site(raw: RawSiteReplies) -> ParsedSite:
+    definitions = get_definitions(raw.config)
+    parsed = ParsedSite(
+        host=raw.config.host,
+        definitions_key=get_definitions_key(raw.config),
+        inverter_info=raw.inverter_info,
+        values=[],
+        error=raw.error,
+        timed_out=raw.timed_out,
+        duration=raw.duration,
+    )
+
+    values = {}
+    try:
+        parsed_values = {}  # id(parameter) -> parsed value
+        for block, reply in zip(definitions.read_plan, raw.replies):
+            if isinstance(reply, list):
+                # The block was read parameter by parameter:
+                responses = [parse_reply(parameter_reply) for parameter_reply in reply]
+            else:
+                response = parse_reply(reply)
+                responses = [
+                    None if response is None else block.get_response(response=response, parameter=parameter)
+                    for parameter in block.parameters
+                ]
+            for parameter, response in zip(block.parameters, responses):
+                if response is None:
+                    parsed_value = ERROR_STR_NO_DATA
+                else:
+                    parsed_value = make_modbus_result(response=response, parameter=parameter).parsed_value
+                parsed_values[id(parameter)] = parsed_value
+
+        for parameter in definitions.parameters:
+            if id(parameter) not in parsed_values:
+                continue  # Not read, because the deadline was exceeded
+            value = InverterValue(type=ValueType.READ_OUT, value=parsed_values[id(parameter)], spec=parameter)
+            definitions.value_validator(inverter_value=value)
+            values[parameter.name] = value
+
+        computed = list(definitions.derived_values(values))
+    except (ReadInverterError, ValidationError) as err:
+        parsed.error = str(err)
+    except Exception as err:
+        # e.g.: AssertionError from a short frame: Fail only this site, not the whole batch
+        logger.exception('Unexpected parse error from %s: %s', raw.config.host, err)
+        parsed.error = f'Parse error: {err}'
+    else:
+        parsed.values = [(value.name, value.value) for value in [*values.values(), *computed]]
+    return parsed
+
+
+def parse_batch(batch: list[RawSiteReplies]) -> list[ParsedSite]:
+    return [parse_site(raw) for raw in batch]
+
+
+def parsed2values(*, parsed: ParsedSite, definitions: InverterDefinitions) -> list[InverterValue]:
+    """
+    Create the InverterValue objects from the compact results, with the metadata of the local definitions.
+    """
+    specs = {parameter.name: (ValueType.READ_OUT, parameter) for parameter in definitions.parameters}
+    for derived_value in definitions.derived_values.derived_values:
+        specs[derived_value.spec.name] = (ValueType.COMPUTED, derived_value.spec)
+
+    values = []
+    for name, value in parsed.values:
+        value_type, spec = specs[name]
+        values.append(InverterValue(type=value_type, value=value, spec=spec))
+    return values
@@ -1,94 +1,479 @@
+from __future__ import annotations
+
 import logging
+import queue
+import threading
 import time
+from collections.abc import Iterable
 
 from cli_base.cli_tools.rich_utils import human_error
 from ha_services.mqtt4homeassistant.converter import values2mqtt_payload
-from ha_services.mqtt4homeassistant.data_classes import HaValue, HaValues
+from ha_services.mqtt4homeassistant.data_classes import HaMqttPayload, HaValue, HaValues, MqttSettings
 from ha_services.mqtt4homeassistant.mqtt import HaMqttPublisher
 from packaging.version import Version
 from rich import print  # noqa
 
 from inverter.api import Inverter
+from inverter.capture import CaptureWriter
+from inverter.connection import InverterSock
 from inverter.constants import ERROR_STR_NO_DATA
 from inverter.daily_reset import DailyProductionReset, DailyProductionResetState
 from inverter.data_types import Config, InverterInfo, InverterValue
+from inverter.definition_watcher import DefinitionWatcher
+from inverter.discovery import DISCOVERY_CACHE_FILE_NAME, DiscoveryCache, rediscover_host
 from inverter.exceptions import ReadInverterError, ReadTimeout, ValidationError
+from inverter.metrics import METRIC_PREFIX, MetricsSnapshot
+from inverter.night_mode import NightMode
+from inverter.recorder import ValueRecorder
+from inverter.register_stats import REGISTER_STATS_FILE_NAME, RegisterStatistics
+from inverter.storage import SQLiteWriter
 
 
 logger = logging.getLogger(__name__)
 
 
-def publish_forever(*, config: Config, verbosity):
-    start_time = time.monotonic()
+STREAM_QUEUE_SIZE = 10  # Max. values buffered between the inverter reader and the MQTT writer
+CYCLE_DONE = object()  # Sentinel: The reader has read all values of the current cycle
+STREAM_PUT_TIMEOUT = 0.5  # Seconds between two checks if the reader should stop, while the queue is full
+REDISCOVER_AFTER_TIMEOUTS = 3  # Search the logger stick after this number of timeouts in a row
+DISCOVERY_REFRESH_INTERVAL = 60 * 60  # Announce all sensors again, e.g. for a restarted Home Assistant
+AVAILABILITY_ONLINE = 'online'
+AVAILABILITY_OFFLINE = 'offline'
 
-    mqtt_settings = config.mqtt_settings
+
+def inverter_value2ha_value(value: InverterValue) -> HaValue:
+    assert isinstance(value, InverterValue), f'{value!r}'
+
+    ha_value = value.value
+    if ha_value == ERROR_STR_NO_DATA:
+        raise ReadInverterError(f'Missing data for {value.name}')
+    elif isinstance(ha_value, Version):
+        ha_value = str(ha_value)
+
+    return HaValue(
+        name=value.name,
+        value=ha_value,
+        device_class=value.device_class,
+        state_class=value.state_class,
+        unit=value.unit,
+    )
+
+
+def get_loop_running_time_value(start_time: float) -> HaValue:
+    return HaValue(
+        name='Loop Running Time',
+        value=int(time.monotonic() - start_time),
+        device_class='',
+        state_class='measurement',
+        unit='sec.',
+    )
+
+
+class DiscoveryConfigs:
+    """
+    Remember the sent MQTT discovery configs and returns only the new or changed ones.
+    All configs will be returned again after `refresh_interval` seconds, because they are not retained.
+    """
+
+    def __init__(self, refresh_interval: float = DISCOVERY_REFRESH_INTERVAL):
+        self.refresh_interval = refresh_interval
+        self.last_refresh = None
+        self.sent = {}  # topic -> config data
+
+    def changed(self, configs: list[dict]) -> list[dict]:
+        now = time.monotonic()
+        if self.last_refresh is None or now - self.last_refresh >= self.refresh_interval:
+            self.last_refresh = now
+            self.sent.clear()
+
+        changed = []
+        for config in configs:
+            # The "device" contains the IDs of all sensors: Ignore it, otherwise a new sensor changes all configs
+            data = {key: value for key, value in config['data'].items() if key != 'device'}
+            if self.sent.get(config['topic']) != data:
+                self.sent[config['topic']] = data
+                changed.append(config)
+        return changed
+
+
+def get_availability_topic(state_topic: str) -> str:
+    """
+    >>> get_availability_topic('homeassistant/sensor/inverter_12345/state')
+    'homeassistant/sensor/inverter_12345/availability'
+    """
+    return f'{state_topic.rpartition("/")[0]}/availability'
+
+
+class InverterMqttPublisher(HaMqttPublisher):
+    """
+    Send the state on every call, but the discovery configs only for new or changed sensors.
+
+    All sensors of a device use one availability topic: "offline" is sent, while the inverter sleeps at night.
+    """
+
+    def __init__(self, settings: MqttSettings, verbosity: int = 0):
+        super().__init__(settings=settings, verbosity=verbosity)
+        self.discovery_configs = DiscoveryConfigs()
+        self.availability_topic = None  # Of the last published device
+        self.availability = {}  # availability topic -> last sent online state
+
+    def publish2homeassistant(self, *, ha_mqtt_payload: HaMqttPayload) -> None:
+        self.availability_topic = get_availability_topic(ha_mqtt_payload.state['topic'])
+
+        configs = self.discovery_configs.changed(ha_mqtt_payload.configs)
+        logger.debug('send %i of %i configs', len(configs), len(ha_mqtt_payload.configs))
+        for config in configs:
+            payload = {**config['data'], 'availability_topic': self.availability_topic}
+            self.publish(topic=config['topic'], payload=payload)
+
+        self.publish(topic=ha_mqtt_payload.state['topic'], payload=ha_mqtt_payload.state['data'])
+        self.send_count += 1
+        self.set_availability(online=True)
+
+    def set_availability(self, *, online: bool, topic: str | None = None) -> None:
+        """
+        Set the availability of the given device topic, or of the last published device.
+        """
+        if topic is None:
+            topic = self.availability_topic
+        if topic is None or self.availability.get(topic) == online:
+            return
+        self.availability[topic] = online
+        payload = AVAILABILITY_ONLINE if online else AVAILABILITY_OFFLINE
+        logger.info('Publish availability %r to %s', payload, topic)
+        # Plain string (not JSON) and retained, so that Home Assistant gets it also after a restart:
+        self.send(topic=topic, payload=payload, retain=True)
+
+    def send(self, *, topic: str, payload: str, retain: bool = False) -> None:
+        self.mqttc.publish(topic=topic, payload=payload, retain=retain)
+
+
+def publish_values(*, publisher: HaMqttPublisher, inverter_info: InverterInfo, values: list[HaValue]) -> None:
+    values = HaValues(
+        device_name=str(inverter_info.serial),
+        values=values,
+        prefix='homeassistant',
+        component='sensor',
+    )
+    ha_mqtt_payload = values2mqtt_payload(values=values, name_prefix='inverter')
+    publisher.publish2homeassistant(ha_mqtt_payload=ha_mqtt_payload)
+
+
+def publish_all_or_nothing(
+    *,
+    inverter: Inverter,
+    publisher: HaMqttPublisher,
+    start_time: float,
+    daily_production_reset: DailyProductionReset | None = None,
+    metrics: MetricsSnapshot | None = None,
+    recorders: Iterable[ValueRecorder | SQLiteWriter] = (),
+    night_mode: NightMode | None = None,
+) -> bool:
+    """
+    Read all values and send them in one MQTT message, but only if all values are valid.
+    """
+    inverter_values = []
     try:
-        publisher = HaMqttPublisher(settings=mqtt_settings, verbosity=verbosity, config_count=1)
-    except Exception as err:
-        human_error(message='given {mqtt_settings!r} is wrong?!?', exception=err)
+        values = []
+        for value in inverter:
+            # Don't send a MQTT message if one of the values are missing:
+            ha_value = inverter_value2ha_value(value)
 
-    reset_state = DailyProductionResetState(config_path=config.config_path)
+            inverter_values.append(value)
+            values.append(ha_value)
+    except ValidationError as err:
+        print(f'[red]Skip send values: {err}')
+        success = False
+    except ReadInverterError as err:
+        print(f'[red]{err}')
+        success = False
+    else:
+        values.append(get_loop_running_time_value(start_time))
+        publish_values(publisher=publisher, inverter_info=inverter.inv_sock.inverter_info, values=values)
+        if metrics is not None:
+            for value in inverter_values:
+                metrics.set_value(value)
+        for recorder in recorders:
+            recorder.add_cycle(inverter_values)
+        if night_mode is not None:
+            night_mode.add_cycle(inverter_values)
+        success = True
 
-    while True:
+    if daily_production_reset is not None:
+        daily_production_reset(inv_sock=inverter.inv_sock, values={value.name: value for value in inverter_values})
+    return success
+
+
+class InverterValueReader(threading.Thread):
+    """
+    Producer: Read the values from the inverter and put them into the queue, as soon as they are read.
+
+    All inverter I/O of the cycle happens in this thread,
+    so the socket is never used from two threads at the same time.
+    """
+
+    def __init__(self, *, inverter: Inverter, value_queue: queue.Queue):
+        super().__init__(name='InverterValueReader', daemon=True)
+        self.inverter = inverter
+        self.value_queue = value_queue
+        self.stop_event = threading.Event()
+
+    def put(self, item) -> bool:
+        """
+        Put the item into the queue. Returns False if the reader was stopped while the queue is full.
+        """
+        while not self.stop_event.is_set():
+            try:
+                self.value_queue.put(item, timeout=STREAM_PUT_TIMEOUT)
+            except queue.Full:
+                continue
+            return True
+        return False
+
+    def run(self):
         try:
-            with Inverter(config=config) as inverter:
-                inverter.connect()
-                inverter_info: InverterInfo = inverter.inv_sock.inverter_info
+            for value in self.inverter:
+                if not self.put(value):
+                    return  # Stopped by the consumer
+        except Exception as err:
+            # Will be handled in the consumer thread
+            self.put(err)
+        finally:
+            self.put(CYCLE_DONE)
+
+    def stop(self) -> None:
+        """
+        Stop reading and wait until the current read is done, so the socket is not used after the cycle.
+        """
+        self.stop_event.set()
+        self.join()
+
+
+def publish_streaming(
+    *,
+    inverter: Inverter,
+    publisher: HaMqttPublisher,
+    start_time: float,
+    ha_values: dict,
+    daily_production_reset: DailyProductionReset | None = None,
+    metrics: MetricsSnapshot | None = None,
+    recorders: Iterable[ValueRecorder | SQLiteWriter] = (),
+    night_mode: NightMode | None = None,
+) -> bool:
+    """
+    Consumer: Publish every value as soon as it's read from the inverter.
 
-                with DailyProductionReset(reset_state, inverter, config) as daily_production_reset:
+    The state topic always contains all known values (the values from the last cycle
+    will be updated with the new ones), because all sensors share one state topic.
+    Values that are in the queue are published together in one MQTT message.
+    """
+    inverter_info: InverterInfo = inverter.inv_sock.inverter_info
+    value_queue = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    reader = InverterValueReader(inverter=inverter, value_queue=value_queue)
+    reader.start()
 
+    cycle_done = False
+    error = None
+    cycle_values = []  # All values read in this cycle, used by the recorders
+    try:
+        while not cycle_done:
+            items = [value_queue.get()]
+            while True:
+                try:
+                    items.append(value_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            changed = False
+            for item in items:
+                if item is CYCLE_DONE:
+                    cycle_done = True
+                elif isinstance(item, Exception):
+                    error = item
+                else:
                     try:
-                        values = []
-                        for value in inverter:
-                            assert isinstance(value, InverterValue), f'{value!r}'
-
-                            ha_value = value.value
-                            if ha_value == ERROR_STR_NO_DATA:
-                                # Don't send a MQTT message if one of the values are missing:
-                                raise ReadInverterError(f'Missing data for {value.name}')
-                            elif isinstance(value.value, Version):
-                                ha_value = str(value.value)
-
-                            daily_production_reset(value)
-
-                            values.append(
-                                HaValue(
-                                    name=value.name,
-                                    value=ha_value,
-                                    device_class=value.device_class,
-                                    state_class=value.state_class,
-                                    unit=value.unit,
-                                )
-                            )
-                    except ValidationError as err:
-                        print(f'[red]Skip send values: {err}')
+                        ha_value = inverter_value2ha_value(item)
                     except ReadInverterError as err:
+                        # Just skip this value, the last known one will be kept
                         print(f'[red]{err}')
                     else:
-                        values.append(
-                            HaValue(
-                                name='Loop Running Time',
-                                value=int(time.monotonic() - start_time),
-                                device_class='',
-                                state_class='measurement',
-                                unit='sec.',
-                            )
-                        )
-
-                        values = HaValues(
-                            device_name=str(inverter_info.serial),
-                            values=values,
-                            prefix='homeassistant',
-                            component='sensor',
-                        )
-                        ha_mqtt_payload = values2mqtt_payload(values=values, name_prefix='inverter')
-                        publisher.publish2homeassistant(ha_mqtt_payload=ha_mqtt_payload)
+                        ha_values[ha_value.name] = ha_value
+                        cycle_values.append(item)
+                        changed = True
+                        if metrics is not None:
+                            metrics.set_value(item)
+
+            if changed and not cycle_done:
+                # Send only the current state, the configs will be send at the end of the cycle:
+                values = HaValues(device_name=str(inverter_info.serial), values=list(ha_values.values()))
+                ha_mqtt_payload = values2mqtt_payload(values=values, name_prefix='inverter')
+                publisher.publish(topic=ha_mqtt_payload.state['topic'], payload=ha_mqtt_payload.state['data'])
+    finally:
+        # e.g.: The MQTT publish failed: Don't leave the reader blocked on the full queue
+        reader.stop()
+
+    if isinstance(error, ValidationError):
+        print(f'[red]Stop reading values: {error}')
+    elif isinstance(error, ReadInverterError):
+        print(f'[red]{error}')
+    elif error is not None:
+        raise error
+
+    if ha_values:
+        ha_value = get_loop_running_time_value(start_time)
+        ha_values[ha_value.name] = ha_value
+        publish_values(publisher=publisher, inverter_info=inverter_info, values=list(ha_values.values()))
+
+    if cycle_values:
+        for recorder in recorders:
+            recorder.add_cycle(cycle_values)
+        if night_mode is not None:
+            night_mode.add_cycle(cycle_values)
+
+    if daily_production_reset is not None:
+        # The reader thread is done: The socket can be used here
+        daily_production_reset(inv_sock=inverter.inv_sock, values={value.name: value for value in cycle_values})
+
+    return error is None
+
+
+def needs_rediscovery(*, timeouts: int, asleep: bool, serial_known: bool) -> bool:
+    """
+    Search the logger stick after some timeouts in a row. While the inverter is asleep, the probes are rare:
+    Search it after every failed probe, e.g.: The logger stick gets a new IP address via DHCP in the night.
+
+    >>> needs_rediscovery(timeouts=1, asleep=False, serial_known=True)
+    False
+    >>> needs_rediscovery(timeouts=REDISCOVER_AFTER_TIMEOUTS, asleep=False, serial_known=True)
+    True
+    >>> needs_rediscovery(timeouts=1, asleep=True, serial_known=True)
+    True
+    >>> needs_rediscovery(timeouts=1, asleep=True, serial_known=False)
+    False
+    """
+    if asleep and serial_known:
+        return True
+    return timeouts >= REDISCOVER_AFTER_TIMEOUTS
+
+
+def publish_forever(
+    *,
+    config: Config,
+    verbosity,
+    streaming: bool = True,
+    metrics: MetricsSnapshot | None = None,
+    recorders: Iterable[ValueRecorder | SQLiteWriter] = (),
+    capture: CaptureWriter | None = None,
+):
+    start_time = time.monotonic()
+
+    mqtt_settings = config.mqtt_settings
+    try:
+        publisher = InverterMqttPublisher(settings=mqtt_settings, verbosity=verbosity)
+    except Exception as err:
+        human_error(message='given {mqtt_settings!r} is wrong?!?', exception=err)
+
+    daily_production_reset = DailyProductionReset(
+        reset_state=DailyProductionResetState(config_path=config.config_path),
+        config=config,
+    )
+    definition_watcher = DefinitionWatcher(config)
+    definitions = definition_watcher.definitions
+
+    discovery_cache = None
+    register_stats = RegisterStatistics()
+    if config.config_path:
+        discovery_cache = DiscoveryCache(cache_path=config.config_path / DISCOVERY_CACHE_FILE_NAME)
+        register_stats = RegisterStatistics(stats_path=config.config_path / REGISTER_STATS_FILE_NAME)
+    serial = None  # Serial number of the logger stick, used to find it again if the IP has changed
+    timeouts = 0
+    night_mode = NightMode(latitude=config.latitude, longitude=config.longitude)
+
+    ha_values = {}  # Last known values, used by streaming mode
+    while True:
+        cycle_start = time.monotonic()
+        success = False
+
+        if (new_definitions := definition_watcher.get_definitions()) is not definitions:
+            definitions = new_definitions
+            # Don't publish the last known values of removed sensors:
+            names = definitions.names
+            for name in list(ha_values):
+                if name not in names:
+                    del ha_values[name]
+
+        connected = False
+        try:
+            inv_sock = InverterSock(config, capture=capture, register_stats=register_stats)
+            with Inverter(config=config, inv_sock=inv_sock, definitions=definitions) as inverter:
+                if night_mode.asleep:
+                    inv_sock.connect_once()  # Just probe: The logger stick is powered down at night
+                else:
+                    inverter.connect()
+                connected = True
+                night_mode.handshake_done()
+                inverter_info = inverter.inv_sock.inverter_info
+                if metrics is not None:
+                    metrics.set_inverter_info(inverter_info)
+                serial = inverter_info.serial
+                timeouts = 0
+                if discovery_cache is not None and discovery_cache.get_ip(serial=serial) != inverter_info.ip:
+                    discovery_cache.update([inverter_info])
+                    discovery_cache.save()
+
+                if streaming:
+                    success = publish_streaming(
+                        inverter=inverter,
+                        publisher=publisher,
+                        daily_production_reset=daily_production_reset,
+                        start_time=start_time,
+                        ha_values=ha_values,
+                        metrics=metrics,
+                        recorders=recorders,
+                        night_mode=night_mode,
+                    )
+                else:
+                    success = publish_all_or_nothing(
+                        inverter=inverter,
+                        publisher=publisher,
+                        daily_production_reset=daily_production_reset,
+                        start_time=start_time,
+                        metrics=metrics,
+                        recorders=recorders,
+                        night_mode=night_mode,
+                    )
         except ReadTimeout as err:
-            print(f'[red]{err}')
+            timeouts += 1
+            if not connected and night_mode.handshake_failed():
+                publisher.set_availability(online=False)
+            else:
+                print(f'[red]{err}')
+            serial_known = serial is not None or (
+                discovery_cache is not None and discovery_cache.get_serial(ip=config.host) is not None
+            )
+            if needs_rediscovery(timeouts=timeouts, asleep=night_mode.asleep, serial_known=serial_known):
+                timeouts = 0
+                rediscover_host(config=config, serial=serial, cache=discovery_cache)
         except Exception as err:
             print(f'[red]{err}')
             logger.exception('Unexpected error: %s', err)
 
+        register_stats.save_if_due()
+
+        if metrics is not None:
+            metrics.set_gauge(
+                f'{METRIC_PREFIX}_quarantined_registers',
+                len(register_stats.get_quarantined()),
+                help='Number of registers that are not read, because of persistent failures',
+            )
+            metrics.cycle_done(duration=time.monotonic() - cycle_start, success=success)
+
+        if night_mode.asleep:
+            sleep_time = night_mode.get_sleep_time()
+            logger.info('Inverter is asleep: Wait %i sec.', sleep_time)
+            time.sleep(sleep_time)
+            continue
+
         print('Wait', end='...')
         for i in range(10, 1, -1):
             time.sleep(1)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections.abc import Iterable
+
+from inverter.data_types import ModbusResponse, Parameter
+
+
+logger = logging.getLogger(__name__)
+
+
+READ_PLAN_MAX_REGISTERS = 32  # Max. registers in one read request of the plan
+
+
+@dataclasses.dataclass
+class ReadBlock:
+    """
+    One read request for the parameters in a range of contiguous registers.
+    """
+
+    start_register: int
+    length: int
+    parameters: list[Parameter]
+
+    @property
+    def end_register(self) -> int:
+        return self.start_register + self.length - 1
+
+    def get_response(self, *, response: ModbusResponse, parameter: Parameter) -> ModbusResponse:
+        """
+        Returns the part of the block response with the registers of the given parameter.
+        """
+        pos = (parameter.start_register - self.start_register) * 2
+        return ModbusResponse(
+            slave_id=response.slave_id,
+            modbus_function=response.modbus_function,
+            data=response.data[pos:pos + parameter.length * 2],
+        )
+
+
+def make_read_plan(parameters: Iterable[Parameter], max_registers: int = READ_PLAN_MAX_REGISTERS) -> list[ReadBlock]:
+    """
+    Coalesce the parameters with contiguous (or overlapping) registers into as few read requests as possible.
+    Registers that no parameter uses are never read, because the inverter may answer them with "no data".
+    The parameters of a block stay in the given order.
+
+    >>> def get_plan(*registers):
+    ...     parameters = [
+    ...         Parameter(
+    ...             start_register=start, length=length, group='', name=hex(start),
+    ...             device_class='', state_class=None, unit='', scale=1, parser=None,
+    ...         )
+    ...         for start, length in registers
+    ...     ]
+    ...     return [
+    ...         (hex(block.start_register), block.length, [parameter.name for parameter in block.parameters])
+    ...         for block in make_read_plan(parameters, max_registers=4)
+    ...     ]
+    >>> get_plan((0x6f, 1), (0x6d, 1), (0x6e, 1), (0x3f, 2), (0x41, 1))
+    [('0x3f', 3, ['0x3f', '0x41']), ('0x6d', 3, ['0x6f', '0x6d', '0x6e'])]
+    >>> get_plan((1, 2), (3, 2), (5, 1), (5, 1))
+    [('0x1', 4, ['0x1', '0x3']), ('0x5', 1, ['0x5', '0x5'])]
+    """
+    parameters = list(parameters)
+    order = {id(parameter): index for index, parameter in enumerate(parameters)}
+    blocks = []
+    for parameter in sorted(parameters, key=lambda parameter: parameter.start_register):
+        end_register = parameter.start_register + parameter.length - 1
+        if blocks and parameter.start_register <= blocks[-1].end_register + 1:
+            block = blocks[-1]
+            new_length = max(block.end_register, end_register) - block.start_register + 1
+            if new_length <= max_registers:
+                block.length = new_length
+                block.parameters.append(parameter)
+                continue
+
+        blocks.append(
+            ReadBlock(start_register=parameter.start_register, length=parameter.length, parameters=[parameter])
+        )
+
+    for block in blocks:
+        block.parameters.sort(key=lambda parameter: order[id(parameter)])
+    return blocks
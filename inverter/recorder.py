@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import csv
+import datetime
+import logging
+import os
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from packaging.version import Version
+from rich import print  # noqa
+
+from inverter.api import Inverter
+from inverter.constants import ERROR_STR_NO_DATA
+from inverter.data_types import Config, InverterValue
+from inverter.exceptions import ReadInverterError, ValidationError
+
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+logger = logging.getLogger(__name__)
+
+
+RECORD_FORMAT_AUTO = 'auto'
+RECORD_FORMAT_CSV = 'csv'
+RECORD_FORMAT_PARQUET = 'parquet'
+RECORD_FORMATS = (RECORD_FORMAT_AUTO, RECORD_FORMAT_CSV, RECORD_FORMAT_PARQUET)
+
+RECORD_BATCH_SIZE = 30  # Write the buffered rows to disk after this number of cycles...
+RECORD_FLUSH_INTERVAL = 10 * 60  # ...or after this number of seconds
+RECORD_INTERVAL = 10  # Seconds between two cycles of the "record" command
+
+TIMESTAMP_COLUMN = 'timestamp'
+
+
+def get_record_format(record_format: str) -> str:
+    """
+    Resolve "auto": Use Parquet if pyarrow is installed, otherwise CSV.
+    """
+    assert record_format in RECORD_FORMATS, f'{record_format=}'
+    if record_format == RECORD_FORMAT_AUTO:
+        return RECORD_FORMAT_PARQUET if pyarrow else RECORD_FORMAT_CSV
+    if record_format == RECORD_FORMAT_PARQUET and pyarrow is None:
+        raise ImportError('Parquet output needs "pyarrow" (pip install pyarrow)')
+    return record_format
+
+
+def record_value(value: float | int | str | Version) -> float | int | str | None:
+    """
+    >>> record_value(12)
+    12
+    >>> record_value('no data')
+    >>> record_value(Version('1.2.3'))
+    '1.2.3'
+    """
+    if value == ERROR_STR_NO_DATA:
+        return None
+    elif isinstance(value, Version):
+        return str(value)
+    return value
+
+
+def parquet_value(value):
+    """
+    >>> parquet_value(1), parquet_value(True), parquet_value('Standby'), parquet_value(None)
+    (1.0, True, 'Standby', None)
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        return float(value)
+    return value
+
+
+def fsync_file(file) -> None:
+    file.flush()
+    os.fsync(file.fileno())
+
+
+class CsvRecordWriter:
+    """
+    Append the rows to one CSV file per day. If the columns have changed, a new part file will be started.
+    """
+
+    suffix = '.csv'
+
+    def get_path(self, *, path: Path, file_prefix: str, day: datetime.date, columns: list[str]) -> Path:
+        for part in range(1, 1000):
+            name = f'{file_prefix}_{day.isoformat()}'
+            if part > 1:
+                name += f'_{part}'
+            file_path = path / f'{name}{self.suffix}'
+            if not file_path.exists():
+                return file_path
+            with file_path.open('r', newline='') as f:
+                header = next(csv.reader(f), None)
+            if header == columns:
+                return file_path
+        raise FileExistsError(f'Too many part files for {day} in {path}')
+
+    def write(self, *, path: Path, file_prefix: str, day: datetime.date, columns: list[str], rows: list[dict]):
+        file_path = self.get_path(path=path, file_prefix=file_prefix, day=day, columns=columns)
+        write_header = not file_path.exists()
+        with file_path.open('a', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            if write_header:
+                writer.writeheader()
+            for row in rows:
+                row = dict(row, **{TIMESTAMP_COLUMN: row[TIMESTAMP_COLUMN].isoformat()})
+                writer.writerow(row)
+            fsync_file(f)
+        return file_path
+
+
+class ParquetRecordWriter:
+    """
+    Parquet files can't be appended: Every flush creates a new part file in one directory per day.
+    """
+
+    suffix = '.parquet'
+
+    def write(self, *, path: Path, file_prefix: str, day: datetime.date, columns: list[str], rows: list[dict]):
+        day_path = path / f'{file_prefix}_{day.isoformat()}'
+        day_path.mkdir(exist_ok=True)
+
+        first_timestamp = rows[0][TIMESTAMP_COLUMN]
+        file_name = f'part_{first_timestamp.strftime("%H%M%S")}'
+        file_path = day_path / f'{file_name}{self.suffix}'
+        part = 1
+        while file_path.exists():
+            part += 1
+            file_path = day_path / f'{file_name}_{part}{self.suffix}'
+
+        # Store all numbers as float, so that all part files have the same schema:
+        table = pyarrow.Table.from_pylist(
+            [{column: parquet_value(row.get(column)) for column in columns} for row in rows],
+        )
+        with file_path.open('xb') as f:
+            pyarrow.parquet.write_table(table, f)
+            fsync_file(f)
+        return file_path
+
+
+class ValueRecorder:
+    """
+    Collect the values of every cycle as one row (one column per value)
+    and write them in batches into daily rotated files.
+    """
+
+    def __init__(
+        self,
+        *,
+        path: Path,
+        file_prefix: str = 'inverter',
+        record_format: str = RECORD_FORMAT_AUTO,
+        batch_size: int = RECORD_BATCH_SIZE,
+        flush_interval: float = RECORD_FLUSH_INTERVAL,
+    ):
+        self.path = path
+        self.file_prefix = file_prefix
+        self.record_format = get_record_format(record_format)
+        if self.record_format == RECORD_FORMAT_PARQUET:
+            self.writer = ParquetRecordWriter()
+        else:
+            self.writer = CsvRecordWriter()
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.columns = [TIMESTAMP_COLUMN]
+        self.rows = []
+        self.last_flush = time.monotonic()
+
+    def __enter__(self) -> ValueRecorder:
+        return self
+
+    def add_cycle(self, values: Iterable[InverterValue], timestamp: datetime.datetime | None = None) -> None:
+        if timestamp is None:
+            timestamp = datetime.datetime.now().astimezone()
+
+        row = {TIMESTAMP_COLUMN: timestamp}
+        for value in values:
+            row[value.name] = record_value(value.value)
+            if value.name not in self.columns:
+                self.columns.append(value.name)
+
+        if self.rows and self.rows[-1][TIMESTAMP_COLUMN].date() != timestamp.date():
+            # Rotate: Write all rows of the last day into their own file
+            self.flush()
+
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size or time.monotonic() - self.last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self) -> None:
+        self.last_flush = time.monotonic()
+        if not self.rows:
+            return
+
+        rows_by_day = {}
+        for row in self.rows:
+            rows_by_day.setdefault(row[TIMESTAMP_COLUMN].date(), []).append(row)
+
+        for day, rows in rows_by_day.items():
+            file_path = self.writer.write(
+                path=self.path,
+                file_prefix=self.file_prefix,
+                day=day,
+                columns=self.columns,
+                rows=rows,
+            )
+            logger.info('%i rows written to %s', len(rows), file_path)
+        self.rows.clear()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_type:
+            return False
+
+
+def record_forever(*, config: Config, recorder: ValueRecorder, interval: float = RECORD_INTERVAL):
+    """
+    Read all values from the inverter and record them, without publishing them via MQTT.
+    """
+    while True:
+        values = []
+        try:
+            with Inverter(config=config) as inverter:
+                inverter.connect()
+                for value in inverter:
+                    print(f'[yellow]{value.name}[/yellow],', end='')
+                    values.append(value)
+        except ValidationError as err:
+            print(f'[red]Stop reading values: {err}')
+        except ReadInverterError as err:
+            print(f'[red]{err}')
+
+        if values:
+            recorder.add_cycle(values)
+            print(f'\n{len(values)} values recorded ({len(recorder.rows)} rows buffered)')
+
+        time.sleep(interval)
@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import csv
+import dataclasses
+import logging
+import queue
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+from rich import print  # noqa
+
+from inverter.connection import InverterSock
+from inverter.data_types import Config, ModbusResponse
+from inverter.exceptions import ModbusNoData, ReadInverterError, ReadTimeout
+
+
+logger = logging.getLogger(__name__)
+
+
+MAX_SCAN_SPAN = 100  # Max. registers read with one request
+STATUS_OK = 'ok'
+STATUS_NO_DATA = 'no data'
+STATUS_ERROR = 'error'
+
+SNAPSHOT_FIELDS = ('register', 'value', 'status')
+
+
+@dataclasses.dataclass
+class RegisterScanResult:
+    register: int
+    value: int | None
+    status: str  # STATUS_OK / STATUS_NO_DATA / STATUS_ERROR
+
+
+def group_registers(registers: Iterable[int], max_span: int) -> Iterable[tuple[int, int]]:
+    """
+    Group the registers into contiguous (start register, length) spans of max. `max_span` registers.
+
+    >>> list(group_registers(range(0, 10), max_span=4))
+    [(0, 4), (4, 4), (8, 2)]
+    >>> list(group_registers([1, 2, 3, 7, 8, 0x10], max_span=100))
+    [(1, 3), (7, 2), (16, 1)]
+    """
+    start_register = None
+    length = 0
+    for register in registers:
+        if start_register is not None and register == start_register + length and length < max_span:
+            length += 1
+        else:
+            if start_register is not None:
+                yield start_register, length
+            start_register = register
+            length = 1
+    if start_register is not None:
+        yield start_register, length
+
+
+def read_snapshot(path: Path) -> dict[int, RegisterScanResult]:
+    results = {}
+    with path.open('r', newline='') as f:
+        for row in csv.DictReader(f):
+            register = int(row['register'], 16)
+            value = int(row['value'], 16) if row['value'] else None
+            results[register] = RegisterScanResult(register=register, value=value, status=row['status'])
+    return dict(sorted(results.items()))
+
+
+def diff_snapshots(
+    old: dict[int, RegisterScanResult], new: dict[int, RegisterScanResult]
+) -> list[tuple[int, RegisterScanResult | None, RegisterScanResult | None]]:
+    """
+    Returns all registers whose value or status are different in both snapshots.
+    """
+    diff = []
+    for register in sorted(old.keys() | new.keys()):
+        old_result = old.get(register)
+        new_result = new.get(register)
+        if old_result != new_result:
+            diff.append((register, old_result, new_result))
+    return diff
+
+
+class SnapshotWriter:
+    """
+    Append scan results to a CSV file. Existing results will be used to resume a interrupted scan.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        if path.is_file():
+            self.existing = read_snapshot(path)
+            logger.info('Resume scan: %i registers already in %s', len(self.existing), path)
+        else:
+            self.existing = {}
+
+    def __enter__(self):
+        write_header = not self.path.is_file()
+        self.file = self.path.open('a', newline='')
+        self.writer = csv.writer(self.file)
+        if write_header:
+            self.writer.writerow(SNAPSHOT_FIELDS)
+        return self
+
+    def write(self, results: list[RegisterScanResult]):
+        for result in results:
+            value = '' if result.value is None else f'{result.value:04x}'
+            self.writer.writerow((f'0x{result.register:04x}', value, result.status))
+        self.file.flush()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.file.close()
+        if exc_type:
+            return False
+
+
+class RegisterScanner:
+    """
+    Scan a register range with one or more connections to the inverter.
+
+    Every worker thread use its own InverterSock. The range is split into spans of `max_span` registers,
+    a span that can't be read will be split into halves, until single registers are reached.
+    So only the registers around "no data" / error regions are read one by one.
+    """
+
+    def __init__(self, *, config: Config, max_span: int = MAX_SCAN_SPAN, concurrency: int = 1):
+        assert 1 <= max_span <= MAX_SCAN_SPAN, f'{max_span=}'
+        assert concurrency >= 1, f'{concurrency=}'
+        self.config = config
+        self.max_span = max_span
+        self.concurrency = concurrency
+
+        self.spans = queue.Queue()
+        self.results = queue.Queue()
+        self.lock = threading.Lock()
+        self.pending = 0
+        self.timeouts = 0
+
+    def add_span(self, start_register: int, length: int):
+        with self.lock:
+            self.pending += 1
+        self.spans.put((start_register, length))
+
+    def read_span(self, inv_sock: InverterSock, start_register: int, length: int):
+        try:
+            response: ModbusResponse = inv_sock.read_once(start_register=start_register, length=length)
+        except ReadTimeout as err:
+            # Don't store anything: The span will be scanned again on the next (resumed) scan
+            logger.warning('Skip %i registers from %s: %s', length, hex(start_register), err)
+            with self.lock:
+                self.timeouts += 1
+            return
+        except ReadInverterError as err:
+            if length > 1:
+                half = length // 2
+                self.add_span(start_register, half)
+                self.add_span(start_register + half, length - half)
+            else:
+                status = STATUS_NO_DATA if isinstance(err, ModbusNoData) else STATUS_ERROR
+                self.results.put([RegisterScanResult(register=start_register, value=None, status=status)])
+            return
+
+        data = response.data
+        results = []
+        for offset in range(length):
+            pos = offset * 2
+            value = int.from_bytes(data[pos:pos + 2], 'big')
+            results.append(RegisterScanResult(register=start_register + offset, value=value, status=STATUS_OK))
+        self.results.put(results)
+
+    def worker(self):
+        with InverterSock(self.config) as inv_sock:
+            try:
+                inv_sock.connect()
+            except ReadInverterError as err:
+                print(f'[red]{err}')
+                return
+
+            while True:
+                span = self.spans.get()
+                if span is None:
+                    break
+                try:
+                    self.read_span(inv_sock, *span)
+                except Exception as err:
+                    logger.exception('Error scan %s: %s', span, err)
+                finally:
+                    with self.lock:
+                        self.pending -= 1
+                    self.results.put(None)  # Wake up the main thread
+
+    def scan(self, *, start: int, end: int, snapshot_path: Path) -> dict[int, RegisterScanResult]:
+        with SnapshotWriter(snapshot_path) as snapshot:
+            # Skip all already scanned registers:
+            registers = [register for register in range(start, end + 1) if register not in snapshot.existing]
+            for start_register, length in group_registers(registers, max_span=self.max_span):
+                self.add_span(start_register, length)
+            print(f'Scan {len(registers)} registers from {hex(start)} to {hex(end)}', end='...')
+
+            workers = [
+                threading.Thread(target=self.worker, name=f'RegisterScanner-{no}', daemon=True)
+                for no in range(self.concurrency)
+            ]
+            for worker in workers:
+                worker.start()
+
+            scanned = {}
+            while True:
+                with self.lock:
+                    if self.pending == 0 and self.results.empty():
+                        break
+                try:
+                    results = self.results.get(timeout=1)
+                except queue.Empty:
+                    if not any(worker.is_alive() for worker in workers):
+                        print('[red]No connection to the inverter: Stop scan.')
+                        break
+                    continue
+                if results:
+                    snapshot.write(results)
+                    for result in results:
+                        scanned[result.register] = result
+                    print(f'[cyan]{hex(results[-1].register)}', end=',')
+
+            for _ in workers:
+                self.spans.put(None)
+            for worker in workers:
+                worker.join()
+
+        print(f'\n{len(scanned)} registers scanned ({self.timeouts} timeouts).')
+        return read_snapshot(snapshot_path)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+
+from rich import print  # noqa
+
+from inverter.exceptions import CrcError, ModbusNoData, ReadTimeout
+
+
+logger = logging.getLogger(__name__)
+
+
+REGISTER_STATS_FILE_NAME = 'register_stats.json'
+REGISTER_STATS_SAVE_INTERVAL = 10 * 60  # Seconds between two writes of the stats file (Don't wear out SD cards)
+
+QUARANTINE_AFTER_FAILURES = 3  # Quarantine a register after this number of failed reads in a row
+QUARANTINE_DELAY = 5 * 60  # Seconds until the first re-probe of a quarantined register...
+QUARANTINE_MAX_DELAY = 24 * 60 * 60  # ...every failed re-probe doubles the delay up to this limit
+
+
+def get_quarantine_delay(quarantine_count: int, *, delay: float, max_delay: float) -> float:
+    """
+    >>> [get_quarantine_delay(count, delay=60, max_delay=300) for count in range(1, 6)]
+    [60, 120, 240, 300, 300]
+    """
+    return min(delay * 2 ** (quarantine_count - 1), max_delay)
+
+
+@dataclasses.dataclass
+class RegisterStats:
+    start_register: int
+    length: int
+    ok: int = 0
+    no_data: int = 0
+    crc_errors: int = 0
+    timeouts: int = 0
+    errors: int = 0  # All other read errors, e.g.: parse errors
+    latency_sum: float = 0
+    latency_max: float = 0
+    consecutive_failures: int = 0
+    quarantine_count: int = 0  # Number of failed reads since the register is in quarantine
+    quarantined_until: float = 0  # Unix timestamp of the next re-probe
+
+    @property
+    def requests(self) -> int:
+        return self.ok + self.no_data + self.crc_errors + self.timeouts + self.errors
+
+    @property
+    def latency_avg(self) -> float:
+        """
+        >>> RegisterStats(start_register=1, length=1, ok=3, latency_sum=0.3).latency_avg
+        0.1
+        """
+        if not self.requests:
+            return 0
+        return round(self.latency_sum / self.requests, 6)
+
+    def is_quarantined(self, now: float) -> bool:
+        return self.quarantine_count > 0 and now < self.quarantined_until
+
+
+class RegisterStatistics:
+    """
+    Count success, "no data", CRC errors and timeouts with the latency of every register read.
+
+    Registers with persistent failures are quarantined: They are not read until the next re-probe.
+    Every failed re-probe doubles the quarantine time.
+    """
+
+    def __init__(
+        self,
+        *,
+        stats_path: Path | None = None,
+        quarantine_after: int = QUARANTINE_AFTER_FAILURES,
+        quarantine_delay: float = QUARANTINE_DELAY,
+        quarantine_max_delay: float = QUARANTINE_MAX_DELAY,
+        save_interval: float = REGISTER_STATS_SAVE_INTERVAL,
+    ):
+        self.stats_path = stats_path
+        self.quarantine_after = quarantine_after
+        self.quarantine_delay = quarantine_delay
+        self.quarantine_max_delay = quarantine_max_delay
+        self.save_interval = save_interval
+
+        self.lock = threading.Lock()
+        self.stats: dict[tuple[int, int], RegisterStats] = {}
+        self.last_save = time.monotonic()
+        if stats_path is not None:
+            self.load()
+
+    def load(self) -> None:
+        try:
+            data = json.loads(self.stats_path.read_text(encoding='UTF-8'))
+            stats = [RegisterStats(**entry) for entry in data]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, TypeError) as err:
+            logger.warning('Ignore register stats %s: %s', self.stats_path, err)
+            return
+        with self.lock:
+            self.stats = {(entry.start_register, entry.length): entry for entry in stats}
+
+    def save(self) -> None:
+        with self.lock:
+            data = [dataclasses.asdict(entry) for entry in self.stats.values()]
+            self.last_save = time.monotonic()
+        self.stats_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.stats_path.with_suffix('.tmp')
+        temp_path.write_text(json.dumps(data, indent=4), encoding='UTF-8')
+        temp_path.replace(self.stats_path)
+        logger.info('Register stats saved to %s', self.stats_path)
+
+    def save_if_due(self) -> None:
+        if self.stats_path is not None and time.monotonic() - self.last_save >= self.save_interval:
+            self.save()
+
+    def get(self, *, start_register: int, length: int) -> RegisterStats:
+        key = (start_register, length)
+        with self.lock:
+            try:
+                return self.stats[key]
+            except KeyError:
+                stats = self.stats[key] = RegisterStats(start_register=start_register, length=length)
+                return stats
+
+    def add_request(self, *, start_register: int, length: int, latency: float, error: Exception | None) -> None:
+        """
+        Count one request to the logger stick (every retry is one request).
+        """
+        stats = self.get(start_register=start_register, length=length)
+        with self.lock:
+            if error is None:
+                stats.ok += 1
+            elif isinstance(error, ModbusNoData):
+                stats.no_data += 1
+            elif isinstance(error, CrcError):
+                stats.crc_errors += 1
+            elif isinstance(error, ReadTimeout):
+                stats.timeouts += 1
+            else:
+                stats.errors += 1
+            stats.latency_sum += latency
+            stats.latency_max = max(stats.latency_max, latency)
+
+    def is_quarantined(self, *, start_register: int, length: int, now: float | None = None) -> bool:
+        if now is None:
+            now = time.time()
+        return self.get(start_register=start_register, length=length).is_quarantined(now)
+
+    def is_probing(self, *, start_register: int, length: int) -> bool:
+        """
+        The register is in quarantine, but the re-probe is due: Read it only once, without retries.
+        """
+        return self.get(start_register=start_register, length=length).quarantine_count > 0
+
+    def read_done(self, *, start_register: int, length: int, success: bool, now: float | None = None) -> None:
+        """
+        Update the quarantine state after a read (with all retries) has finished.
+        Timeouts should not be counted here: They are caused by the connection and not by the register.
+        """
+        if now is None:
+            now = time.time()
+        stats = self.get(start_register=start_register, length=length)
+        with self.lock:
+            if success:
+                if stats.quarantine_count:
+                    print(f'[green]Register {hex(start_register)} answers again: Quarantine lifted.')
+                stats.consecutive_failures = 0
+                stats.quarantine_count = 0
+                stats.quarantined_until = 0
+                return
+
+            stats.consecutive_failures += 1
+            if stats.quarantine_count or stats.consecutive_failures >= self.quarantine_after:
+                stats.quarantine_count += 1
+                delay = get_quarantine_delay(
+                    stats.quarantine_count,
+                    delay=self.quarantine_delay,
+                    max_delay=self.quarantine_max_delay,
+                )
+                stats.quarantined_until = now + delay
+                print(
+                    f'[yellow]Register {hex(start_register)} failed {stats.consecutive_failures} times:'
+                    f' Quarantine for {delay:.0f} sec.'
+                )
+
+    def get_quarantined(self, now: float | None = None) -> list[RegisterStats]:
+        if now is None:
+            now = time.time()
+        with self.lock:
+            return [stats for stats in self.stats.values() if stats.is_quarantined(now)]
+
+    def get_all(self) -> list[RegisterStats]:
+        with self.lock:
+            return sorted(self.stats.values(), key=lambda stats: (stats.start_register, stats.length))
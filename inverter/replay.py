@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from ha_services.mqtt4homeassistant.mqtt import HaMqttPublisher
+from rich import print  # noqa
+
+from inverter.api import Inverter
+from inverter.capture import CaptureRecord, read_capture
+from inverter.connection import InverterSock, parameter2modbus_at_command, parse_inverter_info
+from inverter.constants import AT_READ_FUNC_NUMBER
+from inverter.data_types import Config, InverterValue, ModbusReadResult, ModbusResponse
+from inverter.exceptions import ModbusNoData, ReadInverterError, ValidationError
+from inverter.publish_loop import inverter_value2ha_value, publish_values
+from inverter.read_plan import ReadBlock
+
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayError(ReadInverterError):
+    """
+    The requested command is not in the captured cycle.
+    """
+
+    pass
+
+
+def iter_capture_cycles(records: Iterable[CaptureRecord], init_cmd: bytes) -> Iterable[list[CaptureRecord]]:
+    """
+    Split the records into cycles: Every cycle starts with the init command handshake.
+    """
+    cycle = []
+    for record in records:
+        if record.command == init_cmd and cycle:
+            yield cycle
+            cycle = []
+        cycle.append(record)
+    if cycle:
+        yield cycle
+
+
+class ReplayClock:
+    """
+    Sleep between the records to reproduce the timing of the capture, if `realtime` is set.
+    """
+
+    def __init__(self, realtime: bool):
+        self.realtime = realtime
+        self.first_timestamp = None
+        self.start_time = None
+
+    def wait(self, timestamp: float) -> None:
+        if not self.realtime:
+            return
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+            self.start_time = time.monotonic()
+            return
+        delay = (timestamp - self.first_timestamp) - (time.monotonic() - self.start_time)
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ReplayInverterSock(InverterSock):
+    """
+    Answer all commands from the records of one captured cycle, instead of the logger stick.
+    """
+
+    def __init__(self, config: Config, *, records: list[CaptureRecord], clock: ReplayClock):
+        super().__init__(config)
+        self.records = records
+        self.clock = clock
+        self.position = 0
+
+    def find_record(self, command: bytes) -> int | None:
+        for index in range(self.position, len(self.records)):
+            if self.records[index].command == command:
+                return index
+        return None
+
+    def connect(self) -> None:
+        self.init_inventer()
+
+    def init_inventer(self) -> None:
+        data = self.recv_command(command=self.config.init_cmd)
+        self.inverter_info = parse_inverter_info(data)
+
+    def send(self, *, command: bytes):
+        pass
+
+    def recv_command(self, *, command: bytes, **kwargs):
+        index = self.find_record(command)
+        if index is None:
+            raise ReplayError(f'{command!r} not captured')
+        self.position = index + 1
+        record = self.records[index]
+        self.clock.wait(record.timestamp)
+        return record.data
+
+    def read(self, *, start_register: int, length: int) -> ModbusResponse:
+        # Retry without backoff sleeps, as long as the capture contains the retries
+        while True:
+            try:
+                return self.read_once(start_register=start_register, length=length)
+            except ModbusNoData:
+                command = self.records[self.position - 1].command
+                if self.find_record(command) is None:
+                    raise
+
+    def read_block(self, *, block: ReadBlock) -> list[ModbusReadResult]:
+        command = parameter2modbus_at_command(
+            start_register=block.start_register,
+            length=block.length,
+            modbus_function=AT_READ_FUNC_NUMBER,
+        )
+        if self.find_record(f'AT+{command}\n'.encode()) is None:
+            # e.g.: Captured with another read profile or without the read plan: Read one by one
+            return [self.read_paremeter(parameter=parameter) for parameter in block.parameters]
+        return super().read_block(block=block)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type:
+            return False
+
+
+@dataclasses.dataclass
+class ReplayStats:
+    cycles: int = 0
+    values: int = 0
+    errors: int = 0
+    duration: float = 0
+
+
+def replay_capture(
+    *,
+    config: Config,
+    path: Path,
+    realtime: bool = False,
+    publisher: HaMqttPublisher | None = None,
+    on_cycle=None,
+) -> ReplayStats:
+    """
+    Push all captured cycles through the parsers, validators and derived values (and to MQTT, if a publisher given).
+    """
+    stats = ReplayStats()
+    clock = ReplayClock(realtime=realtime)
+    start_time = time.monotonic()
+    for records in iter_capture_cycles(read_capture(path), init_cmd=config.init_cmd):
+        stats.cycles += 1
+        inv_sock = ReplayInverterSock(config, records=records, clock=clock)
+        values: list[InverterValue] = []
+        with Inverter(config=config, inv_sock=inv_sock) as inverter:
+            try:
+                inverter.connect()
+                for value in inverter:
+                    values.append(value)
+            except (ValidationError, ReadInverterError) as err:
+                stats.errors += 1
+                print(f'[red]Cycle {stats.cycles}: {err}')
+
+        stats.values += len(values)
+        if on_cycle is not None:
+            on_cycle(values)
+
+        if publisher is not None and values:
+            ha_values = []
+            for value in values:
+                try:
+                    ha_values.append(inverter_value2ha_value(value))
+                except ReadInverterError as err:
+                    logger.info('Skip: %s', err)
+            publish_values(publisher=publisher, inverter_info=inv_sock.inverter_info, values=ha_values)
+
+    stats.duration = time.monotonic() - start_time
+    return stats
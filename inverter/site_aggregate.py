@@ -0,0 +1,86 @@
+"""
+    A virtual "site" device with the values of all inverters of one read cycle, e.g.:
+
+        Total Power = sum of "Total Power" of all inverters
+        DC Temperature Min/Max = min/max of "DC Temperature" of all inverters
+
+    The values are computed once from the same cycle, so Home Assistant gets consistent
+    site totals without template sensors.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+
+from ha_services.mqtt4homeassistant.converter import values2mqtt_payload
+from ha_services.mqtt4homeassistant.data_classes import HaValues
+from ha_services.mqtt4homeassistant.mqtt import HaMqttPublisher
+
+from inverter.data_types import InverterValue, ValueMeta, ValueType
+from inverter.publish_loop import inverter_value2ha_value
+
+
+logger = logging.getLogger(__name__)
+
+
+SITE_DEVICE_NAME = 'site'
+SUM_DEVICE_CLASSES = ('power', 'energy')
+MIN_MAX_DEVICE_CLASSES = ('temperature',)
+
+
+def aggregate_site_values(sites: Iterable[list[InverterValue]]) -> list[InverterValue]:
+    """
+    Aggregate the numeric values that all inverters have in common:
+    Sum of power and energy values, min and max of temperatures.
+    """
+    name2values = {}  # name -> list of all values with this name
+    site_count = 0
+    for values in sites:
+        site_count += 1
+        for value in values:
+            device_class = value.device_class
+            if device_class not in SUM_DEVICE_CLASSES and device_class not in MIN_MAX_DEVICE_CLASSES:
+                continue
+            if not isinstance(value.value, (int, float)):
+                continue  # e.g.: "no data"
+            name2values.setdefault(value.name, []).append(value)
+
+    aggregated = []
+    for name, values in name2values.items():
+        if len(values) != site_count:
+            # A sum over a part of the inverters would be wrong
+            logger.info('Skip site value %r: Only %i of %i inverters have it', name, len(values), site_count)
+            continue
+
+        numbers = [value.value for value in values]
+        first = values[0]
+        if first.device_class in SUM_DEVICE_CLASSES:
+            items = [(name, round(sum(numbers), 2))]
+        else:
+            items = [(f'{name} Min', min(numbers)), (f'{name} Max', max(numbers))]
+
+        for item_name, number in items:
+            spec = ValueMeta(
+                name=item_name,
+                device_class=first.device_class,
+                state_class=first.state_class,
+                unit=first.unit,
+            )
+            aggregated.append(InverterValue(type=ValueType.COMPUTED, value=number, spec=spec))
+    return aggregated
+
+
+def publish_site_values(*, publisher: HaMqttPublisher, sites: list[list[InverterValue]]) -> bool:
+    values = aggregate_site_values(sites)
+    if not values:
+        return False
+
+    values = HaValues(
+        device_name=SITE_DEVICE_NAME,
+        values=[inverter_value2ha_value(value) for value in values],
+        prefix='homeassistant',
+        component='sensor',
+    )
+    ha_mqtt_payload = values2mqtt_payload(values=values, name_prefix='inverter')
+    publisher.publish2homeassistant(ha_mqtt_payload=ha_mqtt_payload)
+    return True
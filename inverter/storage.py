@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from rich import print  # noqa
+
+from inverter.data_types import InverterValue
+
+
+logger = logging.getLogger(__name__)
+
+
+DATABASE_FILE_NAME = 'inverter-connect.sqlite3'
+
+RAW_RETENTION_DAYS = 7  # Delete raw readings after this number of days
+ROLLUP_RETENTION_DAYS = {'1m': 31}  # Other rollups are kept forever
+ROLLUP_RESOLUTIONS = {
+    '1m': 60,
+    '15m': 15 * 60,
+    '1d': None,  # Local calendar day
+}
+MAINTENANCE_INTERVAL = 60 * 60  # Seconds between two retention runs
+WRITER_QUEUE_SIZE = 100  # Max. cycles waiting for the database, newer cycles are dropped
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS series (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    device_class TEXT,
+    state_class TEXT,
+    unit TEXT
+);
+CREATE TABLE IF NOT EXISTS readings (
+    series_id INTEGER NOT NULL REFERENCES series (id),
+    timestamp REAL NOT NULL,
+    value REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS readings_timestamp ON readings (timestamp);
+CREATE TABLE IF NOT EXISTS rollups (
+    resolution TEXT NOT NULL,
+    series_id INTEGER NOT NULL REFERENCES series (id),
+    bucket REAL NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    sum REAL NOT NULL,
+    count INTEGER NOT NULL,
+    last REAL NOT NULL,
+    last_timestamp REAL NOT NULL,
+    PRIMARY KEY (resolution, series_id, bucket)
+) WITHOUT ROWID;
+"""
+
+UPSERT_SERIES = """
+INSERT INTO series (name, device_class, state_class, unit) VALUES (?, ?, ?, ?)
+ON CONFLICT (name) DO UPDATE SET
+    device_class = excluded.device_class,
+    state_class = excluded.state_class,
+    unit = excluded.unit
+"""
+
+UPSERT_ROLLUP = """
+INSERT INTO rollups (resolution, series_id, bucket, min, max, sum, count, last, last_timestamp)
+VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?)
+ON CONFLICT (resolution, series_id, bucket) DO UPDATE SET
+    min = min(rollups.min, excluded.min),
+    max = max(rollups.max, excluded.max),
+    sum = rollups.sum + excluded.sum,
+    count = rollups.count + 1,
+    last = CASE WHEN excluded.last_timestamp >= rollups.last_timestamp THEN excluded.last ELSE rollups.last END,
+    last_timestamp = max(rollups.last_timestamp, excluded.last_timestamp)
+"""
+
+
+def get_bucket(resolution: str, timestamp: float) -> float:
+    """
+    Returns the start of the rollup bucket of the given timestamp.
+
+    >>> get_bucket('1m', 1000)
+    960
+    >>> get_bucket('15m', 1000)
+    900
+    """
+    seconds = ROLLUP_RESOLUTIONS[resolution]
+    if seconds is None:
+        day = datetime.datetime.fromtimestamp(timestamp).date()
+        return datetime.datetime.combine(day, datetime.time.min).timestamp()
+    return timestamp - timestamp % seconds
+
+
+def is_number(value) -> bool:
+    """
+    >>> is_number(1), is_number(1.5), is_number(True), is_number('no data')
+    (True, True, False, False)
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+@dataclasses.dataclass
+class DailyEnergy:
+    day: datetime.date
+    name: str
+    unit: str
+    energy: float
+
+
+class SQLiteStorage:
+    """
+    Store all numeric values in a SQLite database (WAL mode) and maintain min/max/avg/last rollups.
+
+    The connection can only be used in the thread that created it. See SQLiteWriter.
+    """
+
+    def __init__(self, *, db_path: Path, raw_retention_days: int = RAW_RETENTION_DAYS):
+        self.db_path = db_path
+        self.raw_retention_days = raw_retention_days
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')  # Safe in WAL mode and reduces the fsync calls
+        self.conn.executescript(SCHEMA)
+        self.series_ids = {}
+
+    def get_series_id(self, value: InverterValue) -> int:
+        key = (value.name, value.device_class, value.state_class, value.unit)
+        try:
+            return self.series_ids[key]
+        except KeyError:
+            self.conn.execute(UPSERT_SERIES, key)
+            (series_id,) = self.conn.execute('SELECT id FROM series WHERE name = ?', (value.name,)).fetchone()
+            self.series_ids[key] = series_id
+            return series_id
+
+    def insert_cycle(self, values: Iterable[InverterValue], timestamp: float | None = None) -> int:
+        """
+        Insert all numeric values of one cycle in one transaction and update the rollups.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        buckets = {resolution: get_bucket(resolution, timestamp) for resolution in ROLLUP_RESOLUTIONS}
+
+        readings = []
+        rollups = []
+        with self.conn:
+            for value in values:
+                if not is_number(value.value):
+                    continue
+                series_id = self.get_series_id(value)
+                readings.append((series_id, timestamp, value.value))
+                for resolution, bucket in buckets.items():
+                    rollups.append(
+                        (resolution, series_id, bucket, value.value, value.value, value.value, value.value, timestamp)
+                    )
+            self.conn.executemany('INSERT INTO readings (series_id, timestamp, value) VALUES (?, ?, ?)', readings)
+            self.conn.executemany(UPSERT_ROLLUP, rollups)
+        return len(readings)
+
+    def delete_old(self, now: float | None = None) -> None:
+        if now is None:
+            now = time.time()
+        with self.conn:
+            cursor = self.conn.execute(
+                'DELETE FROM readings WHERE timestamp < ?',
+                (now - self.raw_retention_days * 24 * 60 * 60,),
+            )
+            logger.info('%i old readings deleted', cursor.rowcount)
+            for resolution, days in ROLLUP_RETENTION_DAYS.items():
+                cursor = self.conn.execute(
+                    'DELETE FROM rollups WHERE resolution = ? AND bucket < ?',
+                    (resolution, now - days * 24 * 60 * 60),
+                )
+                logger.info('%i old %s rollups deleted', cursor.rowcount, resolution)
+
+    def get_daily_energy(self, *, days: int, now: float | None = None) -> list[DailyEnergy]:
+        """
+        Returns the energy per day from the daily rollups:
+        The difference for ever increasing counters and the max. value for the daily counters.
+        """
+        if now is None:
+            now = time.time()
+        start = get_bucket('1d', now - (days - 1) * 24 * 60 * 60)
+        cursor = self.conn.execute(
+            """
+            SELECT rollups.bucket, series.name, series.state_class, series.unit, rollups.min, rollups.max
+            FROM rollups JOIN series ON series.id = rollups.series_id
+            WHERE rollups.resolution = '1d' AND series.device_class = 'energy' AND rollups.bucket >= ?
+            ORDER BY rollups.bucket, series.id
+            """,
+            (start,),
+        )
+        results = []
+        for bucket, name, state_class, unit, min_value, max_value in cursor:
+            if state_class == 'total_increasing':
+                energy = max_value - min_value
+            else:
+                energy = max_value
+            results.append(
+                DailyEnergy(
+                    day=datetime.date.fromtimestamp(bucket),
+                    name=name,
+                    unit=unit,
+                    energy=round(energy, 3),
+                )
+            )
+        return results
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+class SQLiteWriter(threading.Thread):
+    """
+    Write the values into the SQLite database in a background thread,
+    so that the publish loop is never blocked by the database.
+    """
+
+    def __init__(
+        self, *, db_path: Path, raw_retention_days: int = RAW_RETENTION_DAYS, queue_size: int = WRITER_QUEUE_SIZE
+    ):
+        super().__init__(name='SQLiteWriter', daemon=True)
+        self.db_path = db_path
+        self.raw_retention_days = raw_retention_days
+        self.cycle_queue = queue.Queue(maxsize=queue_size)
+        self.ready = threading.Event()
+        self.open_error = None
+
+    def __enter__(self) -> SQLiteWriter:
+        return self
+
+    def start(self) -> None:
+        """
+        Start the thread and wait until the database is opened.
+        Raise the error, if the database can't be opened, e.g.: locked, read-only or corrupt.
+        """
+        super().start()
+        self.ready.wait()
+        if self.open_error is not None:
+            self.join()
+            raise self.open_error
+
+    def add_cycle(self, values: Iterable[InverterValue]) -> None:
+        if not self.is_alive():
+            logger.warning('Drop values: The SQLite writer is not running')
+            return
+        try:
+            self.cycle_queue.put_nowait((time.time(), list(values)))
+        except queue.Full:
+            logger.warning('Drop values: %i cycles are waiting for %s', self.cycle_queue.qsize(), self.db_path)
+
+    def run(self):
+        try:
+            storage = SQLiteStorage(db_path=self.db_path, raw_retention_days=self.raw_retention_days)
+        except (sqlite3.Error, OSError) as err:
+            self.open_error = err
+            return
+        finally:
+            self.ready.set()
+
+        next_maintenance = 0
+        try:
+            while True:
+                item = self.cycle_queue.get()
+                if item is None:
+                    break
+                timestamp, values = item
+                try:
+                    count = storage.insert_cycle(values, timestamp=timestamp)
+                    logger.debug('%i values stored in %s', count, self.db_path)
+                    if time.monotonic() >= next_maintenance:
+                        storage.delete_old()
+                        next_maintenance = time.monotonic() + MAINTENANCE_INTERVAL
+                except sqlite3.Error as err:
+                    print(f'[red]Store values into {self.db_path} failed: {err}')
+        finally:
+            storage.close()
+
+    def close(self) -> None:
+        if self.is_alive():
+            self.cycle_queue.put(None)
+            self.join()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_type:
+            return False
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import socket
+import threading
+
+from inverter.connection import modbus_crc
+
+
+class InverterSimulator:
+    """
+    Simulates a logger stick with a connected inverter on a local UDP socket.
+
+    Registers that are not in `registers` will be answered with "no data".
+    """
+
+    def __init__(
+        self,
+        *,
+        host='127.0.0.1',
+        port=0,
+        registers: dict = None,
+        at_commands: dict = None,
+        mac='AABBCCDDEEFF',
+        serial=1234567890,
+        init_cmd=b'WIFIKIT-214028-READ',
+    ):
+        self.registers = registers or {}
+        self.at_commands = at_commands or {}
+        self.mac = mac
+        self.serial = serial
+        self.init_cmd = init_cmd
+
+        self.received = []
+        self.received_condition = threading.Condition()
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind((host, port))
+        self.sock.settimeout(0.1)
+        self.host, self.port = self.sock.getsockname()
+
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.serve, name='InverterSimulator', daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop_event.set()
+        self.thread.join()
+        self.sock.close()
+        if exc_type:
+            return False
+
+    def serve(self):
+        while not self.stop_event.is_set():
+            try:
+                command, address = self.sock.recvfrom(1024)
+            except socket.timeout:
+                continue
+            with self.received_condition:
+                self.received.append(command)
+                self.received_condition.notify_all()
+            response = self.get_response(command)
+            if response is not None:
+                self.sock.sendto(response, address)
+
+    def wait_received(self, command: bytes, timeout=1) -> None:
+        """
+        Wait until the simulator received the command.
+        Needed for commands without a response, e.g.: b'+ok' and b'AT+Q\\n'
+        """
+        with self.received_condition:
+            if not self.received_condition.wait_for(lambda: command in self.received, timeout=timeout):
+                raise TimeoutError(f'Command {command!r} not received in {timeout} sec.')
+
+    def get_response(self, command: bytes) -> bytes | None:
+        if command == self.init_cmd:
+            return f'{self.host},{self.mac},{self.serial}'.encode()
+
+        if command in (b'+ok', b'AT+Q\n'):
+            return None
+
+        command = command.decode().removeprefix('AT+').rstrip('\n')
+        if command.startswith('INVDATA='):
+            data = self.modbus(bytes.fromhex(command.partition(',')[2]))
+        else:
+            data = self.at_commands.get(command, '')
+        return f'+ok={data}\r\n\r\n'.encode()
+
+    def modbus(self, request: bytes) -> str:
+        slave_id, modbus_function = request[0], request[1]
+        start_register = int.from_bytes(request[2:4], 'big')
+        length = int.from_bytes(request[4:6], 'big')
+        if modbus_function == 0x10:
+            data = request[-2 - length * 2:-2]  # The values are between the byte count and the CRC
+            for offset in range(length):
+                pos = offset * 2
+                self.registers[start_register + offset] = int.from_bytes(data[pos:pos + 2], 'big')
+            response = bytearray(request[:6])
+        else:
+            try:
+                values = [self.registers[start_register + offset] for offset in range(length)]
+            except KeyError:
+                return 'no data'
+            response = bytearray([slave_id, modbus_function, length * 2])
+            for value in values:
+                response.extend(value.to_bytes(2, 'big'))
+        response.extend(modbus_crc(response).to_bytes(2, 'little'))
+        return response.hex().upper()
@@ -0,0 +1,70 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from freezegun import freeze_time
+
+from inverter.at_commands import AtCommandCache, AtCommandResult, bulk_at_commands
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+
+
+class AtCommandsTestCase(TestCase):
+    def test_bulk_at_commands(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            cache_path = Path(temp_dir) / 'at_command_cache.json'
+
+            with freeze_time('2020-01-01T00:00:00+0000') as frozen_time:
+                with InverterSimulator(at_commands={'VER': '1.2.3', 'PING': 'pong'}, serial=111) as simulator1:
+                    with InverterSimulator(at_commands={'VER': '4.5.6', 'PING': 'pong'}, serial=222) as simulator2:
+                        configs = [
+                            fixtures.get_config(host=simulator.host, port=simulator.port)
+                            for simulator in (simulator1, simulator2)
+                        ]
+                        cache = AtCommandCache(cache_path=cache_path, ttl=60)
+                        results = bulk_at_commands(configs=configs, commands=('VER', 'PING'), cache=cache)
+                        self.assertEqual(
+                            [result.as_dict() for result in results],
+                            [
+                                {
+                                    'host': '127.0.0.1',
+                                    'serial': 111,
+                                    'mac': 'AABBCCDDEEFF',
+                                    'results': {'VER': '1.2.3', 'PING': 'pong'},
+                                    'error': None,
+                                },
+                                {
+                                    'host': '127.0.0.1',
+                                    'serial': 222,
+                                    'mac': 'AABBCCDDEEFF',
+                                    'results': {'VER': '4.5.6', 'PING': 'pong'},
+                                    'error': None,
+                                },
+                            ],
+                        )
+                        self.assertIn(b'AT+VER\n', simulator1.received)
+                        simulator1.received.clear()
+
+                        # Static answers are cached by serial number:
+                        cache = AtCommandCache(cache_path=cache_path, ttl=60)
+                        results = bulk_at_commands(configs=configs[:1], commands=('VER', 'PING'), cache=cache)
+                        self.assertEqual(
+                            results[0].results,
+                            [
+                                AtCommandResult(command='VER', result='1.2.3', cached=True),
+                                AtCommandResult(command='PING', result='pong', cached=False),
+                            ],
+                        )
+                        self.assertNotIn(b'AT+VER\n', simulator1.received)
+
+                        # Cache expired:
+                        frozen_time.tick(61)
+                        results = bulk_at_commands(configs=configs[:1], commands=('VER',), cache=cache)
+                        self.assertEqual(results[0].results, [AtCommandResult(command='VER', result='1.2.3')])
+                        self.assertIn(b'AT+VER\n', simulator1.received)
+
+    def test_connection_error(self):
+        config = fixtures.get_config(host='123.456.789.666')
+        results = bulk_at_commands(configs=[config], commands=('VER',))
+        self.assertIsNone(results[0].inverter_info)
+        self.assertIn('Hint: Check 123.456.789.666:48899', results[0].error)
@@ -0,0 +1,68 @@
+import logging
+from unittest import TestCase
+
+from inverter import trace
+from inverter.benchmark import (
+    FakeInverterSock,
+    benchmark_memory,
+    benchmark_parse,
+    get_benchmark_parameters,
+    make_raw_response,
+)
+from inverter.connection import parse_modbus_response, parse_response
+from inverter.data_types import InverterValue, ValueType
+from inverter.definitions import get_parameter
+from inverter.tests import fixtures
+
+
+class BenchmarkTestCase(TestCase):
+    def test_fake_inverter_sock(self):
+        parameter = get_parameter(config=fixtures.get_config(inverter_name='deye_sg04lp3', compact=False))[0]
+        result = FakeInverterSock(register_value=0x0102).read_paremeter(parameter=parameter)
+        self.assertEqual(result.response.data, b'\x01\x02' * parameter.length)
+        self.assertIs(result.parameter, parameter)
+
+    def test_memory_benchmark(self):
+        result = benchmark_memory(cycles=2)
+        self.assertEqual(result.inverter_name, 'deye_sg04lp3')
+        self.assertGreater(result.values, 50)
+        self.assertGreater(result.cycle_bytes, 0)
+        self.assertGreaterEqual(result.peak_bytes, result.cycle_bytes)
+
+    def test_metadata_referenced(self):
+        parameter = get_parameter(config=fixtures.get_config(inverter_name='deye_sg04lp3', compact=False))[0]
+        value = InverterValue(type=ValueType.READ_OUT, value=1, spec=parameter)
+        self.assertIs(value.name, parameter.name)
+        self.assertEqual(
+            (value.device_class, value.state_class, value.unit),
+            (parameter.device_class, parameter.state_class, parameter.unit),
+        )
+        self.assertFalse(hasattr(value, '__dict__'))
+
+    def test_parse_benchmark(self):
+        result = benchmark_parse(rounds=2)
+        self.assertIs(result.trace, False)
+        self.assertGreater(result.values, 50)
+        self.assertGreater(result.values_per_second, 0)
+
+    def test_trace(self):
+        self.assertIs(trace.enabled, False)
+        parameter = get_benchmark_parameters()[0]
+        with self.assertLogs('inverter', level=logging.DEBUG) as logs:
+            trace.set_trace(enable=True)
+            try:
+                parse_modbus_response(parse_response(make_raw_response(length=parameter.length)).data)
+            finally:
+                trace.set_trace(enable=False)
+            logging.getLogger('inverter').debug('Tracing off')
+            parse_modbus_response(parse_response(make_raw_response(length=parameter.length)).data)
+        self.assertEqual(
+            logs.output,
+            [
+                "DEBUG:inverter.connection:parse_response(data=b'+ok=010302044CBB71\\r\\n\\r\\n')",
+                "DEBUG:inverter.connection:RawModBusResponse(prefix='+ok=', data='010302044CBB71')",
+                "DEBUG:inverter.connection:parse_modbus_response(data='010302044CBB71')",
+                "DEBUG:inverter.connection:ModbusResponse(slave_id=1, modbus_function=3, data=b'\\x04L')",
+                'DEBUG:inverter:Tracing off',
+            ],
+        )
@@ -21,12 +21,12 @@ class ConnectionTestCase(TestCase):
     def test_parse_modbus_response(self):
         self.assertEqual(
             parse_modbus_response('010302012D79C9'),
-            ModbusResponse(slave_id=1, modbus_function=3, data_hex='012d'),
+            ModbusResponse(slave_id=1, modbus_function=3, data=b'\x01\x2d'),
         )
 
         self.assertEqual(
             parse_modbus_response('010304002B00008A3B'),
-            ModbusResponse(slave_id=1, modbus_function=3, data_hex='002b0000'),
+            ModbusResponse(slave_id=1, modbus_function=3, data=b'\x00\x2b\x00\x00'),
         )
 
     def test_parse_response(self):
@@ -1,13 +1,13 @@
 import logging
 import tempfile
-from datetime import timedelta
+from datetime import time, timedelta
 from pathlib import Path
 from unittest import TestCase
 
 from freezegun import freeze_time
 
 from inverter.daily_reset import DailyProductionReset, DailyProductionResetState
-from inverter.data_types import InverterValue, ValueType
+from inverter.data_types import InverterValue, ModbusResponse, ValueMeta, ValueType
 from inverter.tests import fixtures
 
 
@@ -21,124 +21,139 @@ class DailyProductionResetTestCase(TestCase):
             # On start, without a state file, the fallback is to don't reset on the same day:
             self.assertEqual(str(reset_state), 'self.last_reset=FakeDate(2020, 1, 1) self.reset_done_today=True')
 
-            class InverterMock:
+            class InvSockMock:
                 writes = []
-
-                def __init__(self):
-                    self.inv_sock = self
+                registers = {}
 
                 def write(self, *, address, values):
                     self.writes.append((address, values))
+                    for offset, value in enumerate(values):
+                        self.registers[address + offset] = value
+
+                def read_once(self, *, start_register, length):
+                    # Read back of the written time
+                    values = [self.registers[start_register + offset] for offset in range(length)]
+                    data = b''.join(value.to_bytes(2, 'big') for value in values)
+                    return ModbusResponse(slave_id=1, modbus_function=3, data=data)
+
+            def get_values(daily_production):
+                values = [
+                    InverterValue(
+                        type=ValueType.COMPUTED,
+                        value=80,
+                        spec=ValueMeta(
+                            name='Total Power',  # <<< it's not the correct value -> ignore
+                            device_class='power',
+                            state_class='measurement',
+                            unit='W',
+                        ),
+                    ),
+                    InverterValue(
+                        type=ValueType.READ_OUT,
+                        value=daily_production,
+                        spec=ValueMeta(
+                            name='Daily Production',
+                            device_class='power',
+                            state_class='measurement',
+                            unit='kWh',
+                        ),
+                    ),
+                ]
+                return {value.name: value for value in values}
 
-            inverter = InverterMock()
+            inv_sock = InvSockMock()
             config = fixtures.get_config()
+            self.assertEqual(config.daily_reset_window, (time(0, 0), time(12, 0)))
+            daily_production_reset = DailyProductionReset(reset_state, config)
 
             # On start, without a state file, the fallback is to do no reset on the same day:
-            with DailyProductionReset(reset_state, inverter, config) as daily_production_reset:
-                self.assertIs(daily_production_reset.reset_state.reset_done_today, True)
+            with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
+                daily_production_reset(inv_sock=inv_sock, values=get_values(daily_production=1))
+            self.assertEqual(
+                logs.output,
+                [
+                    'DEBUG:inverter.daily_reset:Not needed: self.last_reset=FakeDate(2020, 1, 1) '
+                    'self.reset_done_today=True'
+                ],
+            )
 
-                with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
-                    daily_production_reset(
-                        value='Fake InverterValue',  # noqa
-                    )
-                self.assertEqual(
-                    logs.output,
-                    [
-                        'DEBUG:inverter.daily_reset:Not needed: self.last_reset=FakeDate(2020, 1, 1) '
-                        'self.reset_done_today=True'
-                    ],
-                )
-
-                # Next day a reset is needed:
-                frozen_time.tick(delta=timedelta(days=1))
-                self.assertIs(daily_production_reset.reset_state.reset_done_today, False)
-
-                # Ignore all non 'Daily Production' values:
-                with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
+            # Next day a reset is needed, but not outside the quiet window:
+            frozen_time.tick(delta=timedelta(days=1, hours=12))
+            self.assertIs(reset_state.reset_done_today, False)
+            with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
+                daily_production_reset(inv_sock=inv_sock, values=get_values(daily_production=1))
+            self.assertEqual(
+                logs.output,
+                [
+                    'DEBUG:inverter.daily_reset:Not in reset window '
+                    '(datetime.time(0, 0), datetime.time(12, 0)): 2020-01-02 12:00:00'
+                ],
+            )
+            self.assertEqual(inv_sock.writes, [])
+
+            # A cycle without the "Daily Production" value:
+            frozen_time.move_to('2020-01-03T00:00:00+0000')
+            with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
+                daily_production_reset(inv_sock=inv_sock, values={})
+            self.assertEqual(logs.output, ["DEBUG:inverter.daily_reset:No 'Daily Production' in this cycle"])
+
+            # Trigger **two** times the reset:
+
+            with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
+                for _ in range(2):
+                    frozen_time.tick(delta=timedelta(minutes=2))
                     daily_production_reset(
-                        value=InverterValue(
-                            type=ValueType.COMPUTED,
-                            name='Total Power',  # <<< it's not the correct value -> ignore
-                            value=80,
-                            device_class='power',
-                            state_class='measurement',
-                            unit='W',
-                            result=None,
-                        )
+                        inv_sock=inv_sock,
+                        values=get_values(daily_production=1),  # <<< last reset not successfully
                     )
-                self.assertEqual(
-                    logs.output, ["DEBUG:inverter.daily_reset:Ignore 'Total Power' (It is not 'Daily Production')"]
-                )
-                self.assertEqual(inverter.writes, [])
-
-                # Trigger **two** times the reset:
-
-                with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
-                    for _ in range(2):
-                        frozen_time.tick(delta=timedelta(minutes=2))
-                        daily_production_reset(
-                            value=InverterValue(
-                                type=ValueType.READ_OUT,
-                                name='Daily Production',
-                                value=1,  # <<< last reset not successfully
-                                device_class='power',
-                                state_class='measurement',
-                                unit='kWh',
-                                result=None,
-                            )
-                        )
-                self.assertEqual(
-                    logs.output,
-                    [
-                        # first call:
-                        'INFO:inverter.daily_reset:set current time to reset counter '
-                        'self.last_reset=FakeDate(2020, 1, 1) self.reset_done_today=False',
-                        #
-                        # Second call:
-                        'INFO:inverter.daily_reset:set current time to reset counter '
-                        'self.last_reset=FakeDate(2020, 1, 1) self.reset_done_today=False',
-                    ],
-                )
-                self.assertIs(daily_production_reset.reset_state.reset_done_today, False)
-                self.assertEqual(
-                    inverter.writes,
-                    [
-                        (22, [5121, 512, 512]),  # <<< set time 1
-                        (22, [5121, 512, 1024]),  # <<< set time 2
-                    ],
-                )
-                inverter.writes.clear()
-
-                # success, two times
-
-                with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
-                    for _ in range(2):
-                        frozen_time.tick(delta=timedelta(minutes=2))
-                        daily_production_reset(
-                            value=InverterValue(
-                                type=ValueType.READ_OUT,
-                                name='Daily Production',
-                                value=0,  # <<< success
-                                device_class='power',
-                                state_class='measurement',
-                                unit='kWh',
-                                result=None,
-                            )
-                        )
-                self.assertEqual(
-                    logs.output,
-                    [
-                        'INFO:inverter.daily_reset:Store today date 2020-01-02 to state file',
-                        #
-                        'INFO:inverter.daily_reset:Successfully reset counter. '
-                        'self.last_reset=FakeDate(2020, 1, 2) self.reset_done_today=True',
-                        #
-                        'DEBUG:inverter.daily_reset:Not needed: self.last_reset=FakeDate(2020, 1, 2) '
-                        'self.reset_done_today=True',
-                    ],
-                )
-                self.assertIs(daily_production_reset.reset_state.reset_done_today, True)
-                self.assertEqual(inverter.writes, [])  # no new set time writes
+            self.assertEqual(
+                logs.output,
+                [
+                    # first call:
+                    'INFO:inverter.daily_reset:set current time to reset counter '
+                    'self.last_reset=FakeDate(2020, 1, 1) self.reset_done_today=False',
+                    'DEBUG:inverter.write_plan:Write response: None',
+                    'INFO:inverter.write_plan:2 written registers verified',
+                    #
+                    # Second call:
+                    'INFO:inverter.daily_reset:set current time to reset counter '
+                    'self.last_reset=FakeDate(2020, 1, 1) self.reset_done_today=False',
+                    'DEBUG:inverter.write_plan:Write response: None',
+                    'INFO:inverter.write_plan:2 written registers verified',
+                ],
+            )
+            self.assertIs(reset_state.reset_done_today, False)
+            self.assertEqual(
+                inv_sock.writes,
+                [
+                    (22, [5121, 768, 512]),  # <<< set time 1
+                    (22, [5121, 768, 1024]),  # <<< set time 2
+                ],
+            )
+            inv_sock.writes.clear()
+
+            # success, two times
+
+            with self.assertLogs(logger=None, level=logging.DEBUG) as logs:
+                for _ in range(2):
+                    frozen_time.tick(delta=timedelta(minutes=2))
+                    daily_production_reset(inv_sock=inv_sock, values=get_values(daily_production=0))  # <<< success
+            self.assertEqual(
+                logs.output,
+                [
+                    'INFO:inverter.daily_reset:Store today date 2020-01-03 to state file',
+                    #
+                    'INFO:inverter.daily_reset:Successfully reset counter. '
+                    'self.last_reset=FakeDate(2020, 1, 3) self.reset_done_today=True',
+                    #
+                    'DEBUG:inverter.daily_reset:Not needed: self.last_reset=FakeDate(2020, 1, 3) '
+                    'self.reset_done_today=True',
+                ],
+            )
+            self.assertIs(reset_state.reset_done_today, True)
+            self.assertEqual(inv_sock.writes, [])  # no new set time writes
+            self.assertEqual(reset_state.state_file_path.read_text(), '2020-01-03')
+            self.assertEqual([path.name for path in temp_path.iterdir()], ['daily_reset_state.txt'])
 
     @freeze_time('2020-01-01T00:00:00+0000', as_kwarg='frozen_time')
     def test_state(self, frozen_time):
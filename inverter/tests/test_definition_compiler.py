@@ -0,0 +1,111 @@
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+import yaml
+
+from inverter.definition_compiler import (
+    LINT_ERROR,
+    LINT_WARNING,
+    LintIssue,
+    compile_definition,
+    lint_definition,
+    write_compiled_definition,
+)
+from inverter.definitions import get_compiled_path, get_definition_names, load_definition_file
+from inverter.tests import fixtures
+
+
+def get_item(name, registers, rule=1, **kwargs):
+    return dict(
+        name=name,
+        **{'class': 'power'},
+        state_class='measurement',
+        uom='W',
+        scale=1,
+        rule=rule,
+        registers=registers,
+        **kwargs,
+    )
+
+
+class DefinitionCompilerTestCase(TestCase):
+    def test_shipped_definitions(self):
+        for name in get_definition_names():
+            with self.subTest(name=name):
+                config = fixtures.get_config(inverter_name=name)
+                compiled, issues = compile_definition(config.definition_file_path)
+                self.assertEqual([issue for issue in issues if issue.level == LINT_ERROR], [])
+                self.assertIn('full', compiled.read_plans)
+
+        config = fixtures.get_config(inverter_name='deye_4mppt')
+        compiled, issues = compile_definition(config.definition_file_path)
+        self.assertIn(
+            LintIssue(
+                level=LINT_WARNING,
+                message="'Total Production 3': Register 0x45 is also used by 'Total Production 1'",
+            ),
+            issues,
+        )
+
+    def test_lint(self):
+        data = {
+            'requests': [dict(start=0, end=0x10, mb_functioncode=3)],
+            'profiles': {'broken': dict(groups=['Foo'], names=['Bar'])},
+            'parameters': [
+                dict(
+                    group='Solar',
+                    items=[
+                        get_item('A', [0x1, 0x3]),
+                        get_item('B', [0x3], rule=99),
+                        get_item('A', [0x20]),
+                    ],
+                )
+            ],
+            'computed': [
+                dict(name='C', expression='{A} + {X}'),
+                dict(name='D', expression='{A} +'),
+            ],
+        }
+        self.assertEqual(
+            [(issue.level, issue.message) for issue in lint_definition(data)],
+            [
+                ('error', "'A': Registers are not contiguous: 0x1, 0x3"),
+                ('error', "'B': No parser for rule 99 with 1 registers"),
+                ('warning', "'B': Register 0x3 is also used by 'A'"),
+                ('error', "Duplicate name: 'A'"),
+                ('warning', '\'A\': Register 0x20 is not in the "requests" ranges'),
+                ('error', "Profile 'broken': Unknown group 'Foo'"),
+                ('error', "Profile 'broken': Unknown name 'Bar'"),
+                ('error', "Computed 'C': Unknown input 'X'"),
+                ('error', "Computed 'D': Invalid expression '{A} +': invalid syntax (<unknown>, line 1)"),
+            ],
+        )
+
+        issues = lint_definition({'parameters': [dict(group='Solar', items=[dict(name='A', unknown=1)])]})
+        self.assertEqual(len(issues), 1)
+        self.assertEqual(issues[0].level, LINT_ERROR)
+        self.assertIn('Invalid structure', issues[0].message)
+
+    def test_load_compiled(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            config = fixtures.get_config()
+            definition_file_path = Path(temp_dir) / 'deye_2mppt.yaml'
+            shutil.copy(config.definition_file_path, definition_file_path)
+            data = yaml.safe_load(definition_file_path.read_bytes())
+
+            compiled, issues = compile_definition(definition_file_path)
+            compiled_path = write_compiled_definition(definition_file_path=definition_file_path, compiled=compiled)
+            self.assertEqual(compiled_path, get_compiled_path(definition_file_path))
+
+            # Change the content of the compiled file, to see which file is used:
+            compiled.definition['parameters'][0]['group'] = 'Compiled'
+            write_compiled_definition(definition_file_path=definition_file_path, compiled=compiled)
+            self.assertEqual(load_definition_file(definition_file_path)['parameters'][0]['group'], 'Compiled')
+
+            # The outdated compiled file is ignored, if the yaml file is changed:
+            with definition_file_path.open('a') as f:
+                f.write('\n# changed\n')
+            with self.assertLogs('inverter.definitions', level='INFO'):
+                self.assertEqual(load_definition_file(definition_file_path), data)
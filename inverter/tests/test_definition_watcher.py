@@ -0,0 +1,50 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from inverter.definition_watcher import DefinitionWatcher
+from inverter.tests import fixtures
+
+
+class DefinitionWatcherTestCase(TestCase):
+    def test_reload(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            config = fixtures.get_config()
+            definition_file_path = Path(temp_dir) / 'deye_2mppt.yaml'
+            validation_file_path = Path(temp_dir) / 'deye_2mppt_validations.yaml'
+            shutil.copy(config.definition_file_path, definition_file_path)
+            shutil.copy(config.validation_file_path, validation_file_path)
+            config.definition_file_path = definition_file_path
+            config.validation_file_path = validation_file_path
+
+            watcher = DefinitionWatcher(config)
+            definitions = watcher.get_definitions()
+            self.assertIs(watcher.get_definitions(), definitions)  # Not changed -> not reloaded
+            spec = definitions.value_validator.spec_map['Radiator Temperature']
+            self.assertEqual(spec.min_value, -9.9)
+
+            def change_file(path: Path, old: str, new: str):
+                mtime_ns = path.stat().st_mtime_ns
+                path.write_text(path.read_text().replace(old, new, 1))
+                os.utime(path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+
+            change_file(validation_file_path, 'min_value: -9.9', 'min_value: -20')
+            new_definitions = watcher.get_definitions()
+            self.assertIsNot(new_definitions, definitions)
+            self.assertEqual(new_definitions.value_validator.spec_map['Radiator Temperature'].min_value, -20)
+            self.assertEqual(definitions.value_validator.spec_map['Radiator Temperature'].min_value, -9.9)
+
+            # Add a new value:
+            change_file(
+                definition_file_path,
+                'computed:',
+                'computed:\n  - name: "Double PV1 Power"\n    expression: "2 * {PV1 Power}"',
+            )
+            new_definitions = watcher.get_definitions()
+            self.assertIn('Double PV1 Power', new_definitions.names)
+
+            # Broken files -> use the last definitions:
+            change_file(definition_file_path, 'parameters:', 'parameters: [')
+            self.assertIs(watcher.get_definitions(), new_definitions)
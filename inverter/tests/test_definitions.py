@@ -1,9 +1,9 @@
 from unittest import TestCase
 
 from inverter.data_types import Parameter
-from inverter.definitions import get_definition, get_definition_names, get_parameter
+from inverter.definitions import get_definition, get_definition_names, get_parameter, get_profiles
 from inverter.tests import fixtures
-from inverter.utilities.modbus_converter import parse_number
+from inverter.utilities.modbus_converter import PARSERS
 
 
 class DefinitionsTestCase(TestCase):
@@ -52,4 +52,64 @@ class DefinitionsTestCase(TestCase):
                 lookup=None,
             ),
         )
-        self.assertIs(example.parser, parse_number)
+        self.assertIs(example.parser, PARSERS['uint16'])
+
+    def test_all_parameters_have_a_parser(self):
+        for inverter_name in get_definition_names():
+            with self.subTest(inverter_name=inverter_name):
+                config = fixtures.get_config(inverter_name=inverter_name, compact=False)
+                parsers = {parameter.name: parameter.parser.__name__ for parameter in get_parameter(config=config)}
+                self.assertTrue(set(parsers.values()) <= set(PARSERS), parsers)
+
+        self.assertEqual(parsers['Total Production'], 'uint32_swapped')
+        self.assertEqual(parsers['Battery Current'], 'int16')
+        self.assertEqual(parsers['Inverter ID'], 'parse_string')
+        self.assertEqual(parsers['Alert'], 'parse_bitfield')
+
+    def test_parse_values(self):
+        config = fixtures.get_config(inverter_name='deye_2mppt', compact=False)
+        parameters = {parameter.name: parameter for parameter in get_parameter(config=config)}
+
+        def parse(name, data_hex):
+            parameter = parameters[name]
+            return parameter.parser(
+                data=bytes.fromhex(data_hex), scale=parameter.scale, offset=parameter.offset, lookup=parameter.lookup
+            )
+
+        self.assertEqual(parse('Update Time', '170a1f0c2205'), '2023-10-31 12:34:05')
+        self.assertEqual(parse('Total Production', '86a00001'), 10000.0)  # Low word first
+        self.assertEqual(parse('Grid Current', 'fff6'), -1.0)  # signed
+        self.assertEqual(parse('PV1 Voltage', 'ea60'), 6000.0)  # unsigned
+
+    def test_profiles(self):
+        for inverter_name in get_definition_names():
+            config = fixtures.get_config(inverter_name=inverter_name)
+            all_parameters = get_parameter(config=fixtures.get_config(inverter_name=inverter_name, compact=False))
+            names = [parameter.name for parameter in all_parameters]
+            groups = {parameter.group for parameter in all_parameters}
+
+            profiles = get_profiles(config=config)
+            self.assertEqual(sorted(profiles), ['compact', 'diagnostics', 'full', 'minimal', 'power'])
+            for profile_name, profile in profiles.items():
+                with self.subTest(inverter_name=inverter_name, profile=profile_name):
+                    self.assertTrue(set(profile.groups) <= groups, profile.groups)
+                    self.assertTrue(set(profile.names) <= set(names), profile.names)
+
+                    config = fixtures.get_config(inverter_name=inverter_name, profile=profile_name)
+                    profile_names = [parameter.name for parameter in get_parameter(config=config)]
+                    self.assertEqual(profile_names, [name for name in names if name in profile_names])
+
+            # "--compact" reads only the "solar" group:
+            compact_parameters = get_parameter(config=fixtures.get_config(inverter_name=inverter_name, compact=True))
+            solar_parameters = [parameter for parameter in all_parameters if parameter.group == 'solar']
+            self.assertEqual(compact_parameters, solar_parameters)
+
+        config = fixtures.get_config(profile='minimal')
+        self.assertEqual(
+            [parameter.name for parameter in get_parameter(config=config)],
+            ['PV1 Voltage', 'PV2 Voltage', 'PV1 Current', 'PV2 Current', 'Daily Production', 'Total Production'],
+        )
+
+        config = fixtures.get_config(profile='foobar')
+        with self.assertRaisesRegex(KeyError, r"Unknown read profile 'foobar' for 'deye_2mppt'"):
+            get_parameter(config=config)
@@ -0,0 +1,133 @@
+from unittest import TestCase
+
+from inverter.data_types import DerivedValueSpec, InverterValue, ValueMeta, ValueType
+from inverter.definitions import get_derived_specs, get_parameter
+from inverter.derived_values import DerivedValues
+from inverter.exceptions import DefinitionError
+from inverter.tests import fixtures
+
+
+def get_value(name, value, unit) -> InverterValue:
+    return InverterValue(
+        type=ValueType.READ_OUT,
+        value=value,
+        spec=ValueMeta(
+            name=name,
+            device_class='',
+            state_class='measurement',
+            unit=unit,
+        ),
+    )
+
+
+def get_computed(name, value) -> tuple:
+    return ValueType.COMPUTED, name, value, 'power', 'measurement', 'W'
+
+
+def values2tuples(values) -> list[tuple]:
+    return [
+        (value.type, value.name, value.value, value.device_class, value.state_class, value.unit) for value in values
+    ]
+
+
+class DerivedValuesTestCase(TestCase):
+    def test_2mppt_definition(self):
+        config = fixtures.get_config(inverter_name='deye_2mppt', compact=False)
+        parameters = get_parameter(config=config)
+        derived_values = DerivedValues(
+            specs=get_derived_specs(config=config),
+            available_names=[parameter.name for parameter in parameters],
+        )
+        self.assertEqual(derived_values.names, ['PV1 Power', 'PV2 Power', 'Total Power', 'Inverter Efficiency'])
+
+        self.assertEqual(list(derived_values(values={})), [])
+
+        values = {
+            'PV1 Voltage': get_value('PV1 Voltage', 30, 'V'),
+            'PV1 Current': get_value('PV1 Current', 1, 'A'),
+        }
+        self.assertEqual(values2tuples(derived_values(values)), [get_computed('PV1 Power', 30)])
+
+        values['PV2 Voltage'] = get_value('PV2 Voltage', 25, 'V')
+        values['PV2 Current'] = get_value('PV2 Current', 2, 'A')
+        self.assertEqual(
+            values2tuples(derived_values(values)),
+            [
+                get_computed('PV1 Power', 30),
+                get_computed('PV2 Power', 50),
+                get_computed('Total Power', 80),
+            ],
+        )
+
+        values['Total AC Output Power (Active)'] = get_value('Total AC Output Power (Active)', 75.2, 'W')
+        results = list(derived_values(values))
+        self.assertEqual(results[-1].name, 'Inverter Efficiency')
+        self.assertEqual(results[-1].value, 94.0)
+        self.assertEqual(results[-1].unit, '%')
+
+        # Division by zero at night:
+        values['PV1 Current'].value = 0
+        values['PV2 Current'].value = 0
+        values['Total AC Output Power (Active)'].value = 0
+        results = list(derived_values(values))
+        self.assertEqual(
+            [(value.name, value.value) for value in results[2:]],
+            [('Total Power', 0), ('Inverter Efficiency', 0)],
+        )
+
+    def test_incremental(self):
+        calls = []
+
+        def mul(a, b):
+            calls.append((a, b))
+            return a * b
+
+        derived_values = DerivedValues(
+            specs=[
+                DerivedValueSpec(name='Sum', expression='{Product} + 1'),
+                DerivedValueSpec(name='Product', expression='{A} * {B}'),
+            ],
+            available_names=['A', 'B'],
+        )
+        # Sorted by dependencies:
+        self.assertEqual(derived_values.names, ['Product', 'Sum'])
+
+        product = derived_values.derived_values[0]
+        func = product.func
+        product.func = lambda a, b: mul(a, b) and func(a, b)
+
+        values = {'A': get_value('A', 2, ''), 'B': get_value('B', 3, '')}
+        self.assertEqual([value.value for value in derived_values(values)], [6, 7])
+        self.assertEqual([value.value for value in derived_values(values)], [6, 7])
+        self.assertEqual(calls, [(2, 3)])  # Not recomputed, because inputs are the same
+
+        values['B'].value = 4
+        self.assertEqual([value.value for value in derived_values(values)], [8, 9])
+        self.assertEqual(calls, [(2, 3), (2, 4)])
+
+    def test_errors(self):
+        # Read out values wins:
+        with self.assertLogs('inverter.derived_values') as logs:
+            derived_values = DerivedValues(
+                specs=[DerivedValueSpec(name='A', expression='{B} * 2')],
+                available_names=['A', 'B'],
+            )
+        self.assertEqual(derived_values.names, [])
+        self.assertEqual(
+            logs.output,
+            ["WARNING:inverter.derived_values:Skip computed 'A': There is a read out value with the same name"],
+        )
+
+        with self.assertRaises(DefinitionError) as err:
+            DerivedValues(specs=[DerivedValueSpec(name='X', expression='foo + {A}')], available_names=['A'])
+        self.assertEqual(str(err.exception), "Unknown name 'foo' in: 'foo + {A}'")
+
+        with self.assertRaises(DefinitionError) as err:
+            DerivedValues(
+                specs=[
+                    DerivedValueSpec(name='X', expression='{Y} + {A}'),
+                    DerivedValueSpec(name='Y', expression='{X} + {A}'),
+                ],
+                available_names=['A'],
+            )
+        self.assertIn('Circular or unresolvable dependency', str(err.exception))
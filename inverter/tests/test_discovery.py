@@ -0,0 +1,57 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from inverter.data_types import InverterInfo
+from inverter.discovery import DiscoveryCache, discover_loggers, rediscover_host
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+
+
+class DiscoveryTestCase(TestCase):
+    def test_discover_and_rediscover(self):
+        with InverterSimulator(host='127.0.0.2', serial=111) as simulator1:
+            # All logger sticks listen on the same port:
+            port = simulator1.port
+            with InverterSimulator(host='127.0.0.3', port=port, serial=222, mac='112233445566'):
+                inverter_infos = discover_loggers(port=port, targets=('127.0.0.2', '127.0.0.3'), timeout=0.5)
+                self.assertEqual(
+                    inverter_infos,
+                    [
+                        InverterInfo(ip='127.0.0.2', mac='AABBCCDDEEFF', serial=111),
+                        InverterInfo(ip='127.0.0.3', mac='112233445566', serial=222),
+                    ],
+                )
+                self.assertEqual(simulator1.received, [b'WIFIKIT-214028-READ'])
+
+                with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+                    cache_path = Path(temp_dir) / 'discovered_loggers.json'
+                    cache = DiscoveryCache(cache_path=cache_path)
+                    cache.update([InverterInfo(ip='127.0.0.4', mac='112233445566', serial=222)])
+                    cache.save()
+
+                    # The logger stick with serial 222 has moved from 127.0.0.4 to 127.0.0.3:
+                    config = fixtures.get_config(host='127.0.0.4', port=port)
+                    cache = DiscoveryCache(cache_path=cache_path)
+                    changed = rediscover_host(
+                        config=config,
+                        serial=None,  # Will be taken from the cache
+                        cache=cache,
+                        targets=('127.0.0.2', '127.0.0.3'),
+                        timeout=0.5,
+                    )
+                    self.assertIs(changed, True)
+                    self.assertEqual(config.host, '127.0.0.3')
+
+                    # All found logger sticks are stored:
+                    cache = DiscoveryCache(cache_path=cache_path)
+                    self.assertEqual(cache.get_ip(serial=111), '127.0.0.2')
+                    self.assertEqual(cache.get_ip(serial=222), '127.0.0.3')
+                    self.assertEqual(cache.get_serial(ip='127.0.0.3'), 222)
+
+                    # Unknown serial -> no change:
+                    changed = rediscover_host(
+                        config=config, serial=333, cache=cache, targets=('127.0.0.3',), timeout=0.2
+                    )
+                    self.assertIs(changed, False)
+                    self.assertEqual(config.host, '127.0.0.3')
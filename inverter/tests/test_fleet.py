@@ -0,0 +1,60 @@
+import socket
+from unittest import TestCase
+
+from inverter.fleet import fetch_inventory, fleet_inventory
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+
+
+class FleetInventoryTestCase(TestCase):
+    def test_fleet_inventory(self):
+        registers1 = {0x0D: 0x1234, 0x0E: 0x0105, 0x12: 0x0102}
+        registers2 = {0x0D: 0x2001, 0x0E: 0x0106, 0x12: 0x0103}
+        with InverterSimulator(registers=registers1, serial=111) as simulator1:
+            with InverterSimulator(registers=registers2, serial=222, mac='112233445566') as simulator2:
+                configs = [
+                    fixtures.get_config(host=simulator1.host, port=simulator1.port),
+                    fixtures.get_config(host='123.456.789.666'),
+                    fixtures.get_config(host=simulator2.host, port=simulator2.port),
+                ]
+                results = fleet_inventory(configs=configs, max_workers=3)
+
+        results = [result.as_dict() for result in results]
+        self.assertEqual(
+            results[0],
+            {
+                'host': '127.0.0.1',
+                'ip': '127.0.0.1',
+                'mac': 'AABBCCDDEEFF',
+                'serial': 111,
+                'versions': {
+                    'Control Board Firmware': '1.2.3.4',
+                    'Communication Board Firmware': '0.1.0.5',
+                    'Communication Protocol': '0.1.0.2',
+                },
+                'error': None,
+            },
+        )
+        self.assertEqual(results[1]['host'], '123.456.789.666')
+        self.assertEqual(results[1]['versions'], {})
+        self.assertIn('Hint: Check 123.456.789.666:48899', results[1]['error'])
+        self.assertEqual(results[2]['serial'], 222)
+        self.assertEqual(results[2]['mac'], '112233445566')
+        self.assertEqual(results[2]['versions']['Control Board Firmware'], '2.0.0.1')
+
+    def test_no_retries(self):
+        # A host that receives the handshake, but never answers:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP) as sock:
+            sock.bind(('127.0.0.1', 0))
+            host, port = sock.getsockname()
+            result = fetch_inventory(fixtures.get_config(host=host, port=port, socket_timeout=1))
+            self.assertIn('Get no response from 127.0.0.1', result.error)
+
+            sock.setblocking(False)
+            handshakes = []
+            while True:
+                try:
+                    handshakes.append(sock.recv(1024))
+                except BlockingIOError:
+                    break
+        self.assertEqual(handshakes, [b'WIFIKIT-214028-READ'])
@@ -0,0 +1,82 @@
+import urllib.error
+import urllib.request
+from unittest import TestCase
+
+from packaging.version import Version
+
+from inverter.data_types import InverterInfo, InverterValue, ValueMeta, ValueType
+from inverter.metrics import MetricsSnapshot, start_metrics_server
+from inverter.publish_loop import publish_streaming
+from inverter.tests.test_publish_loop import InverterMock, PublisherMock, get_value
+
+
+class MetricsTestCase(TestCase):
+    def test_snapshot(self):
+        snapshot = MetricsSnapshot()
+        snapshot.set_inverter_info(InverterInfo(ip='127.0.0.1', mac='AABBCCDDEEFF', serial=12345))
+        snapshot.set_value(get_value('PV1 Power', 10))
+        snapshot.set_value(
+            InverterValue(
+                type=ValueType.COMPUTED,
+                value=Version('1.2.3'),
+                spec=ValueMeta(
+                    name='Firmware',
+                    device_class='',
+                    state_class=None,
+                    unit='',
+                ),
+            )
+        )
+        snapshot.set_value(get_value('PV2 Power', 'no data'))
+        text = snapshot.render().decode()
+        self.assertEqual(
+            text,
+            (
+                '# HELP inverter_logger_info Information about the logger stick\n'
+                '# TYPE inverter_logger_info gauge\n'
+                'inverter_logger_info{ip="127.0.0.1",mac="AABBCCDDEEFF",serial="12345"} 1\n'
+                '# HELP inverter_pv1_power PV1 Power\n'
+                '# TYPE inverter_pv1_power gauge\n'
+                'inverter_pv1_power{group="read out",device_class="power",unit="W"} 10.0\n'
+                '# HELP inverter_firmware_info Firmware\n'
+                '# TYPE inverter_firmware_info gauge\n'
+                'inverter_firmware_info{group="computed",device_class="",unit="",value="1.2.3"} 1\n'
+            ),
+        )
+        self.assertIs(snapshot.render(), snapshot.render())  # Rendered only once
+
+        snapshot.cycle_done(duration=1.5, success=False)
+        snapshot.cycle_done(duration=0.5, success=True)
+        text = snapshot.render().decode()
+        self.assertIn('# TYPE inverter_loop_cycles_total counter\ninverter_loop_cycles_total 2.0\n', text)
+        self.assertIn('inverter_loop_errors_total 1.0\n', text)
+        self.assertIn('inverter_loop_last_cycle_duration_seconds 0.5\n', text)
+        self.assertIn('inverter_loop_last_success_timestamp_seconds ', text)
+
+        # A value that is "no data" in the next cycle will be removed:
+        snapshot.set_value(get_value('PV1 Power', 'no data'))
+        self.assertNotIn('inverter_pv1_power', snapshot.render().decode())
+
+    def test_server(self):
+        snapshot = MetricsSnapshot()
+        publish_streaming(
+            inverter=InverterMock(values=[get_value('PV1 Power', 10)]),
+            publisher=PublisherMock(),
+            start_time=0,
+            ha_values={},
+            metrics=snapshot,
+        )
+        server = start_metrics_server(snapshot=snapshot, host='127.0.0.1', port=0)
+        try:
+            url = f'http://127.0.0.1:{server.server_port}'
+            with urllib.request.urlopen(f'{url}/metrics') as response:
+                self.assertEqual(response.headers['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+                text = response.read().decode()
+            self.assertIn('inverter_pv1_power{group="read out",device_class="power",unit="W"} 10.0\n', text)
+
+            with self.assertRaises(urllib.error.HTTPError) as cm:
+                urllib.request.urlopen(f'{url}/foo')
+            self.assertEqual(cm.exception.code, 404)
+        finally:
+            server.shutdown()
+            server.server_close()
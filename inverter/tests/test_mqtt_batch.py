@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from inverter.data_types import InverterInfo
+from inverter.mqtt_batch import BatchMqttPublisher, PublishStats
+from inverter.publish_loop import DiscoveryConfigs, inverter_value2ha_value, publish_values
+from inverter.tests.test_publish_loop import get_value
+
+
+class MessageInfoMock:
+    def __init__(self, rc=0):
+        self.rc = rc
+
+    def wait_for_publish(self, timeout=None):
+        if self.rc:
+            raise RuntimeError(f'Message publish failed: {self.rc}')
+
+
+class MqttClientMock:
+    def __init__(self, rc=0):
+        self.rc = rc
+        self.messages = []
+
+    def publish(self, *, topic, payload, qos=0, retain=False):
+        self.messages.append((topic, payload, qos, retain))
+        return MessageInfoMock(rc=self.rc)
+
+
+class BatchPublisherMock(BatchMqttPublisher):
+    def __init__(self, max_pending=100, rc=0):  # Without MQTT connection
+        self.verbosity = 0
+        self.send_count = 0
+        self.discovery_configs = DiscoveryConfigs()
+        self.availability_topic = None
+        self.availability = {}
+        self.mqttc = MqttClientMock(rc=rc)
+        self.max_pending = max_pending
+        self.pending = {}
+        self.stats = PublishStats()
+
+
+def publish_devices(publisher, serials, value=10) -> None:
+    for serial in serials:
+        publish_values(
+            publisher=publisher,
+            inverter_info=InverterInfo(ip='127.0.0.1', mac='mac', serial=serial),
+            values=[inverter_value2ha_value(get_value('PV1 Power', value))],
+        )
+
+
+class BatchMqttPublisherTestCase(TestCase):
+    def test_flush(self):
+        publisher = BatchPublisherMock()
+        publish_devices(publisher, serials=(1, 2))
+        self.assertEqual(publisher.mqttc.messages, [])  # Nothing send before the flush
+
+        stats = publisher.flush()
+        topics = [topic for topic, payload, qos, retain in publisher.mqttc.messages]
+        self.assertEqual(
+            topics,
+            [
+                'homeassistant/sensor/inverter_1_pv1power/config',
+                'homeassistant/sensor/inverter_1/state',
+                'homeassistant/sensor/inverter_1/availability',
+                'homeassistant/sensor/inverter_2_pv1power/config',
+                'homeassistant/sensor/inverter_2/state',
+                'homeassistant/sensor/inverter_2/availability',
+            ],
+        )
+        self.assertEqual({qos for topic, payload, qos, retain in publisher.mqttc.messages}, {0})
+        self.assertEqual(publisher.mqttc.messages[2][1:], ('online', 0, True))
+        self.assertEqual((stats.batches, stats.messages, stats.queue_depth, stats.max_queue_depth), (1, 6, 6, 6))
+
+        # The state of a device is send only once per batch, with the last values:
+        publisher.mqttc.messages.clear()
+        publish_devices(publisher, serials=(1, 1, 1), value=10)
+        publish_devices(publisher, serials=(1,), value=20)
+        stats = publisher.flush()
+        self.assertEqual(
+            publisher.mqttc.messages,
+            [('homeassistant/sensor/inverter_1/state', '{"inverter_1_pv1power": 20}', 0, False)],
+        )
+        self.assertEqual((stats.batches, stats.messages, stats.skipped, stats.queue_depth), (2, 7, 3, 1))
+        self.assertEqual(stats.max_queue_depth, 6)
+
+        stats = publisher.flush()
+        self.assertEqual((stats.batches, stats.queue_depth, stats.latency), (2, 0, 0))
+
+    def test_max_pending(self):
+        publisher = BatchPublisherMock(max_pending=4)
+        publish_devices(publisher, serials=(1, 2))
+        self.assertEqual(len(publisher.mqttc.messages), 4)
+        self.assertEqual(len(publisher.pending), 2)
+
+    def test_errors(self):
+        publisher = BatchPublisherMock(rc=4)  # MQTT_ERR_NO_CONN
+        publish_devices(publisher, serials=(1,))
+        with self.assertLogs('inverter.mqtt_batch', level='WARNING'):
+            stats = publisher.flush()
+        self.assertEqual((stats.messages, stats.errors), (0, 3))
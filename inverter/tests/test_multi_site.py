@@ -0,0 +1,134 @@
+import time
+from unittest import TestCase
+
+from inverter.data_types import InverterInfo
+from inverter.definitions import get_parameter
+from inverter.multi_site import MultiSitePoller, SiteResult, publish_site_result
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+from inverter.tests.test_night_mode import PublisherMock
+from inverter.tests.test_publish_loop import get_value
+
+
+def get_registers() -> dict:
+    registers = {}
+    for parameter in get_parameter(config=fixtures.get_config()):
+        for offset in range(parameter.length):
+            registers[parameter.start_register + offset] = 100
+    return registers
+
+
+class SlowSimulator(InverterSimulator):
+    def modbus(self, request: bytes) -> str:
+        time.sleep(0.2)
+        return super().modbus(request)
+
+
+class MultiSitePollerTestCase(TestCase):
+    def test_poll(self):
+        with (
+            InverterSimulator(registers=get_registers(), serial=1) as site1,
+            InverterSimulator(registers=get_registers(), serial=2) as site2,
+            SlowSimulator(registers=get_registers(), serial=3) as slow_site,
+        ):
+            configs = [
+                fixtures.get_config(host=simulator.host, port=simulator.port, socket_timeout=1)
+                for simulator in (site1, site2, slow_site)
+            ]
+            with MultiSitePoller(configs=configs, max_workers=2, site_deadline=0.5, cycle_time=5) as poller:
+                results = {result.inverter_info.serial: result for result in poller.poll()}
+
+        self.assertEqual(sorted(results), [1, 2, 3])
+        value_count = len(results[1].values)
+        for serial in (1, 2):
+            result = results[serial]
+            self.assertTrue(result.complete, result)
+            self.assertEqual(len(result.values), value_count)
+            self.assertEqual(result.values[0].name, 'PV1 Voltage')
+
+        # The slow site exceeds its deadline:
+        result = results[3]
+        self.assertIs(result.timed_out, True)
+        self.assertFalse(result.complete)
+        self.assertLess(len(result.values), value_count)
+
+    def test_cycle_deadline(self):
+        with SlowSimulator(registers=get_registers()) as simulator:
+            configs = [fixtures.get_config(host=simulator.host, port=simulator.port, socket_timeout=1)] * 2
+            with MultiSitePoller(configs=configs, max_workers=1, cycle_time=0.3) as poller:
+                results = list(poller.poll())
+
+                # Both reads are cancelled at the cycle deadline: The second one was not started
+                self.assertEqual(
+                    [(result.error, result.timed_out) for result in results],
+                    [
+                        ('Cycle deadline exceeded', True),
+                        ('Cycle deadline exceeded', True),
+                    ],
+                )
+                self.assertIs(poller.readers[1].future.cancelled(), True)
+
+                # The first read is still running: Don't start it again in the next cycle
+                results = list(poller.poll())
+                self.assertEqual(results[0].error, 'Last read is still running')
+                poller.readers[0].future.result(timeout=5)
+
+    def test_publish_site_result(self):
+        publisher = PublisherMock()
+        result = SiteResult(host='127.0.0.1', timed_out=True)
+        self.assertIs(publish_site_result(publisher=publisher, result=result, start_time=0), False)
+        self.assertEqual(publisher.published, [])
+
+        # One publisher for all sites: Every device gets its own availability
+        for serial in (1, 2):
+            result = SiteResult(
+                host='127.0.0.1',
+                inverter_info=InverterInfo(ip='127.0.0.1', mac='mac', serial=serial),
+                values=[get_value('PV1 Power', 10)],
+            )
+            self.assertIs(publish_site_result(publisher=publisher, result=result, start_time=0), True)
+        self.assertEqual(
+            [topic for topic, payload in publisher.published if topic.endswith('/state')],
+            ['homeassistant/sensor/inverter_1/state', 'homeassistant/sensor/inverter_2/state'],
+        )
+        self.assertEqual(
+            publisher.mqttc.messages,
+            [
+                ('homeassistant/sensor/inverter_1/availability', 'online', True),
+                ('homeassistant/sensor/inverter_2/availability', 'online', True),
+            ],
+        )
+
+        # A failed site is set offline, if it was published before:
+        availability_topics = {}
+        for host, serial in (('192.168.1.1', 1), ('192.168.1.2', 2)):
+            result = SiteResult(
+                host=host,
+                inverter_info=InverterInfo(ip=host, mac='mac', serial=serial),
+                values=[get_value('PV1 Power', 10)],
+            )
+            publish_site_result(
+                publisher=publisher, result=result, start_time=0, availability_topics=availability_topics
+            )
+        self.assertEqual(
+            availability_topics,
+            {
+                '192.168.1.1': 'homeassistant/sensor/inverter_1/availability',
+                '192.168.1.2': 'homeassistant/sensor/inverter_2/availability',
+            },
+        )
+        publisher.mqttc.messages.clear()
+        for _ in range(2):
+            result = SiteResult(host='192.168.1.1', error='Get no response')
+            self.assertIs(
+                publish_site_result(
+                    publisher=publisher, result=result, start_time=0, availability_topics=availability_topics
+                ),
+                False,
+            )
+        result = SiteResult(host='192.168.1.3', timed_out=True)  # Never published -> nothing to send
+        publish_site_result(publisher=publisher, result=result, start_time=0, availability_topics=availability_topics)
+        self.assertEqual(
+            publisher.mqttc.messages,
+            [('homeassistant/sensor/inverter_1/availability', 'offline', True)],  # Only send changes
+        )
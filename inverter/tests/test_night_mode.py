@@ -0,0 +1,113 @@
+import datetime
+from unittest import TestCase
+
+from ha_services.mqtt4homeassistant.converter import values2mqtt_payload
+from ha_services.mqtt4homeassistant.data_classes import HaValue, HaValues
+
+from inverter.night_mode import NightMode
+from inverter.publish_loop import DiscoveryConfigs, InverterMqttPublisher
+from inverter.tests.test_publish_loop import get_value
+
+
+UTC = datetime.timezone.utc
+
+
+class MqttClientMock:
+    def __init__(self):
+        self.messages = []
+
+    def publish(self, *, topic, payload, retain=False):
+        self.messages.append((topic, payload, retain))
+
+
+class PublisherMock(InverterMqttPublisher):
+    def __init__(self):  # Without MQTT connection
+        self.verbosity = 0
+        self.send_count = 0
+        self.discovery_configs = DiscoveryConfigs()
+        self.availability_topic = None
+        self.availability = {}
+        self.mqttc = MqttClientMock()
+        self.published = []
+
+    def publish(self, *, topic, payload):
+        self.published.append((topic, payload))
+
+
+class NightModeTestCase(TestCase):
+    def test_state_machine(self):
+        night_mode = NightMode(sleep_after_failures=2, probe_interval=300)
+
+        # Outage while the inverter produces: Not asleep
+        night_mode.add_cycle([get_value('PV1 Power', 100), get_value('PV1 Voltage', 'no data')])
+        self.assertIs(night_mode.producing, True)
+        self.assertIs(night_mode.handshake_failed(), False)
+        self.assertIs(night_mode.handshake_failed(), False)
+        self.assertIs(night_mode.asleep, False)
+
+        # Values without power values don't change the production state:
+        night_mode.add_cycle([])
+        self.assertIs(night_mode.producing, True)
+
+        # No production before the handshake failures: Sleep
+        self.assertIs(night_mode.handshake_done(), False)
+        night_mode.add_cycle([get_value('PV1 Power', 0), get_value('Total Load Power', 50)])
+        self.assertIs(night_mode.handshake_failed(), False)
+        self.assertIs(night_mode.handshake_failed(), True)
+        self.assertIs(night_mode.asleep, True)
+        self.assertIs(night_mode.handshake_failed(), True)
+        self.assertEqual(night_mode.get_sleep_time(), 300)  # No location -> slow probe interval
+
+        # The logger stick answers again:
+        self.assertIs(night_mode.handshake_done(), True)
+        self.assertIs(night_mode.asleep, False)
+        self.assertEqual(night_mode.failures, 0)
+
+    def test_production_at_dusk(self):
+        night_mode = NightMode(sleep_after_failures=3, probe_interval=300, production_timeout=600)
+
+        # The last cycle at dusk still had a few Watt:
+        dusk = datetime.datetime(2024, 6, 21, 19, 30, tzinfo=UTC)
+        night_mode.add_cycle([get_value('Total AC Output Power (Active)', 4)], now=dusk)
+        self.assertIs(night_mode.producing, True)
+
+        # Short outage: The last production prevents the sleep
+        for minutes in (1, 2, 3, 4):
+            self.assertIs(night_mode.handshake_failed(now=dusk + datetime.timedelta(minutes=minutes)), False)
+        self.assertIs(night_mode.asleep, False)
+
+        # The production is outdated: The next failures send the inverter to sleep
+        self.assertIs(night_mode.handshake_failed(now=dusk + datetime.timedelta(minutes=11)), True)
+        self.assertIs(night_mode.producing, False)
+        self.assertIs(night_mode.asleep, True)
+
+    def test_sleep_until_sunrise(self):
+        night_mode = NightMode(latitude=52.52, longitude=13.40, probe_interval=300)
+
+        # In the night: Sleep until 15 min. before the sunrise at 02:43 UTC
+        sleep_time = night_mode.get_sleep_time(now=datetime.datetime(2024, 6, 21, 22, 0, tzinfo=UTC))
+        self.assertAlmostEqual(sleep_time / 60, 4 * 60 + 28, delta=1)
+
+        # Shortly before the sunrise and at daytime: Slow probe interval
+        self.assertEqual(night_mode.get_sleep_time(now=datetime.datetime(2024, 6, 22, 2, 30, tzinfo=UTC)), 300)
+        self.assertEqual(night_mode.get_sleep_time(now=datetime.datetime(2024, 6, 22, 10, 0, tzinfo=UTC)), 300)
+
+    def test_availability(self):
+        publisher = PublisherMock()
+        publisher.set_availability(online=False)  # Unknown device -> nothing to send
+        self.assertEqual(publisher.mqttc.messages, [])
+
+        values = HaValues(
+            device_name='12345',
+            values=[HaValue(name='PV1 Power', value=10, device_class='power', state_class='measurement', unit='W')],
+        )
+        for _ in range(2):
+            publisher.publish2homeassistant(ha_mqtt_payload=values2mqtt_payload(values=values, name_prefix='inverter'))
+
+        topic = 'homeassistant/sensor/inverter_12345/availability'
+        self.assertEqual(publisher.published[0][1]['availability_topic'], topic)
+        self.assertEqual(publisher.mqttc.messages, [(topic, 'online', True)])  # Only send changes
+
+        publisher.set_availability(online=False)
+        publisher.set_availability(online=False)
+        self.assertEqual(publisher.mqttc.messages, [(topic, 'online', True), (topic, 'offline', True)])
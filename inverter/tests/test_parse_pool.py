@@ -0,0 +1,144 @@
+import pickle
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest import TestCase
+
+from inverter.api import load_definitions
+from inverter.benchmark import make_raw_response
+from inverter.constants import ERROR_STR_NO_DATA
+from inverter.data_types import InverterInfo, ValueType
+from inverter.multi_site import MultiSitePoller
+from inverter.parse_pool import RawSiteReplies, parse_batch, parsed2values
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+from inverter.tests.test_multi_site import get_registers
+
+
+class FlakySimulator(InverterSimulator):
+    def modbus(self, request: bytes) -> str:
+        if not any(command.startswith(b'AT+INVDATA') for command in self.received[:-1]):
+            return 'no data'  # Only the first read request fails
+        return super().modbus(request)
+
+
+class ParsePoolTestCase(TestCase):
+    def test_parse_batch(self):
+        config = fixtures.get_config()
+        definitions = load_definitions(config)
+        replies = [make_raw_response(length=block.length) for block in definitions.read_plan]
+        replies[1] = b'+ok=no data\r\n\r\n'  # Daily Production
+        batch = [
+            RawSiteReplies(
+                config=config,
+                inverter_info=InverterInfo(ip='127.0.0.1', mac='mac', serial=1),
+                replies=replies,
+            ),
+            RawSiteReplies(config=config, error='Get no response'),
+        ]
+        parsed_sites = parse_batch(pickle.loads(pickle.dumps(batch)))
+
+        # Only compact results will be send back from the worker process:
+        parsed, failed = pickle.loads(pickle.dumps(parsed_sites))
+        self.assertEqual(failed.error, 'Get no response')
+        self.assertEqual(failed.values, [])
+
+        self.assertIsNone(parsed.error)
+        self.assertEqual(parsed.values[0], ('PV1 Voltage', 110.0))
+        self.assertEqual(parsed.values[4], ('Daily Production', ERROR_STR_NO_DATA))
+
+        values = parsed2values(parsed=parsed, definitions=definitions)
+        self.assertEqual(len(values), len(parsed.values))
+        self.assertIs(values[0].spec, definitions.parameters[0])
+        self.assertEqual(values[0].unit, 'V')
+        computed = [value.name for value in values if value.type == ValueType.COMPUTED]
+        self.assertEqual(computed, ['PV1 Power', 'PV2 Power', 'Total Power'])
+
+    def test_parameter_replies(self):
+        # The block of the PV voltages and currents could not be read: The parameters are read one by one
+        config = fixtures.get_config()
+        definitions = load_definitions(config)
+        replies = [make_raw_response(length=block.length) for block in definitions.read_plan]
+        self.assertEqual(
+            [parameter.name for parameter in definitions.read_plan[5].parameters],
+            ['PV1 Voltage', 'PV2 Voltage', 'PV1 Current', 'PV2 Current'],
+        )
+        replies[5] = [make_raw_response(length=1), None, make_raw_response(length=1), make_raw_response(length=1)]
+        parsed = parse_batch([RawSiteReplies(config=config, replies=replies)])[0]
+        self.assertIsNone(parsed.error)
+        values = dict(parsed.values)
+        self.assertEqual(values['PV1 Voltage'], 110.0)
+        self.assertEqual(values['PV2 Voltage'], ERROR_STR_NO_DATA)
+        self.assertEqual(values['PV1 Current'], values['PV2 Current'])
+
+    def test_poll_with_parse_processes(self):
+        with (
+            InverterSimulator(registers=get_registers(), serial=1) as site1,
+            InverterSimulator(registers=get_registers(), serial=2) as site2,
+        ):
+            configs = [
+                fixtures.get_config(host=simulator.host, port=simulator.port, socket_timeout=1)
+                for simulator in (site1, site2)
+            ]
+            with MultiSitePoller(configs=configs, cycle_time=5) as poller:
+                expected = {result.inverter_info.serial: result.values for result in poller.poll()}
+            with MultiSitePoller(configs=configs, cycle_time=30, parse_processes=1, parse_batch_size=1) as poller:
+                results = {result.inverter_info.serial: result for result in poller.poll()}
+
+            # A transient "no data" reply is retried, like in the threaded path:
+            with FlakySimulator(registers=get_registers(), serial=3) as site3:
+                config = fixtures.get_config(host=site3.host, port=site3.port, socket_timeout=1)
+                with MultiSitePoller(configs=[config], cycle_time=30, parse_processes=1) as poller:
+                    results[3] = list(poller.poll())[0]
+                expected[3] = expected[1]
+                first_reads = [command for command in site3.received if command.startswith(b'AT+INVDATA')][:2]
+                self.assertEqual(first_reads[0], first_reads[1])
+
+        self.assertEqual(sorted(results), [1, 2, 3])
+        for serial, result in results.items():
+            self.assertTrue(result.complete, result)
+            self.assertEqual(
+                [(value.name, value.value, value.type) for value in result.values],
+                [(value.name, value.value, value.type) for value in expected[serial]],
+            )
+
+    def test_parse_batch_error(self):
+        config = fixtures.get_config()
+        definitions = load_definitions(config)
+        replies = [make_raw_response(length=block.length) for block in definitions.read_plan]
+        broken_replies = replies.copy()
+        broken_replies[0] = b'+ok=01030400019985\r\n\r\n'  # Valid CRC, but the data is shorter than the byte count
+        batch = [
+            RawSiteReplies(config=config, replies=broken_replies),
+            RawSiteReplies(config=config, replies=replies),
+        ]
+        with self.assertLogs('inverter.parse_pool', level='ERROR'):
+            broken, parsed = parse_batch(batch)
+
+        # Only the site with the broken frame failed:
+        self.assertEqual(broken.values, [])
+        self.assertIn('Parse error: Data is not length=4', broken.error)
+        self.assertIsNone(parsed.error)
+        self.assertEqual(dict(parsed.values)['PV1 Voltage'], 110.0)
+
+    def test_parse_errors(self):
+        configs = [fixtures.get_config(host='127.0.0.1'), fixtures.get_config(host='127.0.0.2', profile='minimal')]
+        with MultiSitePoller(configs=configs) as poller:
+            # Sites with different profiles don't share the definitions (and the read plan):
+            self.assertEqual(sorted(poller.definitions), [('deye_2mppt', 'compact'), ('deye_2mppt', 'minimal')])
+            self.assertNotEqual(
+                len(poller.readers[0].definitions.read_plan), len(poller.readers[1].definitions.read_plan)
+            )
+
+            batch = [
+                RawSiteReplies(config=config, inverter_info=InverterInfo(ip=config.host, mac='mac', serial=no))
+                for no, config in enumerate(configs)
+            ]
+            future = Future()
+            future.set_exception(BrokenProcessPool('A process in the process pool was terminated'))
+            with self.assertLogs('inverter.multi_site', level='ERROR'):
+                results = list(poller.batch2results(future=future, batch=batch))
+
+        self.assertEqual([result.host for result in results], ['127.0.0.1', '127.0.0.2'])
+        for result in results:
+            self.assertFalse(result.complete)
+            self.assertEqual(result.error, 'Parse error: A process in the process pool was terminated')
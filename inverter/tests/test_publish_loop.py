@@ -0,0 +1,127 @@
+import threading
+from unittest import TestCase
+
+from inverter.data_types import InverterInfo, InverterValue, ValueMeta, ValueType
+from inverter.exceptions import ValidationError
+from inverter.night_mode import NightMode
+from inverter.publish_loop import DiscoveryConfigs, publish_streaming
+
+
+def get_value(name, value) -> InverterValue:
+    return InverterValue(
+        type=ValueType.READ_OUT,
+        value=value,
+        spec=ValueMeta(
+            name=name,
+            device_class='power',
+            state_class='measurement',
+            unit='W',
+        ),
+    )
+
+
+class InverterMock:
+    def __init__(self, values):
+        self.values = values
+        self.inv_sock = self
+        self.inverter_info = InverterInfo(ip='127.0.0.1', mac='mac', serial=12345)
+
+    def __iter__(self):
+        for value in self.values:
+            if isinstance(value, Exception):
+                raise value
+            yield value
+
+
+class PublisherMock:
+    def __init__(self):
+        self.states = []
+        self.payloads = []
+
+    def publish(self, *, topic, payload):
+        self.states.append(dict(payload))
+
+    def publish2homeassistant(self, *, ha_mqtt_payload):
+        self.payloads.append(ha_mqtt_payload)
+
+
+class PublishLoopTestCase(TestCase):
+    def test_publish_streaming(self):
+        inverter = InverterMock(values=[get_value('PV1 Power', 10), get_value('PV2 Power', 'no data')])
+        publisher = PublisherMock()
+        ha_values = {}
+        night_mode = NightMode()
+        publish_streaming(
+            inverter=inverter,
+            publisher=publisher,
+            start_time=0,
+            ha_values=ha_values,
+            night_mode=night_mode,
+        )
+        self.assertEqual(list(ha_values.keys()), ['PV1 Power', 'Loop Running Time'])
+        self.assertIs(night_mode.producing, True)
+
+        # The streamed state messages contains only the valid value
+        # (Values that are queued at the same time are sent together or at the end of the cycle):
+        for state in publisher.states:
+            self.assertEqual(state, {'inverter_12345_pv1power': 10})
+
+        # At the end of the cycle all values will be published incl. the configs:
+        self.assertEqual(len(publisher.payloads), 1)
+        ha_mqtt_payload = publisher.payloads[0]
+        self.assertEqual(len(ha_mqtt_payload.configs), 2)
+        self.assertEqual(ha_mqtt_payload.state['topic'], 'homeassistant/sensor/inverter_12345/state')
+        self.assertEqual(ha_mqtt_payload.state['data']['inverter_12345_pv1power'], 10)
+
+        # The next cycle updates the last known values:
+        inverter.values = [get_value('PV1 Power', 20), ValidationError('Bam!'), get_value('PV2 Power', 30)]
+        publisher = PublisherMock()
+        publish_streaming(
+            inverter=inverter,
+            publisher=publisher,
+            start_time=0,
+            ha_values=ha_values,
+        )
+        self.assertEqual(ha_values['PV1 Power'].value, 20)
+        self.assertNotIn('PV2 Power', ha_values)  # Not read, because of the validation error
+        self.assertEqual(len(publisher.payloads), 1)
+        ha_mqtt_payload = publisher.payloads[0]
+        self.assertEqual(ha_mqtt_payload.state['data']['inverter_12345_pv1power'], 20)
+
+    def test_publish_streaming_error(self):
+        class BrokenPublisherMock(PublisherMock):
+            def publish(self, *, topic, payload):
+                raise RuntimeError('Broker error')
+
+        # More values than fit into the queue: The reader would block forever on the full queue
+        inverter = InverterMock(values=[get_value(f'PV{no} Power', no) for no in range(100)])
+        with self.assertRaisesRegex(RuntimeError, 'Broker error'):
+            publish_streaming(
+                inverter=inverter,
+                publisher=BrokenPublisherMock(),
+                start_time=0,
+                ha_values={},
+            )
+        self.assertEqual([thread for thread in threading.enumerate() if thread.name == 'InverterValueReader'], [])
+
+    def test_discovery_configs(self):
+        discovery_configs = DiscoveryConfigs(refresh_interval=60)
+
+        def get_configs(*names):
+            return [
+                {'topic': f'{name}/config', 'data': {'name': name, 'device': {'identifiers': names}}} for name in names
+            ]
+
+        self.assertEqual(len(discovery_configs.changed(get_configs('a', 'b'))), 2)
+        self.assertEqual(discovery_configs.changed(get_configs('a', 'b')), [])
+
+        # Only the new sensor, even if the device identifiers of all sensors are changed:
+        self.assertEqual(discovery_configs.changed(get_configs('a', 'b', 'c')), get_configs('a', 'b', 'c')[2:])
+
+        configs = get_configs('a', 'b', 'c')
+        configs[0]['data']['unit_of_measurement'] = 'kW'
+        self.assertEqual(discovery_configs.changed(configs), configs[:1])
+
+        # All configs will be sent again after the refresh interval:
+        discovery_configs.last_refresh -= 61
+        self.assertEqual(len(discovery_configs.changed(configs)), 3)
@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from inverter.api import Inverter, InverterDefinitions, load_definitions
+from inverter.connection import InverterSock
+from inverter.constants import ERROR_STR_NO_DATA
+from inverter.read_plan import make_read_plan
+from inverter.register_stats import RegisterStatistics
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+from inverter.tests.test_multi_site import get_registers
+
+
+def read_values(config, definitions: InverterDefinitions, register_stats=None) -> list[tuple]:
+    inv_sock = InverterSock(config, register_stats=register_stats)
+    with Inverter(config=config, inv_sock=inv_sock, definitions=definitions) as inverter:
+        inverter.connect()
+        return [(value.name, value.value) for value in inverter]
+
+
+def count_reads(simulator: InverterSimulator) -> int:
+    # Count only the Modbus requests: The "+ok" and "AT+Q" of the connection are not answered,
+    # so they may be received after the reads returned.
+    return sum(command.startswith(b'AT+INVDATA') for command in simulator.received)
+
+
+class ReadPlanTestCase(TestCase):
+    def test_block_reads(self):
+        registers = get_registers()
+        registers[0x6D] = 300  # PV1 Voltage
+        registers[0x3F] = 0x0102  # Total Production low word
+        registers[0x40] = 0x0001  # Total Production high word
+        with InverterSimulator(registers=registers) as simulator:
+            config = fixtures.get_config(host=simulator.host, port=simulator.port)
+            definitions = load_definitions(config)
+            self.assertEqual(len(definitions.read_plan), 6)
+            values = read_values(config, definitions)
+            block_reads = count_reads(simulator)
+
+            simulator.received.clear()
+            definitions.read_plan = make_read_plan(definitions.parameters, max_registers=1)
+            self.assertEqual(len(definitions.read_plan), 11)
+            self.assertEqual(read_values(config, definitions), values)
+            self.assertEqual(count_reads(simulator), block_reads + 5)
+
+        # Same order as in the definition:
+        names = [parameter.name for parameter in definitions.parameters]
+        self.assertEqual([name for name, value in values], names + ['PV1 Power', 'PV2 Power', 'Total Power'])
+        self.assertEqual(values[0], ('PV1 Voltage', 30.0))
+        self.assertIn(('Total Production', 6579.4), values)
+
+    def test_block_without_data(self):
+        registers = get_registers()
+        del registers[0x70]  # PV2 Current is missing: The block 0x6D-0x70 can't be read
+        with InverterSimulator(registers=registers) as simulator:
+            config = fixtures.get_config(host=simulator.host, port=simulator.port)
+            definitions = load_definitions(config)
+
+            # Re-probe the registers (Read once, without retries) to speed up the test:
+            register_stats = RegisterStatistics()
+            for start_register, length in ((0x6D, 4), (0x70, 1)):
+                register_stats.get(start_register=start_register, length=length).quarantine_count = 1
+
+            values = dict(read_values(config, definitions, register_stats=register_stats))
+
+        self.assertEqual(values['PV1 Voltage'], 10.0)
+        self.assertEqual(values['PV2 Voltage'], 10.0)
+        self.assertEqual(values['PV2 Current'], ERROR_STR_NO_DATA)
+        self.assertEqual(register_stats.get(start_register=0x6D, length=4).no_data, 1)
+        self.assertEqual(register_stats.get(start_register=0x6D, length=1).ok, 1)
@@ -97,9 +97,10 @@ class ReadmeTestCase(BaseTestCase):
             content=stdout,
             parts=(
                 'Usage: ./cli.py publish-loop [OPTIONS]',
-                'IP address of your inverter [required]',
+                'IP address of your inverter',  # "[required]" is wrapped: The option names are longer
                 '--port',
                 '--verbosity',
+                '--stream/--all-or-nothing',
             ),
         )
         self.readme_assert.assert_block(text_block=stdout, marker='publish-loop help')
@@ -0,0 +1,70 @@
+import datetime
+import tempfile
+from pathlib import Path
+from unittest import TestCase, skipUnless
+
+from inverter import recorder as recorder_module
+from inverter.recorder import ValueRecorder
+from inverter.tests.test_publish_loop import get_value
+
+
+def get_timestamp(day: int, hour: int, minute: int) -> datetime.datetime:
+    return datetime.datetime(2023, 4, day, hour, minute, tzinfo=datetime.timezone.utc)
+
+
+class RecorderTestCase(TestCase):
+    def test_csv(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            path = Path(temp_dir)
+            with ValueRecorder(path=path, file_prefix='deye_2mppt', record_format='csv', batch_size=2) as recorder:
+                values = [get_value('PV1 Power', 10), get_value('PV2 Power', 'no data')]
+                recorder.add_cycle(values, timestamp=get_timestamp(1, 23, 59))
+                self.assertEqual(list(path.iterdir()), [])  # Buffered
+
+                # Rotate: The row of the last day will be written to its own file:
+                recorder.add_cycle(values, timestamp=get_timestamp(2, 0, 0))
+                self.assertEqual([item.name for item in path.iterdir()], ['deye_2mppt_2023-04-01.csv'])
+                self.assertEqual(
+                    (path / 'deye_2mppt_2023-04-01.csv').read_text(),
+                    'timestamp,PV1 Power,PV2 Power\n2023-04-01T23:59:00+00:00,10,\n',
+                )
+
+                recorder.add_cycle([get_value('PV1 Power', 20)], timestamp=get_timestamp(2, 0, 1))  # Batch is full
+
+            self.assertEqual(
+                (path / 'deye_2mppt_2023-04-02.csv').read_text(),
+                (
+                    'timestamp,PV1 Power,PV2 Power\n'
+                    '2023-04-02T00:00:00+00:00,10,\n'
+                    '2023-04-02T00:01:00+00:00,20,\n'
+                ),
+            )
+
+            # Append to the existing file:
+            with ValueRecorder(path=path, file_prefix='deye_2mppt', record_format='csv') as recorder:
+                recorder.add_cycle(values, timestamp=get_timestamp(2, 0, 2))
+            self.assertEqual(
+                (path / 'deye_2mppt_2023-04-02.csv').read_text().splitlines()[-1],
+                '2023-04-02T00:02:00+00:00,10,',
+            )
+
+            # Other columns -> new part file:
+            with ValueRecorder(path=path, file_prefix='deye_2mppt', record_format='csv') as recorder:
+                recorder.add_cycle([get_value('PV1 Power', 30)], timestamp=get_timestamp(2, 0, 3))
+            self.assertEqual(
+                (path / 'deye_2mppt_2023-04-02_2.csv').read_text(),
+                'timestamp,PV1 Power\n2023-04-02T00:03:00+00:00,30\n',
+            )
+
+    @skipUnless(recorder_module.pyarrow, 'pyarrow not installed')
+    def test_parquet(self):
+        import pyarrow.parquet
+
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            path = Path(temp_dir)
+            with ValueRecorder(path=path, file_prefix='deye_2mppt', record_format='parquet') as recorder:
+                recorder.add_cycle([get_value('PV1 Power', 10)], timestamp=get_timestamp(1, 12, 0))
+                recorder.add_cycle([get_value('PV1 Power', 12.5)], timestamp=get_timestamp(1, 12, 1))
+
+            table = pyarrow.parquet.read_table(path / 'deye_2mppt_2023-04-01' / 'part_120000.parquet')
+            self.assertEqual(table.column('PV1 Power').to_pylist(), [10.0, 12.5])
@@ -0,0 +1,70 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from inverter.register_scan import RegisterScanner, RegisterScanResult, diff_snapshots, read_snapshot
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+
+
+class RegisterScanTestCase(TestCase):
+    def test_scan(self):
+        registers = {register: register * 2 for register in range(0x10, 0x40)}
+        del registers[0x20]  # <<< "no data" in the middle
+        del registers[0x21]
+
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            snapshot_path = Path(temp_dir) / 'scan.csv'
+
+            with InverterSimulator(registers=registers) as simulator:
+                config = fixtures.get_config(host=simulator.host, port=simulator.port)
+                scanner = RegisterScanner(config=config, max_span=16, concurrency=2)
+                results = scanner.scan(start=0x10, end=0x3f, snapshot_path=snapshot_path)
+
+            self.assertEqual(len(results), 0x30)
+            self.assertEqual(results[0x1f], RegisterScanResult(register=0x1f, value=0x3e, status='ok'))
+            self.assertEqual(results[0x20], RegisterScanResult(register=0x20, value=None, status='no data'))
+            self.assertEqual(results[0x21], RegisterScanResult(register=0x21, value=None, status='no data'))
+            self.assertEqual(results[0x22], RegisterScanResult(register=0x22, value=0x44, status='ok'))
+
+            # Only the span with the "no data" registers was split: 3 spans with 16 registers + 2 * (8, 4, 2, 1)
+            read_commands = [command for command in simulator.received if command.startswith(b'AT+INVDATA')]
+            self.assertEqual(len(read_commands), 3 + 2 * 4)
+
+            # Resume: Only the not scanned registers will be read:
+            with InverterSimulator(registers=registers) as simulator:
+                config = fixtures.get_config(host=simulator.host, port=simulator.port)
+                scanner = RegisterScanner(config=config)
+                resumed_results = scanner.scan(start=0x10, end=0x42, snapshot_path=snapshot_path)
+            read_commands = [command for command in simulator.received if command.startswith(b'AT+INVDATA')]
+            # Only 0x40-0x42 are new: 3 -> (1 + 2) -> (1 + 1)
+            self.assertEqual(len(read_commands), 5)
+            self.assertEqual(len(resumed_results), 0x33)
+
+            # Compare with another scan:
+            registers[0x11] = 0xffff
+            registers[0x20] = 1
+            snapshot2_path = Path(temp_dir) / 'scan2.csv'
+            with InverterSimulator(registers=registers) as simulator:
+                config = fixtures.get_config(host=simulator.host, port=simulator.port)
+                RegisterScanner(config=config).scan(start=0x10, end=0x3f, snapshot_path=snapshot2_path)
+
+            diff = diff_snapshots(read_snapshot(snapshot_path), read_snapshot(snapshot2_path))
+            self.assertEqual(
+                diff,
+                [
+                    (
+                        0x11,
+                        RegisterScanResult(register=0x11, value=0x22, status='ok'),
+                        RegisterScanResult(register=0x11, value=0xFFFF, status='ok'),
+                    ),
+                    (
+                        0x20,
+                        RegisterScanResult(register=0x20, value=None, status='no data'),
+                        RegisterScanResult(register=0x20, value=1, status='ok'),
+                    ),
+                    (0x40, RegisterScanResult(register=0x40, value=None, status='no data'), None),
+                    (0x41, RegisterScanResult(register=0x41, value=None, status='no data'), None),
+                    (0x42, RegisterScanResult(register=0x42, value=None, status='no data'), None),
+                ],
+            )
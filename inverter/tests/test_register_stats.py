@@ -0,0 +1,111 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from inverter.connection import InverterSock
+from inverter.data_types import Parameter
+from inverter.exceptions import ModbusNoData, ReadTimeout
+from inverter.register_stats import RegisterStatistics
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+from inverter.utilities.modbus_converter import PARSERS
+
+
+def get_parameter(start_register: int) -> Parameter:
+    return Parameter(
+        start_register=start_register,
+        length=1,
+        group='solar',
+        name=f'Register {start_register}',
+        device_class='voltage',
+        state_class='measurement',
+        unit='V',
+        scale=1,
+        parser=PARSERS['uint16'],
+    )
+
+
+class RegisterStatisticsTestCase(TestCase):
+    def test_quarantine(self):
+        statistics = RegisterStatistics(quarantine_after=2, quarantine_delay=60, quarantine_max_delay=200)
+        register = dict(start_register=0x10, length=1)
+
+        statistics.read_done(**register, success=False, now=1000)
+        self.assertFalse(statistics.is_quarantined(**register, now=1000))
+        statistics.read_done(**register, success=False, now=1000)
+        self.assertTrue(statistics.is_quarantined(**register, now=1000))
+        self.assertTrue(statistics.is_quarantined(**register, now=1059))
+        self.assertFalse(statistics.is_quarantined(**register, now=1060))
+        self.assertTrue(statistics.is_probing(**register))
+
+        # Every failed re-probe doubles the quarantine time, up to the max. delay:
+        statistics.read_done(**register, success=False, now=1060)
+        self.assertEqual(statistics.get(**register).quarantined_until, 1060 + 120)
+        statistics.read_done(**register, success=False, now=1180)
+        self.assertEqual(statistics.get(**register).quarantined_until, 1180 + 200)
+        self.assertEqual(len(statistics.get_quarantined(now=1200)), 1)
+
+        # A successful re-probe lifts the quarantine:
+        statistics.read_done(**register, success=True, now=1380)
+        stats = statistics.get(**register)
+        self.assertEqual((stats.consecutive_failures, stats.quarantine_count), (0, 0))
+        self.assertFalse(statistics.is_probing(**register))
+        self.assertEqual(statistics.get_quarantined(now=1380), [])
+
+    def test_counters_and_persistence(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            stats_path = Path(temp_dir) / 'register_stats.json'
+            statistics = RegisterStatistics(stats_path=stats_path)
+            register = dict(start_register=0x20, length=2)
+            statistics.add_request(**register, latency=0.1, error=None)
+            statistics.add_request(**register, latency=0.3, error=ModbusNoData())
+            statistics.add_request(**register, latency=2.0, error=ReadTimeout())
+            statistics.read_done(**register, success=False)
+            statistics.save()
+
+            stats = RegisterStatistics(stats_path=stats_path).get(**register)
+            self.assertEqual((stats.ok, stats.no_data, stats.timeouts, stats.crc_errors), (1, 1, 1, 0))
+            self.assertEqual(stats.requests, 3)
+            self.assertEqual(stats.latency_max, 2.0)
+            self.assertEqual(stats.latency_avg, 0.8)
+            self.assertEqual(stats.consecutive_failures, 1)
+
+            # A broken file will be ignored:
+            stats_path.write_text('{')
+            self.assertEqual(RegisterStatistics(stats_path=stats_path).get_all(), [])
+
+    def test_inverter_sock(self):
+        with InverterSimulator(registers={0x10: 123}) as simulator:
+            config = fixtures.get_config(host=simulator.host, port=simulator.port)
+            statistics = RegisterStatistics(quarantine_after=1)
+            statistics.read_done(start_register=0x20, length=1, success=False)  # 0x20 is in quarantine
+            statistics.read_done(start_register=0x30, length=1, success=False, now=0)  # 0x30 is re-probed
+            with InverterSock(config, register_stats=statistics) as inv_sock:
+                inv_sock.connect()
+                simulator.wait_received(b'+ok')  # Sent by connect() without a response
+                simulator.received.clear()
+
+                result = inv_sock.read_paremeter(parameter=get_parameter(0x10))
+                self.assertEqual(result.parsed_value, 123)
+
+                result = inv_sock.read_paremeter(parameter=get_parameter(0x20))
+                self.assertEqual(result.parsed_value, 'no data')
+
+                result = inv_sock.read_paremeter(parameter=get_parameter(0x30))
+                self.assertEqual(result.parsed_value, 'no data')
+
+            simulator.wait_received(b'AT+Q\n')  # Sent on close without a response
+
+            # The quarantined register is not requested, the re-probe is done without retries:
+            self.assertEqual(
+                simulator.received,
+                [
+                    b'AT+INVDATA=8,01030010000185cf\n',
+                    b'AT+INVDATA=8,0103003000018405\n',
+                    b'AT+Q\n',
+                ],
+            )
+            self.assertEqual(statistics.get(start_register=0x10, length=1).ok, 1)
+            self.assertEqual(statistics.get(start_register=0x20, length=1).requests, 0)
+            stats = statistics.get(start_register=0x30, length=1)
+            self.assertEqual((stats.no_data, stats.quarantine_count), (1, 2))
@@ -0,0 +1,90 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from inverter.api import Inverter, load_definitions
+from inverter.capture import CAPTURE_MAGIC, CaptureWriter, read_capture
+from inverter.connection import InverterSock
+from inverter.read_plan import make_read_plan
+from inverter.replay import replay_capture
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+
+
+class ReplayTestCase(TestCase):
+    def test_capture_and_replay(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            capture_path = Path(temp_dir) / 'inverter.capture'
+            registers = {register: 0 for register in range(0x100)}
+            with InverterSimulator(registers=registers) as simulator:
+                config = fixtures.get_config(host=simulator.host, port=simulator.port)
+                with CaptureWriter(capture_path) as capture:
+                    for pv1_voltage in (0, 300):
+                        registers[0x6D] = pv1_voltage
+                        with Inverter(config=config, inv_sock=InverterSock(config, capture=capture)) as inverter:
+                            inverter.connect()
+                            live_values = list(inverter)
+
+            records = list(read_capture(capture_path))
+            self.assertEqual(len(records), 2 * 7)  # Handshake + 6 read requests of the read plan per cycle
+            self.assertEqual(records[0].command, b'WIFIKIT-214028-READ')
+            self.assertEqual(records[0].data, b'127.0.0.1,AABBCCDDEEFF,1234567890')
+            self.assertEqual(records[1].command, b'AT+INVDATA=8,0103006d0004d5d4\n')  # PV1/2 Voltage/Current
+            self.assertEqual(records[1].data, b'+ok=010308000000000000000095D7\r\n\r\n')
+
+            # A truncated record at the end will be ignored:
+            with capture_path.open('ab') as f:
+                f.write(b'\x00\x01\x02')
+            self.assertEqual(len(list(read_capture(capture_path))), 2 * 7)
+
+            config = fixtures.get_config(host='replay', port=0)
+            replayed = []
+            stats = replay_capture(config=config, path=capture_path, on_cycle=replayed.append)
+            self.assertEqual(stats.cycles, 2)
+            self.assertEqual(stats.values, 2 * len(live_values))
+            self.assertEqual(stats.errors, 0)
+            self.assertEqual(
+                [[value.value for value in values if value.name == 'PV1 Voltage'] for values in replayed],
+                [[0.0], [30.0]],
+            )
+            self.assertEqual(
+                [(value.name, value.value) for value in replayed[-1]],
+                [(value.name, value.value) for value in live_values],
+            )
+
+            # A cycle without the register responses:
+            missing_path = Path(temp_dir) / 'missing.capture'
+            with CaptureWriter(missing_path) as capture:
+                capture.write(command=records[0].command, data=records[0].data)
+            stats = replay_capture(config=config, path=missing_path)
+            self.assertEqual((stats.cycles, stats.values, stats.errors), (1, 0, 1))
+
+            other_path = Path(temp_dir) / 'other.file'
+            other_path.write_bytes(b'foobar')
+            with self.assertRaises(ValueError):
+                list(read_capture(other_path))
+            self.assertEqual(missing_path.read_bytes()[: len(CAPTURE_MAGIC)], CAPTURE_MAGIC)
+
+    def test_replay_without_read_plan(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            capture_path = Path(temp_dir) / 'inverter.capture'
+            registers = {register: 1 for register in range(0x100)}
+            with InverterSimulator(registers=registers) as simulator:
+                config = fixtures.get_config(host=simulator.host, port=simulator.port)
+                definitions = load_definitions(config)
+                definitions.read_plan = make_read_plan(definitions.parameters, max_registers=1)
+                with CaptureWriter(capture_path) as capture:
+                    inv_sock = InverterSock(config, capture=capture)
+                    with Inverter(config=config, inv_sock=inv_sock, definitions=definitions) as inverter:
+                        inverter.connect()
+                        live_values = list(inverter)
+
+            # Captured with one request per register: Replay with the default read plan
+            config = fixtures.get_config(host='replay', port=0)
+            replayed = []
+            stats = replay_capture(config=config, path=capture_path, on_cycle=replayed.append)
+            self.assertEqual((stats.cycles, stats.errors), (1, 0))
+            self.assertEqual(
+                [(value.name, value.value) for value in replayed[0]],
+                [(value.name, value.value) for value in live_values],
+            )
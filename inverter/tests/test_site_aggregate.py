@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from inverter.data_types import InverterValue, ValueMeta, ValueType
+from inverter.site_aggregate import aggregate_site_values, publish_site_values
+from inverter.tests.test_night_mode import PublisherMock
+from inverter.tests.test_publish_loop import get_value
+
+
+def get_site_values(*, power, energy, temperature) -> list[InverterValue]:
+    return [
+        get_value('Total Power', power),
+        InverterValue(
+            type=ValueType.READ_OUT,
+            value=energy,
+            spec=ValueMeta(name='Daily Production', device_class='energy', state_class='total_increasing', unit='kWh'),
+        ),
+        InverterValue(
+            type=ValueType.READ_OUT,
+            value=temperature,
+            spec=ValueMeta(name='DC Temperature', device_class='temperature', state_class='measurement', unit='°C'),
+        ),
+        InverterValue(
+            type=ValueType.READ_OUT,
+            value=230.1,
+            spec=ValueMeta(name='Grid Voltage', device_class='voltage', state_class='measurement', unit='V'),
+        ),
+    ]
+
+
+class SiteAggregateTestCase(TestCase):
+    def test_aggregate_site_values(self):
+        sites = [
+            get_site_values(power=100, energy=1.1, temperature=30.5),
+            get_site_values(power=250, energy=2.2, temperature=41.0),
+            [*get_site_values(power=0, energy=0, temperature=25.2), get_value('PV1 Power', 0)],
+        ]
+        values = aggregate_site_values(sites)
+        self.assertEqual(
+            [(value.name, value.value, value.unit, value.state_class) for value in values],
+            [
+                ('Total Power', 350, 'W', 'measurement'),
+                ('Daily Production', 3.3, 'kWh', 'total_increasing'),
+                ('DC Temperature Min', 25.2, '°C', 'measurement'),
+                ('DC Temperature Max', 41.0, '°C', 'measurement'),
+            ],
+        )
+
+        # Missing values are not aggregated:
+        sites[1][0] = get_value('Total Power', 'no data')
+        values = aggregate_site_values(sites)
+        self.assertEqual([value.name for value in values][:2], ['Daily Production', 'DC Temperature Min'])
+
+    def test_publish_site_values(self):
+        publisher = PublisherMock()
+        self.assertIs(publish_site_values(publisher=publisher, sites=[]), False)
+        self.assertEqual(publisher.published, [])
+
+        sites = [
+            get_site_values(power=100, energy=1.1, temperature=30.5),
+            get_site_values(power=250, energy=2.2, temperature=41.0),
+        ]
+        self.assertIs(publish_site_values(publisher=publisher, sites=sites), True)
+        self.assertEqual(
+            publisher.published[-1],
+            (
+                'homeassistant/sensor/inverter_site/state',
+                {
+                    'inverter_site_totalpower': 350,
+                    'inverter_site_dailyproduction': 3.3,
+                    'inverter_site_dctemperaturemin': 30.5,
+                    'inverter_site_dctemperaturemax': 41.0,
+                },
+            ),
+        )
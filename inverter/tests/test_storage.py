@@ -0,0 +1,123 @@
+import datetime
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from inverter.data_types import InverterValue, ValueMeta, ValueType
+from inverter.storage import DailyEnergy, SQLiteStorage, SQLiteWriter
+
+
+def get_value(name, value, device_class='energy', state_class='total_increasing', unit='kWh') -> InverterValue:
+    return InverterValue(
+        type=ValueType.READ_OUT,
+        value=value,
+        spec=ValueMeta(
+            name=name,
+            device_class=device_class,
+            state_class=state_class,
+            unit=unit,
+        ),
+    )
+
+
+def get_timestamp(day: int, hour: int, minute: int = 0) -> float:
+    return datetime.datetime(2023, 4, day, hour, minute).timestamp()  # local time
+
+
+class SQLiteStorageTestCase(TestCase):
+    def test_storage(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            db_path = Path(temp_dir) / 'inverter.sqlite3'
+            storage = SQLiteStorage(db_path=db_path, raw_retention_days=2)
+            for day, hour, total, daily, power in (
+                (1, 10, 100.0, 0.5, 300),
+                (1, 12, 101.0, 1.5, 500),
+                (1, 18, 102.5, 3.0, 100),
+                (2, 10, 103.0, 0.5, 350),
+            ):
+                count = storage.insert_cycle(
+                    [
+                        get_value('Total Production', total),
+                        get_value('Daily Production', daily, state_class='total'),
+                        get_value('AC Power', power, device_class='power', state_class='measurement', unit='W'),
+                        get_value('Operation Mode', 'Standby', device_class='', unit=''),  # Not stored
+                    ],
+                    timestamp=get_timestamp(day, hour),
+                )
+                self.assertEqual(count, 3)
+
+            rows = storage.conn.execute(
+                """
+                SELECT rollups.resolution, rollups.min, rollups.max, rollups.sum / rollups.count, rollups.last
+                FROM rollups JOIN series ON series.id = rollups.series_id
+                WHERE series.name = 'AC Power' AND rollups.bucket < ?
+                ORDER BY rollups.resolution, rollups.bucket
+                """,
+                (get_timestamp(2, 0),),
+            ).fetchall()
+            self.assertEqual(
+                rows,
+                [
+                    ('15m', 300.0, 300.0, 300.0, 300.0),
+                    ('15m', 500.0, 500.0, 500.0, 500.0),
+                    ('15m', 100.0, 100.0, 100.0, 100.0),
+                    ('1d', 100.0, 500.0, 300.0, 100.0),
+                    ('1m', 300.0, 300.0, 300.0, 300.0),
+                    ('1m', 500.0, 500.0, 500.0, 500.0),
+                    ('1m', 100.0, 100.0, 100.0, 100.0),
+                ],
+            )
+
+            self.assertEqual(
+                storage.get_daily_energy(days=2, now=get_timestamp(2, 12)),
+                [
+                    DailyEnergy(day=datetime.date(2023, 4, 1), name='Total Production', unit='kWh', energy=2.5),
+                    DailyEnergy(day=datetime.date(2023, 4, 1), name='Daily Production', unit='kWh', energy=3.0),
+                    DailyEnergy(day=datetime.date(2023, 4, 2), name='Total Production', unit='kWh', energy=0.0),
+                    DailyEnergy(day=datetime.date(2023, 4, 2), name='Daily Production', unit='kWh', energy=0.5),
+                ],
+            )
+            self.assertEqual(len(storage.get_daily_energy(days=1, now=get_timestamp(2, 12))), 2)
+
+            # Delete the raw readings, but keep the rollups:
+            storage.delete_old(now=get_timestamp(4, 10))
+            timestamps = storage.conn.execute('SELECT DISTINCT timestamp FROM readings').fetchall()
+            self.assertEqual(timestamps, [(get_timestamp(2, 10),)])
+            self.assertEqual(len(storage.get_daily_energy(days=2, now=get_timestamp(2, 12))), 4)
+            storage.close()
+
+    def test_writer(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            db_path = Path(temp_dir) / 'inverter.sqlite3'
+            writer = SQLiteWriter(db_path=db_path)
+            writer.start()
+            with writer:
+                writer.add_cycle([get_value('Total Production', 100)])
+                writer.add_cycle([get_value('Total Production', 101)])
+
+            conn = sqlite3.connect(db_path)
+            self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone(), ('wal',))
+            self.assertEqual(conn.execute('SELECT value FROM readings').fetchall(), [(100.0,), (101.0,)])
+            conn.close()
+
+    def test_writer_errors(self):
+        with tempfile.TemporaryDirectory(prefix='test-inverter-connect') as temp_dir:
+            # The database path is a directory: The error is raised in the caller, not in the thread
+            writer = SQLiteWriter(db_path=Path(temp_dir))
+            with self.assertRaises(sqlite3.Error):
+                writer.start()
+            with self.assertLogs('inverter.storage', level='WARNING') as logs:
+                writer.add_cycle([get_value('Total Production', 100)])
+            self.assertEqual(logs.output, ['WARNING:inverter.storage:Drop values: The SQLite writer is not running'])
+            self.assertEqual(writer.cycle_queue.qsize(), 0)
+            writer.close()
+
+            # The queue is bounded, e.g.: if the database is too slow:
+            writer = SQLiteWriter(db_path=Path(temp_dir) / 'inverter.sqlite3', queue_size=1)
+            writer.is_alive = lambda: True  # Not started: Nothing will be consumed from the queue
+            writer.add_cycle([get_value('Total Production', 100)])
+            with self.assertLogs('inverter.storage', level='WARNING') as logs:
+                writer.add_cycle([get_value('Total Production', 101)])
+            self.assertIn('Drop values: 1 cycles are waiting', logs.output[0])
+            self.assertEqual(writer.cycle_queue.qsize(), 1)
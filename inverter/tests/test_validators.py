@@ -1,7 +1,7 @@
 import logging
 from unittest import TestCase
 
-from inverter.data_types import InverterValue, ValueType
+from inverter.data_types import InverterValue, ValueMeta, ValueType
 from inverter.exceptions import ValidationError
 from inverter.tests import fixtures
 from inverter.validators import InverterValueValidator
@@ -16,12 +16,13 @@ class ValidatorsTestCase(TestCase):
             validator(
                 inverter_value=InverterValue(
                     type=ValueType.COMPUTED,
-                    name='Total Power',
                     value=30,
-                    device_class='power',
-                    state_class='measurement',
-                    unit='W',
-                    result=None,
+                    spec=ValueMeta(
+                        name='Total Power',
+                        device_class='power',
+                        state_class='measurement',
+                        unit='W',
+                    ),
                 )
             )
         self.assertEqual(
@@ -33,12 +34,13 @@ class ValidatorsTestCase(TestCase):
             validator(
                 inverter_value=InverterValue(
                     type=ValueType.READ_OUT,
-                    name='Radiator Temperature',
                     value=30.5,
-                    device_class='temperature',
-                    state_class='measurement',
-                    unit='°C',
-                    result=None,
+                    spec=ValueMeta(
+                        name='Radiator Temperature',
+                        device_class='temperature',
+                        state_class='measurement',
+                        unit='°C',
+                    ),
                 )
             )
         self.assertEqual(logs.output, ['DEBUG:inverter.validators:Radiator Temperature value=30.5 is valid, ok.'])
@@ -47,12 +49,13 @@ class ValidatorsTestCase(TestCase):
             validator(
                 inverter_value=InverterValue(
                     type=ValueType.READ_OUT,
-                    name='Radiator Temperature',
                     value=-10,
-                    device_class='temperature',
-                    state_class='measurement',
-                    unit='°C',
-                    result=None,
+                    spec=ValueMeta(
+                        name='Radiator Temperature',
+                        device_class='temperature',
+                        state_class='measurement',
+                        unit='°C',
+                    ),
                 )
             )
         self.assertEqual(str(err.exception), 'Radiator Temperature value=-10.0 is less than -9.9')
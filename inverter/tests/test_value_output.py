@@ -0,0 +1,70 @@
+import csv
+import io
+import json
+from unittest import TestCase
+
+from inverter.api import Inverter
+from inverter.connection import InverterSock
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+from inverter.tests.test_multi_site import get_registers
+from inverter.value_output import OUTPUT_FORMAT_CSV, OUTPUT_FORMAT_JSON, OUTPUT_FORMAT_JSONL, get_value_writer
+
+
+def write_cycles(output_format: str, cycles: int) -> str:
+    file = io.StringIO()
+    writer = get_value_writer(output_format, file=file)
+    with InverterSimulator(registers=get_registers()) as simulator:
+        config = fixtures.get_config(host=simulator.host, port=simulator.port, profile='minimal')
+        with Inverter(config=config, inv_sock=InverterSock(config)) as inverter:
+            inverter.connect()
+            for _ in range(cycles):
+                writer.start_cycle()
+                for value in inverter:
+                    writer.write(value)
+                writer.end_cycle()
+            connects = sum(command.startswith(b'WIFIKIT') for command in simulator.received)
+    assert connects == 1, f'{connects=}'  # All cycles used the same session
+    return file.getvalue()
+
+
+class ValueOutputTestCase(TestCase):
+    def test_jsonl(self):
+        lines = write_cycles(OUTPUT_FORMAT_JSONL, cycles=2).splitlines()
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(len(records), 2 * 9)
+        self.assertEqual(
+            {key: value for key, value in records[0].items() if key != 'timestamp'},
+            {
+                'cycle': 1,
+                'name': 'PV1 Voltage',
+                'value': 10.0,
+                'unit': 'V',
+                'device_class': 'voltage',
+                'type': 'read out',
+                'register': 0x6D,
+                'length': 1,
+                'raw': '0064',
+            },
+        )
+        self.assertEqual(records[-1]['cycle'], 2)
+        self.assertEqual(records[-1]['type'], 'computed')
+        self.assertIsNone(records[-1]['register'])
+
+    def test_json(self):
+        lines = write_cycles(OUTPUT_FORMAT_JSON, cycles=2).splitlines()
+        self.assertEqual(len(lines), 2)
+        cycles = [json.loads(line) for line in lines]
+        self.assertEqual([len(records) for records in cycles], [9, 9])
+        self.assertEqual({record['cycle'] for record in cycles[1]}, {2})
+
+    def test_csv(self):
+        rows = list(csv.DictReader(io.StringIO(write_cycles(OUTPUT_FORMAT_CSV, cycles=1))))
+        self.assertEqual(len(rows), 9)
+        self.assertEqual(rows[0]['name'], 'PV1 Voltage')
+        self.assertEqual(rows[0]['register'], str(0x6D))
+        self.assertEqual(rows[-1]['register'], '')
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            get_value_writer('xml', file=io.StringIO())
@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+from inverter.api import set_current_time
+from inverter.connection import InverterSock
+from inverter.exceptions import WriteVerificationError
+from inverter.tests import fixtures
+from inverter.tests.simulator import InverterSimulator
+from inverter.write_plan import WritePlan
+
+
+class ReadOnlySimulator(InverterSimulator):
+    def modbus(self, request: bytes) -> str:
+        if request[1] == 0x10:
+            request = bytearray(request)
+            length = int.from_bytes(request[4:6], 'big')
+            request[-2 - length * 2:-2] = bytes(length * 2)  # Write zeros instead of the given values
+        return super().modbus(bytes(request))
+
+
+class WritePlanTestCase(TestCase):
+    def test_write_and_verify(self):
+        registers = {register: 0 for register in range(0x10, 0x30)}
+        with InverterSimulator(registers=registers) as simulator:
+            config = fixtures.get_config(host=simulator.host, port=simulator.port)
+            with InverterSock(config) as inv_sock:
+                inv_sock.connect()
+                simulator.wait_received(b'+ok')  # Sent by connect() without a response
+                simulator.received.clear()
+
+                plan = WritePlan(registers={0x12: 1, 0x10: 2, 0x11: 3, 0x20: 0xFFFF})
+                self.assertEqual(plan.read_ranges, [(0x10, 0x11)])
+
+                plan.apply(inv_sock, dry_run=True)
+                self.assertEqual(simulator.received, [])
+
+                plan.apply(inv_sock)
+
+            # "AT+Q" is sent on close without waiting for a response:
+            simulator.wait_received(b'AT+Q\n')
+
+            # Two write frames and one read back:
+            self.assertEqual(
+                simulator.received,
+                [
+                    b'AT+INVDATA=16,0110001000030006000200030001fb60\n',
+                    b'AT+INVDATA=12,0110002000010002ffff5070\n',
+                    b'AT+INVDATA=8,0103001000118403\n',
+                    b'AT+Q\n',
+                ],
+            )
+            self.assertEqual([registers[register] for register in (0x10, 0x11, 0x12, 0x20)], [2, 3, 1, 0xFFFF])
+
+    def test_read_back_fallback(self):
+        # The registers between the frames can't be read: Read every frame on its own
+        registers = {0x10: 0, 0x20: 0}
+        with InverterSimulator(registers=registers) as simulator:
+            config = fixtures.get_config(host=simulator.host, port=simulator.port)
+            with InverterSock(config) as inv_sock:
+                inv_sock.connect()
+                WritePlan(registers={0x10: 1, 0x20: 2}).apply(inv_sock)
+        self.assertEqual(registers, {0x10: 1, 0x20: 2})
+
+    def test_verification_error(self):
+        registers = {0x16: 0, 0x17: 0, 0x18: 0}
+        with ReadOnlySimulator(registers=registers) as simulator:
+            config = fixtures.get_config(host=simulator.host, port=simulator.port)
+            with InverterSock(config) as inv_sock:
+                inv_sock.connect()
+                with self.assertRaises(WriteVerificationError) as cm:
+                    set_current_time(inv_sock=inv_sock, verbose=False)
+                self.assertEqual(sorted(cm.exception.mismatches), [0x16, 0x17])  # Seconds are not verified
+
+                plan = WritePlan(registers={0x16: 0})
+                plan.apply(inv_sock)  # Already the written value
+                WritePlan(registers={0x16: 1}).apply(inv_sock, verify=False)
+
+    def test_invalid_values(self):
+        with self.assertRaises(ValueError):
+            WritePlan(registers={0x10: 0x10000})
+        with self.assertRaises(ValueError):
+            WritePlan(registers={-1: 0})
@@ -0,0 +1,33 @@
+"""
+    Tracing of the parse hot path.
+
+    The parse functions are called for every register in every cycle. Their debug output is only
+    generated if tracing is enabled, e.g.:
+
+        if trace.enabled:
+            logger.debug('parse(%r)', data)
+
+    So the log message (and the arguments) are not created if tracing is off.
+"""
+from __future__ import annotations
+
+from cli_base.cli_tools.verbosity import MAX_LOG_LEVEL
+from cli_base.cli_tools.verbosity import setup_logging as cli_base_setup_logging
+
+
+TRACE_VERBOSITY = MAX_LOG_LEVEL  # Trace with "-vvv" (log level DEBUG)
+
+enabled = False
+
+
+def set_trace(*, enable: bool) -> None:
+    global enabled
+    enabled = enable
+
+
+def setup_logging(*, verbosity: int) -> None:
+    """
+    Setup the logging and enable the tracing of the parse hot path with the max. verbosity.
+    """
+    cli_base_setup_logging(verbosity=verbosity)
+    set_trace(enable=verbosity >= TRACE_VERBOSITY)
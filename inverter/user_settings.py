@@ -15,6 +15,7 @@ from rich import print  # noqa
 from tomlkit import TOMLDocument
 
 from inverter.data_types import Config
+from inverter.definitions import get_profiles
 
 
 @dataclasses.dataclass
@@ -34,11 +35,16 @@ class Inverter:
     Set "ip" of the inverter if it's always the same. (Hint: Pin it in FritzBox settings ;)
     You can leave it empty, but then you must always pass "--ip" to CLI commands.
     Even if it is specified here, you can always override it in the CLI with "--ip".
+
+    Set "latitude" and "longitude" (e.g.: 52.52 and 13.40) of your PV modules, to sleep until
+    the estimated sunrise, while the inverter is powered down at night. (0.0 == disabled)
     """
 
     name: str = 'deye_2mppt'
     ip: str = ''
     port: int = 48899
+    latitude: float = 0.0
+    longitude: float = 0.0
 
 
 @dataclasses.dataclass
@@ -117,6 +123,7 @@ def make_config(
     port,
     verbosity,
     compact: bool = True,
+    profile: str | None = None,
     config_path=None,
     inverter=None,
 ) -> Config:
@@ -128,12 +135,27 @@ def make_config(
     else:
         logging.debug('%r -> %r', ip, result)
 
-    return Config(
+    latitude = longitude = None
+    if user_settings.inverter.latitude or user_settings.inverter.longitude:
+        latitude = user_settings.inverter.latitude
+        longitude = user_settings.inverter.longitude
+
+    config = Config(
         verbosity=verbosity,
         compact=compact,
+        profile=profile,
         host=ip,
         port=port,
         mqtt_settings=user_settings.mqtt,
         inverter_name=inverter,
         config_path=config_path,
+        latitude=latitude,
+        longitude=longitude,
     )
+    if config.inverter_name and (profiles := get_profiles(config=config)) and config.profile not in profiles:
+        human_error(
+            message=f'Unknown read profile {config.profile!r} (Possible profiles: {", ".join(sorted(profiles))})',
+            title='[red]Read profile error',
+            exit_code=1,
+        )
+    return config
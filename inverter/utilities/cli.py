@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import datetime
+import time
 
 from bx_py_utils.iteration import chunk_iterable
 from packaging.version import Version
@@ -7,8 +9,31 @@ from rich import get_console, print  # noqa
 from rich.table import Table
 
 from inverter.constants import ERROR_STR_NO_DATA
-from inverter.data_types import InverterRegisterVersionResult, InverterValue, ModbusResponse, Parameter, ValueType
+from inverter.data_types import (
+    InverterInfo,
+    InverterRegisterVersionResult,
+    InverterValue,
+    ModbusResponse,
+    Parameter,
+    ValueType,
+)
 from inverter.exceptions import ModbusNoData, ModbusNoHexData
+from inverter.fleet import FleetInventoryResult
+from inverter.register_scan import RegisterScanResult
+from inverter.register_stats import RegisterStats
+from inverter.storage import DailyEnergy
+from inverter.write_plan import WritePlan
+
+
+def is_stdout(file) -> bool:
+    """
+    Is the given file, e.g.: from click.File(), the stdout?
+
+    >>> import io, sys
+    >>> is_stdout(sys.__stdout__), is_stdout(io.StringIO()), is_stdout(None)
+    (True, False, False)
+    """
+    return getattr(file, 'name', None) == '<stdout>'
 
 
 def convert_address_option(raw_address: str, debug: bool = True) -> int:
@@ -140,3 +165,190 @@ def print_inverter_values(values: list[InverterValue], title='Inverter Values'):
     console.print('\n')
     console.rule()
     console.print(table)
+
+
+def print_register_scan_diff(
+    diff: list[tuple[int, RegisterScanResult | None, RegisterScanResult | None]], title='Changed registers'
+):
+    def format_result(result: RegisterScanResult | None) -> str:
+        if result is None:
+            return '[yellow]<not scanned>'
+        elif result.value is None:
+            return f'[red]{result.status}'
+        else:
+            return f'[green]{result.value:04x}[/green] ({result.value:>5})'
+
+    table = Table(title=title)
+    table.add_column('Counter\n', justify='right')
+    table.add_column('Address\n(hex)', justify='center', style='cyan')
+    table.add_column('Address\n(dec)', justify='right', style='cyan')
+    table.add_column('Old value\n(hex/dec)', justify='right')
+    table.add_column('New value\n(hex/dec)', justify='right')
+
+    for offset, (register, old_result, new_result) in enumerate(diff):
+        table.add_row(
+            str(offset + 1),  # Counter
+            hex(register),  # Address (hex)
+            str(register),  # Address (dec)
+            format_result(old_result),
+            format_result(new_result),
+        )
+
+    console = get_console()
+    console.print('\n')
+    console.rule()
+    console.print(table)
+
+
+def print_fleet_inventory(results: list[FleetInventoryResult], title='Fleet Inventory'):
+    version_names = []
+    for result in results:
+        for version in result.versions:
+            if version.info.name not in version_names:
+                version_names.append(version.info.name)
+
+    table = Table(title=title)
+    table.add_column('Counter', justify='right')
+    table.add_column('Host', justify='left', style='cyan')
+    table.add_column('Serial', justify='right')
+    table.add_column('MAC', justify='center')
+    for name in version_names:
+        table.add_column(f'[green]{name}', justify='right', style='green')
+
+    for offset, result in enumerate(results):
+        if result.error:
+            table.add_row(str(offset + 1), result.host, f'[red]{result.error}')
+            continue
+
+        versions = {version.info.name: f'v{version.version}' for version in result.versions}
+        table.add_row(
+            str(offset + 1),  # Counter
+            result.host,
+            str(result.inverter_info.serial),
+            result.inverter_info.mac,
+            *(versions.get(name, '-') for name in version_names),
+        )
+
+    console = get_console()
+    console.print('\n')
+    console.rule()
+    console.print(table)
+
+
+def print_discovered_loggers(inverter_infos: list[InverterInfo], last_ips: dict[int, str | None]):
+    table = Table(title=f'{len(inverter_infos)} logger stick(s) found')
+    table.add_column('Counter', justify='right')
+    table.add_column('IP', justify='left', style='cyan')
+    table.add_column('MAC', justify='center')
+    table.add_column('Serial', justify='right', style='green')
+    table.add_column('Note', justify='left')
+
+    for offset, inverter_info in enumerate(inverter_infos):
+        last_ip = last_ips.get(inverter_info.serial)
+        if last_ip is None:
+            note = '[green]new'
+        elif last_ip != inverter_info.ip:
+            note = f'[yellow]IP changed (was: {last_ip})'
+        else:
+            note = ''
+        table.add_row(
+            str(offset + 1),  # Counter
+            inverter_info.ip,
+            inverter_info.mac,
+            str(inverter_info.serial),
+            note,
+        )
+
+    console = get_console()
+    console.print('\n')
+    console.rule()
+    console.print(table)
+
+
+def print_daily_energy(daily_energy: list[DailyEnergy], title='Energy per day'):
+    names = {}
+    days = {}
+    for entry in daily_energy:
+        names[entry.name] = entry.unit
+        days.setdefault(entry.day, {})[entry.name] = entry.energy
+
+    table = Table(title=title)
+    table.add_column('Counter', justify='right')
+    table.add_column('Day', justify='center')
+    for name, unit in names.items():
+        table.add_column(f'[blue]{name}[/blue] ({unit})', justify='right')
+
+    for offset, (day, energy) in enumerate(days.items()):
+        table.add_row(
+            str(offset + 1),  # Counter
+            day.isoformat(),
+            *(f'[green]{energy[name]}' if name in energy else '-' for name in names),
+        )
+
+    console = get_console()
+    console.print('\n')
+    console.rule()
+    console.print(table)
+
+
+def print_register_stats(register_stats: list[RegisterStats], title='Register Statistics'):
+    now = time.time()
+
+    table = Table(title=title)
+    table.add_column('Register', justify='right', style='cyan')
+    table.add_column('Length', justify='right')
+    table.add_column('OK', justify='right', style='green')
+    table.add_column('No data', justify='right')
+    table.add_column('CRC errors', justify='right')
+    table.add_column('Timeouts', justify='right')
+    table.add_column('Other errors', justify='right')
+    table.add_column('Latency avg/max (ms)', justify='right')
+    table.add_column('Quarantine', justify='left')
+
+    for stats in register_stats:
+        if stats.is_quarantined(now):
+            until = datetime.datetime.fromtimestamp(stats.quarantined_until).strftime('%Y-%m-%d %H:%M:%S')
+            quarantine = f'[red]until {until}'
+        elif stats.quarantine_count:
+            quarantine = '[yellow]re-probe due'
+        else:
+            quarantine = ''
+        table.add_row(
+            hex(stats.start_register),
+            str(stats.length),
+            str(stats.ok),
+            f'[yellow]{stats.no_data}' if stats.no_data else '0',
+            f'[red]{stats.crc_errors}' if stats.crc_errors else '0',
+            f'[red]{stats.timeouts}' if stats.timeouts else '0',
+            f'[red]{stats.errors}' if stats.errors else '0',
+            f'{stats.latency_avg * 1000:.0f} / {stats.latency_max * 1000:.0f}',
+            quarantine,
+        )
+
+    console = get_console()
+    console.print('\n')
+    console.rule()
+    console.print(table)
+
+
+def print_write_plan(plan: WritePlan, title='Write Plan'):
+    table = Table(title=title)
+    table.add_column('Frame', justify='right')
+    table.add_column('Start\n(hex)', justify='center', style='cyan')
+    table.add_column('Count', justify='right')
+    table.add_column('[green]Values\n(hex)', justify='left', style='green')
+    table.add_column('AT command', justify='left', style='magenta')
+
+    for offset, frame in enumerate(plan.frames):
+        table.add_row(
+            str(offset + 1),  # Counter
+            hex(frame.start_register),
+            str(len(frame.values)),
+            ' '.join(f'{value:04x}' for value in frame.values),
+            f'AT+{frame.at_command}',
+        )
+
+    console = get_console()
+    console.print(table)
+    verify = ', '.join(f'{start_register:#x} ({length} registers)' for start_register, length in plan.read_ranges)
+    console.print(f'Read back: {verify or "-"}')
@@ -1,93 +1,222 @@
 from __future__ import annotations
 
+import datetime
+import functools
 import logging
+import struct
+from typing import Callable
 
 from packaging.version import Version
 
+from inverter import trace
+
 
 logger = logging.getLogger(__name__)
 
 
-def hex2int(*, data_hex: str, scale, offset) -> int:
+NUMBER_FORMATS = {1: 'h', 2: 'i', 4: 'q'}  # Register count -> signed struct format (upper case: unsigned)
+
+
+@functools.lru_cache(maxsize=None)
+def get_words_struct(count: int) -> struct.Struct:
     """
-    >>> hex2int(data_hex='0938', scale=0.1, offset=None)
-    236.0
-    >>> hex2int(data_hex='1388', scale=0.01, offset=None)
-    50.0
-    >>> hex2int(data_hex='00000168', scale=0.1, offset=None)
-    36.0
+    >>> get_words_struct(2).unpack(bytes.fromhex('002b0001'))
+    (43, 1)
     """
-    logger.debug(f'{data_hex=} {scale=} {offset=}')
-    data = bytes.fromhex(data_hex)
-    number = int.from_bytes(data, byteorder='big', signed=True)
+    return struct.Struct(f'>{count}H')
+
 
+def apply_scale(*, number: int, scale, offset, lookup):
     if offset:
-        logger.debug(f'{number=} {offset=}')
         number = number - offset
-        logger.debug(f'{number=}')
 
-    logger.debug(f'{number=} {scale=}')
-    number = number * scale
-    logger.debug(f'{number=}')
-
-    result = round(number, 2)
-    logger.debug(f'{result=}')
+    result = round(number * scale, 2)
+    if lookup:
+        return lookup.get(result, f'<unknown lookup: {result!r}>')
     return result
 
 
-def parse_number(*, data_hex: str, scale: int | float, offset: int = None, lookup: dict = None):
+def get_number_parser_name(*, registers: int, signed: bool, swapped: bool) -> str:
     """
-    >>> parse_number(data_hex='0938', scale=0.1)
-    236.0
-    >>> parse_number(data_hex='0002', scale=1, lookup={2: 'Normal', 3: 'Warning'})
-    'Normal'
+    >>> get_number_parser_name(registers=2, signed=False, swapped=True)
+    'uint32_swapped'
     """
-    assert len(data_hex) == 4, f'Wrong len {len(data_hex)}: {data_hex=}'
-    logger.debug(f'{data_hex=}')
-    number = hex2int(data_hex=data_hex, scale=scale, offset=offset)
+    name = f'{"int" if signed else "uint"}{registers * 16}'
+    if swapped and registers > 1:
+        name += '_swapped'
+    return name
+
+
+def make_number_parser(*, registers: int, signed: bool, swapped: bool) -> Callable:
+    """
+    Create a parser for a number over one or more 16-bit registers.
+    The byte order in a register is always big endian. "swapped" means the low word is in the first register.
+
+    >>> parse = make_number_parser(registers=1, signed=False, swapped=False)
+    >>> parse.__name__, parse(data=bytes.fromhex('ff9c'), scale=1)
+    ('uint16', 65436)
+    >>> make_number_parser(registers=1, signed=True, swapped=False)(data=bytes.fromhex('ff9c'), scale=0.1)
+    -10.0
+    >>> make_number_parser(registers=2, signed=False, swapped=True)(data=bytes.fromhex('002b0001'), scale=0.1)
+    6557.9
+    >>> make_number_parser(registers=2, signed=True, swapped=False)(data=bytes.fromhex('ffffff9c'), scale=1)
+    -100
+    """
+    number_format = NUMBER_FORMATS[registers]
+    if not signed:
+        number_format = number_format.upper()
+    name = get_number_parser_name(registers=registers, signed=signed, swapped=swapped)
+
+    if swapped and registers > 1:
+        unpack_words = get_words_struct(registers).unpack
+        sign_bit = 1 << (registers * 16 - 1)
+
+        def to_int(data: bytes) -> int:
+            number = 0
+            for word in reversed(unpack_words(data)):
+                number = (number << 16) | word
+            if signed and number & sign_bit:
+                number -= sign_bit << 1
+            return number
 
-    if lookup:
-        logger.debug(f'Use {lookup=}')
-        return lookup.get(number, f'<unknown lookup: {number!r}>')
     else:
-        return number
+        unpack = struct.Struct(f'>{number_format}').unpack
+
+        def to_int(data: bytes) -> int:
+            return unpack(data)[0]
+
+    def parse_number(*, data: bytes, scale, offset=None, lookup=None):
+        result = apply_scale(number=to_int(data), scale=scale, offset=offset, lookup=lookup)
+        if trace.enabled:
+            logger.debug('%s(data=%r, scale=%r, offset=%r) -> %r', name, data, scale, offset, result)
+        return result
+
+    parse_number.__name__ = parse_number.__qualname__ = name
+    return parse_number
+
+
+def parse_bitfield(*, data: bytes, scale=None, offset=None, lookup=None) -> str:
+    """
+    Returns the numbers of all set bits (Counted from the first register), or their names from the lookup.
+
+    >>> parse_bitfield(data=bytes.fromhex('0000'))
+    ''
+    >>> parse_bitfield(data=bytes.fromhex('80010002'))
+    '0, 15, 17'
+    >>> parse_bitfield(data=bytes.fromhex('00050000'), lookup={0: 'Fan failure', 2: 'Grid lost'})
+    'Fan failure, Grid lost'
+    """
+    bits = []
+    for index, word in enumerate(get_words_struct(len(data) // 2).unpack(data)):
+        bit = index * 16
+        while word:
+            if word & 1:
+                bits.append(bit)
+            word >>= 1
+            bit += 1
+    if lookup:
+        return ', '.join(str(lookup.get(bit, bit)) for bit in bits)
+    return ', '.join(str(bit) for bit in bits)
 
 
-def parse_swapped_number(*, data_hex: str, scale: int | float, offset: int = None, lookup: dict = None):
+DATETIME_STRUCT = struct.Struct('>6B')
+
+
+def parse_datetime(*, data: bytes, scale=None, offset=None, lookup=None) -> str:
     """
-    >>> parse_swapped_number(data_hex='002b0000', scale=0.1)
-    4.3
-    >>> parse_swapped_number(data_hex='01900000', scale=0.1)
-    40.0
-    >>> parse_swapped_number(data_hex='002b', scale=0.1)
-    4.3
+    Three registers with: year (since 2000) + month, day + hour, minute + second
+
+    >>> parse_datetime(data=bytes.fromhex('180c1f173b3a'))
+    '2024-12-31 23:59:58'
     """
-    assert not lookup
-    logger.debug(f'{data_hex=}')
+    year, month, day, hour, minute, second = DATETIME_STRUCT.unpack(data)
+    return datetime.datetime(2000 + year, month, day, hour, minute, second).isoformat(sep=' ')
 
-    length = len(data_hex)
-    if length == 8:
-        # '1234abcd' -> 'abcd1234'
-        data_hex = data_hex[-4:] + data_hex[:4]
-        logger.debug(f'Swap to: {data_hex=}')
-    elif length != 4:
-        AssertionError(f'Wrong len {length}: {data_hex=}')
-    return hex2int(data_hex=data_hex, scale=scale, offset=offset)
+
+def parse_string(*, data: bytes, scale=None, offset=None, lookup=None) -> str:
+    """
+    >>> parse_string(data=b'2107123456\\x00\\x00')
+    '2107123456'
+    """
+    return data.decode('ASCII', errors='replace').strip('\x00 ')
 
 
-def parse_string(*, data_hex: str, scale, offset, lookup):
-    return data_hex
+def parse_hex(*, data: bytes, scale=None, offset=None, lookup=None) -> str:
+    """
+    >>> parse_hex(data=bytes.fromhex('0114'))
+    '0114'
+    """
+    return data.hex()
 
 
-def parse_version_string(*, data_hex: str, scale=None, offset=None, lookup=None) -> Version:
+def parse_version_string(*, data: bytes, scale=None, offset=None, lookup=None) -> Version:
     """
-    >>> parse_version_string(data_hex='0114')
+    >>> parse_version_string(data=bytes.fromhex('0114'))
     <Version('0.1.1.4')>
     """
-    version = Version('.'.join(number for number in data_hex))
+    version = Version('.'.join(number for number in data.hex()))
     return version
 
 
-def debug_converter(*, data_hex: str, scale, offset, lookup):
-    print(f'Debug converter: {data_hex=} {scale=} {offset=} {lookup=}')
-    return f'<raw hex: {data_hex}>'
+def debug_converter(*, data: bytes, scale, offset, lookup):
+    print(f'Debug converter: {data=} {scale=} {offset=} {lookup=}')
+    return f'<raw hex: {data.hex()}>'
+
+
+PARSERS = {
+    parser.__name__: parser
+    for parser in (
+        *(
+            make_number_parser(registers=registers, signed=signed, swapped=swapped)
+            for registers in NUMBER_FORMATS
+            for signed in (True, False)
+            for swapped in ((False, True) if registers > 1 else (False,))
+        ),
+        parse_bitfield,
+        parse_datetime,
+        parse_string,
+        parse_hex,
+        parse_version_string,
+    )
+}
+
+
+# The "rule" of the definition yaml -> (signed, swapped) for numbers or the parser name:
+RULE2NUMBER = {
+    1: (False, True),  # unsigned
+    2: (True, True),  # signed
+    3: (False, True),  # unsigned
+    4: (True, True),  # signed
+}
+RULE2PARSER = {
+    5: 'parse_string',
+    6: 'parse_bitfield',
+    7: 'parse_version_string',
+    8: 'parse_datetime',
+}
+
+
+def get_parser(*, rule: int, registers: int) -> Callable:
+    """
+    Returns the parser for the "rule" and number of registers from the definition yaml.
+    Multi register numbers are stored with the low word first.
+
+    >>> get_parser(rule=1, registers=1).__name__
+    'uint16'
+    >>> get_parser(rule=2, registers=2).__name__
+    'int32_swapped'
+    >>> get_parser(rule=8, registers=3).__name__
+    'parse_datetime'
+    >>> get_parser(rule=1, registers=3)
+    Traceback (most recent call last):
+    ...
+    KeyError: 'No number parser for 3 registers'
+    """
+    if rule in RULE2NUMBER:
+        if registers not in NUMBER_FORMATS:
+            raise KeyError(f'No number parser for {registers} registers')
+        signed, swapped = RULE2NUMBER[rule]
+        name = get_number_parser_name(registers=registers, signed=signed, swapped=swapped)
+    else:
+        name = RULE2PARSER[rule]
+    return PARSERS[name]
@@ -0,0 +1,167 @@
+"""
+    Machine readable output of the inverter values for scripts, e.g.:
+
+        .../inverter-connect$ ./cli.py print-values --format jsonl | jq .
+
+    Every value is written as soon as it is read. This module doesn't use rich:
+    The records are serialized with msgspec and written directly to the output file.
+"""
+from __future__ import annotations
+
+import csv
+import logging
+import time
+from typing import TextIO
+
+import msgspec
+from packaging.version import Version
+
+from inverter.data_types import InverterValue, ValueType
+
+
+logger = logging.getLogger(__name__)
+
+
+OUTPUT_FORMAT_TABLE = 'table'
+OUTPUT_FORMAT_JSONL = 'jsonl'
+OUTPUT_FORMAT_JSON = 'json'
+OUTPUT_FORMAT_CSV = 'csv'
+OUTPUT_FORMATS = (OUTPUT_FORMAT_TABLE, OUTPUT_FORMAT_JSONL, OUTPUT_FORMAT_JSON, OUTPUT_FORMAT_CSV)
+
+
+class ValueRecord(msgspec.Struct, gc=False):
+    cycle: int  # Counter of the read cycle, starts with 1
+    timestamp: float  # Unix time when the value was read
+    name: str
+    value: float | int | str | None
+    unit: str
+    device_class: str
+    type: str  # "read out" or "computed"
+    register: int | None = None  # Start register of read out values
+    length: int | None = None  # Number of registers of read out values
+    raw: str | None = None  # Hex string of the register data of read out values
+
+
+RECORD_FIELDS = ValueRecord.__struct_fields__
+
+
+def value2record(value: InverterValue, *, cycle: int, timestamp: float | None = None) -> ValueRecord:
+    """
+    >>> from inverter.data_types import ValueMeta
+    >>> spec = ValueMeta(name='Total Power', device_class='power', state_class='measurement', unit='W')
+    >>> value2record(InverterValue(type=ValueType.COMPUTED, value=12.5, spec=spec), cycle=1, timestamp=0)
+    ValueRecord(cycle=1, timestamp=0, name='Total Power', value=12.5, unit='W', device_class='power', \
+type='computed', register=None, length=None, raw=None)
+    >>> value2record(InverterValue(type=ValueType.COMPUTED, value=Version('1.2'), spec=spec), cycle=1).value
+    '1.2'
+    """
+    record_value = value.value
+    if isinstance(record_value, Version):
+        record_value = str(record_value)
+
+    record = ValueRecord(
+        cycle=cycle,
+        timestamp=time.time() if timestamp is None else timestamp,
+        name=value.name,
+        value=record_value,
+        unit=value.unit,
+        device_class=value.device_class,
+        type=value.type.value,
+    )
+    if value.type == ValueType.READ_OUT and value.result is not None:
+        parameter = value.result.parameter
+        record.register = parameter.start_register
+        record.length = parameter.length
+        if value.result.response is not None:
+            record.raw = value.result.response.data_hex
+    return record
+
+
+class ValueWriter:
+    """
+    Base class: Write the values of one or more read cycles into a text file, e.g.: sys.stdout
+    """
+
+    def __init__(self, file: TextIO):
+        self.file = file
+        self.cycle = 0
+
+    def start_cycle(self) -> None:
+        self.cycle += 1
+
+    def write(self, value: InverterValue) -> None:
+        self.write_record(value2record(value, cycle=self.cycle))
+
+    def write_record(self, record: ValueRecord) -> None:
+        raise NotImplementedError
+
+    def end_cycle(self) -> None:
+        self.file.flush()
+
+
+class JsonLinesWriter(ValueWriter):
+    """
+    One JSON object per value and line.
+    """
+
+    def __init__(self, file: TextIO):
+        super().__init__(file)
+        self.encoder = msgspec.json.Encoder()
+
+    def write_record(self, record: ValueRecord) -> None:
+        self.file.write(self.encoder.encode(record).decode())
+        self.file.write('\n')
+        self.file.flush()  # Stream the value, e.g.: into a pipe
+
+
+class JsonWriter(JsonLinesWriter):
+    """
+    One JSON array with all values per cycle and line.
+    The values are still written as soon as they are read, the array is closed at the end of the cycle.
+    """
+
+    def start_cycle(self) -> None:
+        super().start_cycle()
+        self.count = 0
+        self.file.write('[')
+
+    def write_record(self, record: ValueRecord) -> None:
+        if self.count:
+            self.file.write(',')
+        self.count += 1
+        self.file.write(self.encoder.encode(record).decode())
+        self.file.flush()
+
+    def end_cycle(self) -> None:
+        self.file.write(']\n')
+        super().end_cycle()
+
+
+class CsvWriter(ValueWriter):
+    """
+    CSV with one header line and one row per value.
+    """
+
+    def __init__(self, file: TextIO):
+        super().__init__(file)
+        self.writer = csv.writer(file)
+        self.writer.writerow(RECORD_FIELDS)
+
+    def write_record(self, record: ValueRecord) -> None:
+        self.writer.writerow(['' if item is None else item for item in msgspec.structs.astuple(record)])
+        self.file.flush()
+
+
+FORMAT2WRITER = {
+    OUTPUT_FORMAT_JSONL: JsonLinesWriter,
+    OUTPUT_FORMAT_JSON: JsonWriter,
+    OUTPUT_FORMAT_CSV: CsvWriter,
+}
+
+
+def get_value_writer(output_format: str, file: TextIO) -> ValueWriter:
+    try:
+        writer_class = FORMAT2WRITER[output_format]
+    except KeyError:
+        raise ValueError(f'Unknown output format {output_format!r} (Possible formats: {", ".join(FORMAT2WRITER)})')
+    return writer_class(file)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+from collections.abc import Iterable
+
+from inverter.connection import InverterSock, parameter2modbus_at_command
+from inverter.constants import AT_WRITE_FUNC_NUMBER
+from inverter.data_types import ModbusResponse
+from inverter.exceptions import ModbusNoData, WriteVerificationError
+
+
+logger = logging.getLogger(__name__)
+
+
+WRITE_MAX_REGISTERS = 123  # Max. registers in one Modbus "write multiple registers" (0x10) frame
+READ_MAX_REGISTERS = 125  # Max. registers in one Modbus "read holding registers" (0x03) request
+
+
+@dataclasses.dataclass
+class WriteFrame:
+    start_register: int
+    values: list[int]
+
+    @property
+    def end_register(self) -> int:
+        """
+        >>> WriteFrame(start_register=0x16, values=[1, 2, 3]).end_register
+        24
+        """
+        return self.start_register + len(self.values) - 1
+
+    @property
+    def at_command(self) -> str:
+        """
+        >>> WriteFrame(start_register=0x16, values=[0x1706]).at_command
+        'INVDATA=12,011000160001000217068831'
+        """
+        return parameter2modbus_at_command(
+            start_register=self.start_register,
+            length=len(self.values),
+            modbus_function=AT_WRITE_FUNC_NUMBER,
+            values=self.values,
+        )
+
+
+def make_write_frames(registers: dict[int, int], max_registers: int = WRITE_MAX_REGISTERS) -> list[WriteFrame]:
+    """
+    Coalesce contiguous registers into a minimal number of write frames.
+
+    >>> make_write_frames({0x18: 3, 0x16: 1, 0x17: 2, 0x20: 4})
+    [WriteFrame(start_register=22, values=[1, 2, 3]), WriteFrame(start_register=32, values=[4])]
+    >>> make_write_frames({1: 1, 2: 2, 3: 3}, max_registers=2)
+    [WriteFrame(start_register=1, values=[1, 2]), WriteFrame(start_register=3, values=[3])]
+    """
+    frames = []
+    for register in sorted(registers):
+        value = registers[register]
+        if not 0 <= register <= 0xFFFF:
+            raise ValueError(f'Register {register!r} out of range')
+        if not 0 <= value <= 0xFFFF:
+            raise ValueError(f'Value {value!r} for register {hex(register)} out of range')
+
+        if frames and frames[-1].end_register + 1 == register and len(frames[-1].values) < max_registers:
+            frames[-1].values.append(value)
+        else:
+            frames.append(WriteFrame(start_register=register, values=[value]))
+    return frames
+
+
+def make_read_ranges(frames: Iterable[WriteFrame], max_registers: int = READ_MAX_REGISTERS) -> list[tuple[int, int]]:
+    """
+    Group the frames into as few read requests as possible (Returns start register + length).
+
+    >>> make_read_ranges(make_write_frames({0x16: 1, 0x17: 2, 0x20: 4}))
+    [(22, 11)]
+    >>> make_read_ranges(make_write_frames({1: 1, 200: 2}))
+    [(1, 1), (200, 1)]
+    """
+    ranges = []
+    for frame in frames:
+        if ranges:
+            start_register, _ = ranges[-1]
+            length = frame.end_register - start_register + 1
+            if length <= max_registers:
+                ranges[-1] = (start_register, length)
+                continue
+        ranges.append((frame.start_register, len(frame.values)))
+    return ranges
+
+
+def response2values(response: ModbusResponse) -> list[int]:
+    """
+    >>> response2values(ModbusResponse(slave_id=1, modbus_function=3, data=bytes.fromhex('1706000c')))
+    [5894, 12]
+    """
+    data = response.data
+    return [int.from_bytes(data[pos:pos + 2], 'big') for pos in range(0, len(data), 2)]
+
+
+@dataclasses.dataclass
+class WritePlan:
+    """
+    Write the given register values with as few round-trips as possible and verify them by reading back.
+    """
+
+    registers: dict[int, int]
+    skip_verify: frozenset[int] = frozenset()  # Registers that may change after the write, e.g.: clock seconds
+
+    def __post_init__(self):
+        self.frames = make_write_frames(self.registers)
+        self.verify_registers = [register for register in self.registers if register not in self.skip_verify]
+        self.verify_frames = [
+            frame
+            for frame in self.frames
+            if any(frame.start_register <= register <= frame.end_register for register in self.verify_registers)
+        ]
+        self.read_ranges = make_read_ranges(self.verify_frames)
+
+    def read_back(self, inv_sock: InverterSock) -> dict[int, int]:
+        values = {}
+        for start_register, length in self.read_ranges:
+            try:
+                response = inv_sock.read_once(start_register=start_register, length=length)
+            except ModbusNoData:
+                # Some registers between the frames can't be read: Read every frame on its own
+                logger.info('Read back %i registers from %s failed: Read every frame', length, hex(start_register))
+                for frame in self.verify_frames:
+                    if start_register <= frame.start_register < start_register + length:
+                        response = inv_sock.read(start_register=frame.start_register, length=len(frame.values))
+                        for offset, value in enumerate(response2values(response)):
+                            values[frame.start_register + offset] = value
+            else:
+                for offset, value in enumerate(response2values(response)):
+                    values[start_register + offset] = value
+        return values
+
+    def get_mismatches(self, values: dict[int, int]) -> dict[int, tuple[int, int | None]]:
+        """
+        >>> WritePlan({1: 10, 2: 20, 3: 30}, skip_verify=frozenset({3})).get_mismatches({1: 10, 2: 21, 3: 31})
+        {2: (20, 21)}
+        """
+        return {
+            register: (self.registers[register], values.get(register))
+            for register in self.verify_registers
+            if values.get(register) != self.registers[register]
+        }
+
+    def apply(self, inv_sock: InverterSock, *, verify: bool = True, dry_run: bool = False) -> None:
+        """
+        Send all frames and verify the written values with a batched read-back.
+        Raise WriteVerificationError if a register has not the written value.
+        """
+        if dry_run:
+            logger.info('Dry run: Skip sending %i frames', len(self.frames))
+            return
+
+        for frame in self.frames:
+            data = inv_sock.write(address=frame.start_register, values=frame.values)
+            logger.debug('Write response: %r', data)
+
+        if verify:
+            values = self.read_back(inv_sock)
+            if mismatches := self.get_mismatches(values):
+                raise WriteVerificationError(mismatches)
+            logger.info('%i written registers verified', len(self.verify_registers))